@@ -1,10 +1,14 @@
 # backend/api/routes/db_connect.py
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, BackgroundTasks, HTTPException
+from typing import Optional
+
 from pydantic import BaseModel, Field
 
 from backend.utils.logger import logger
 from backend.core.db.db_manager import connect_db, get_db_type
+from backend.core.db.schema_cache import warm_schema_cache
+from backend.core.db.result_cache import result_cache
 
 router = APIRouter()
 
@@ -19,6 +23,11 @@ class DBConnectRequest(BaseModel):
         ...,
         description="SQLAlchemy-compatible DB connection string"
     )
+    result_cache_ttl_seconds: Optional[int] = Field(
+        None,
+        ge=0,
+        description="How long cached query results stay valid for this session (0 = never cache)"
+    )
 
 
 # ============================================================
@@ -26,7 +35,7 @@ class DBConnectRequest(BaseModel):
 # ============================================================
 
 @router.post("/db/connect")
-async def connect_database(payload: DBConnectRequest):
+async def connect_database(payload: DBConnectRequest, background_tasks: BackgroundTasks):
     """
     🔌 Connect a database to a user session.
 
@@ -38,8 +47,9 @@ async def connect_database(payload: DBConnectRequest):
 
     IMPORTANT:
         - This does NOT run queries
-        - This does NOT inspect schema
         - This does NOT generate answers
+        - Schema is inspected in the BACKGROUND (after the response)
+          to warm the per-session schema cache
 
     This endpoint must be called BEFORE:
         - Any db_tool usage
@@ -57,17 +67,24 @@ async def connect_database(payload: DBConnectRequest):
             connection_string=payload.connection_string,
         )
 
-        # 2️⃣ Fetch detected DB type
+        # 2️⃣ Per-session result cache TTL (None → server default)
+        result_cache.set_session_ttl(payload.session_id, payload.result_cache_ttl_seconds)
+
+        # 3️⃣ Fetch detected DB type
         db_type = get_db_type(payload.session_id)
 
         logger.info(
             f"✅ DB connected successfully | session={payload.session_id} | db_type={db_type}"
         )
 
+        # 4️⃣ Warm schema cache without delaying the response
+        background_tasks.add_task(warm_schema_cache, payload.session_id)
+
         return {
             "message": "✅ Database connected successfully",
             "session_id": payload.session_id,
             "db_type": db_type,
+            "result_cache_ttl_seconds": result_cache.session_ttl(payload.session_id),
         }
 
     except Exception as e:
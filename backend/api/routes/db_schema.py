@@ -3,7 +3,7 @@
 from fastapi import APIRouter, HTTPException, Query
 
 from backend.utils.logger import logger
-from backend.core.db.schema_inspector import inspect_schema
+from backend.core.db.schema_cache import get_cached_schema
 from backend.core.db.db_manager import get_db_type
 
 router = APIRouter()
@@ -23,6 +23,7 @@ async def get_db_schema(
 
     SOURCE OF TRUTH:
         - backend.core.db.schema_inspector.inspect_schema
+          (served from backend.core.db.schema_cache on warm sessions)
 
     REQUIREMENTS:
         - Database must already be connected for this session
@@ -54,8 +55,8 @@ async def get_db_schema(
     try:
         logger.info(f"📊 DB schema request | session={session_id}")
 
-        # 🔹 Inspect schema using core logic
-        schema = inspect_schema(session_id)
+        # 🔹 Cached schema (same one used internally for NL → SQL)
+        schema = get_cached_schema(session_id)
 
         db_type = get_db_type(session_id)
 
@@ -0,0 +1,53 @@
+# backend/api/routes/metrics.py
+
+from fastapi import APIRouter
+
+from backend.core.llm.llm_registry import llm_registry
+from backend.core.llm.llm_cache import llm_cache
+from backend.core.agent.speculation import speculation_stats
+from backend.core.db.schema_cache import schema_cache_stats
+from backend.core.db.schema_selector import schema_selection_stats
+from backend.core.db.sql_cache import sql_cache
+from backend.core.db.result_cache import result_cache
+from backend.core.db.db_manager import db_pool_stats
+from backend.core.db.cost_guard import cost_guard_stats
+from backend.core.db.sql_repair import sql_repair_stats
+from backend.core.db.answer_templates import template_answer_stats
+from backend.core.db.sql_sandbox import sandbox_stats
+
+router = APIRouter()
+
+
+@router.get("/metrics")
+async def get_metrics():
+    """
+    📈 Runtime performance metrics (process-local).
+
+    SECTIONS:
+        - llm         → client construction time + first-token latency per client
+        - llm_cache   → persistent response cache hits / misses / evictions
+        - speculation → speculative tool work started / used / wasted (+ ratio)
+        - schema_cache → schema cache hits / fingerprint checks / full reloads
+        - schema_selection → tables pruned from NL → SQL prompts
+        - sql_cache   → NL → SQL cache exact / semantic hits
+        - result_cache → DB result cache hit ratio + bytes saved
+        - db_pool     → live engines, evictions, health checks, pooled connections
+        - cost_guard  → EXPLAIN checks, auto-limited / rejected queries
+        - sql_repair  → repair attempts / fixes / latency per stage
+        - db_answers  → template answers per result shape vs answer LLM calls
+        - sql_sandbox → sandboxed queries, workers killed per limit / restarted
+    """
+    return {
+        "llm": llm_registry.stats(),
+        "llm_cache": llm_cache.stats(),
+        "speculation": speculation_stats(),
+        "schema_cache": schema_cache_stats(),
+        "schema_selection": schema_selection_stats(),
+        "sql_cache": sql_cache.stats(),
+        "result_cache": result_cache.stats(),
+        "db_pool": db_pool_stats(),
+        "cost_guard": cost_guard_stats(),
+        "sql_repair": sql_repair_stats(),
+        "db_answers": template_answer_stats(),
+        "sql_sandbox": sandbox_stats(),
+    }
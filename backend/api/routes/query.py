@@ -1,18 +1,80 @@
 # backend/api/routes/query.py
 
-from fastapi import APIRouter, HTTPException
-from langchain_core.messages import HumanMessage
+import asyncio
+import json
+from typing import Any, AsyncIterator, Awaitable, Dict
+from uuid import uuid4
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from langchain_core.messages import HumanMessage, ToolMessage
 
 from backend.models.schemas import QueryRequest, QueryResponse
 from backend.core.agent.graph_builder import agentic_rag_graph
+from backend.core.agent.speculation import release_speculation
 from backend.utils.file_manager import list_files
 from backend.utils.logger import logger
 
 router = APIRouter()
 
+# How often to check whether the HTTP client is still connected (seconds)
+DISCONNECT_POLL_INTERVAL = 0.5
+
+
+# ============================================================
+# 🔌 Client-disconnect guard
+# ============================================================
+
+async def _run_until_disconnect(request: Request, work: Awaitable[Any]) -> Any:
+    """
+    Run `work` as a task and cancel it if the HTTP client goes away.
+
+    Cancellation propagates into the graph, aborting in-flight
+    LLM calls instead of letting them finish for nobody.
+    """
+    task = asyncio.ensure_future(work)
+
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=DISCONNECT_POLL_INTERVAL)
+            if done:
+                return task.result()
+
+            if await request.is_disconnected():
+                logger.warning("🔌 Client disconnected — cancelling query execution")
+                task.cancel()
+                raise HTTPException(status_code=499, detail="Client closed request.")
+    finally:
+        if not task.done():
+            task.cancel()
+
+
+# ============================================================
+# 🧱 Initial AgentState
+# ============================================================
+
+def _build_initial_state(session_id: str, query_text: str) -> Dict[str, Any]:
+    """
+    Discover session context (uploaded docs) and build the initial AgentState.
+    """
+    try:
+        docs = list_files(session_id)
+    except Exception:
+        docs = []
+
+    logger.info(
+        f"📄 Session context | session={session_id} | docs={docs}"
+    )
+
+    return {
+        "session_id": session_id,
+        "docs": docs,  # may be empty → OK
+        "messages": [HumanMessage(content=query_text)],
+    }
+
 
 @router.post("/query", response_model=QueryResponse)
-async def handle_user_query(query_data: QueryRequest):
+async def handle_user_query(query_data: QueryRequest, request: Request):
     """
     Unified Agentic Query Endpoint
 
@@ -25,8 +87,11 @@ async def handle_user_query(query_data: QueryRequest):
       1) Discover session context (uploaded docs)
       2) Build initial AgentState
       3) Run agentic LangGraph (assistant → tool → finalize)
+         (cancelled if the client disconnects)
       4) Return normalized QueryResponse
     """
+    # Scopes speculative tool work to this request (released in `finally`)
+    request_id = uuid4().hex
 
     try:
         # --------------------------------------------------
@@ -43,30 +108,25 @@ async def handle_user_query(query_data: QueryRequest):
         )
 
         # --------------------------------------------------
-        # 2️⃣ Discover uploaded documents (RAG context)
-        # --------------------------------------------------
-        try:
-            docs = list_files(session_id)
-        except Exception:
-            docs = []
-
-        logger.info(
-            f"📄 Session context | session={session_id} | docs={docs}"
-        )
-
-        # --------------------------------------------------
-        # 3️⃣ Build initial AgentState
+        # 2️⃣ + 3️⃣ Discover uploaded docs + build AgentState
         # --------------------------------------------------
-        initial_state = {
-            "session_id": session_id,
-            "docs": docs,  # may be empty → OK
-            "messages": [HumanMessage(content=query_text)],
-        }
+        initial_state = _build_initial_state(session_id, query_text)
 
         # --------------------------------------------------
         # 4️⃣ Execute agentic graph
         # --------------------------------------------------
-        final_state = await agentic_rag_graph.ainvoke(initial_state)
+        final_state = await _run_until_disconnect(
+            request,
+            agentic_rag_graph.ainvoke(
+                initial_state,
+                config={
+                    "configurable": {
+                        "bypass_result_cache": query_data.bypass_cache,
+                        "request_id": request_id,
+                    }
+                },
+            ),
+        )
 
         # --------------------------------------------------
         # 5️⃣ Extract final_output (single source of truth)
@@ -101,4 +161,150 @@ async def handle_user_query(query_data: QueryRequest):
 
     except Exception as e:
         logger.exception("❌ Error processing /query request")
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+    finally:
+        release_speculation(request_id)
+
+
+# ============================================================
+# 📡 Streaming (Server-Sent Events)
+# ============================================================
+
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    """Format one Server-Sent Event frame."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+def _progress_events(node_name: str, update: Dict[str, Any]):
+    """
+    Translate a LangGraph node update into user-facing progress events.
+
+      assistant → "routing"    (tool chosen or NO_TOOL_REQUIRED)
+      tool      → "retrieval"  (rag_tool) | "sql" (db_tool)
+      finalize  → "final"      (answer + citations)
+    """
+    if node_name == "assistant":
+        last_msg = update["messages"][-1]
+        tool_calls = getattr(last_msg, "tool_calls", None) or []
+        decision = tool_calls[0]["name"] if tool_calls else "NO_TOOL_REQUIRED"
+        yield _sse("routing", {"decision": decision})
+
+    elif node_name == "tool":
+        for msg in update.get("messages", []):
+            if not isinstance(msg, ToolMessage):
+                continue
+            try:
+                payload = json.loads(msg.content) if isinstance(msg.content, str) else msg.content
+            except ValueError:
+                payload = {}
+
+            if msg.name == "rag_tool":
+                yield _sse("retrieval", {
+                    "chunks": len(payload.get("chunks", [])),
+                    "citations": len(payload.get("citations", [])),
+                })
+            elif msg.name == "db_tool":
+                yield _sse("sql", {
+                    "sql": payload.get("sql"),
+                    "db_type": payload.get("db_type"),
+                    "tables_used": payload.get("tables_used", []),
+                    "row_count": payload.get("row_count", 0),
+                    "error": payload.get("error"),
+                })
+
+    elif node_name == "finalize":
+        final_output = update.get("final_output") or {}
+        yield _sse("final", {
+            "mode": final_output.get("mode"),
+            "query": final_output.get("query"),
+            "response": final_output.get("response"),
+            "model": final_output.get("model"),
+            "used_chunks": final_output.get("used_chunks", 0),
+            "citations": final_output.get("citations", []),
+            "formatted_citations": final_output.get(
+                "formatted_citations",
+                "No citations available.",
+            ),
+        })
+
+
+async def _stream_query_events(
+    initial_state: Dict[str, Any],
+    bypass_cache: bool = False,
+) -> AsyncIterator[str]:
+    """
+    Run the agentic graph with `astream` and yield SSE frames:
+      - progress events from node updates
+      - "token" events from finalize_node (custom stream)
+      - "final" event with citations (session memory already updated)
+    """
+    session_id = initial_state["session_id"]
+    request_id = uuid4().hex
+
+    try:
+        async for mode, chunk in agentic_rag_graph.astream(
+            initial_state,
+            config={
+                "configurable": {
+                    "stream_tokens": True,
+                    "bypass_result_cache": bypass_cache,
+                    "request_id": request_id,
+                }
+            },
+            stream_mode=["updates", "custom"],
+        ):
+            if mode == "custom":
+                if chunk.get("type") == "token":
+                    yield _sse("token", {"content": chunk["content"]})
+                continue
+
+            for node_name, update in chunk.items():
+                for frame in _progress_events(node_name, update or {}):
+                    yield frame
+
+        logger.info(f"✅ Streamed query resolved | session={session_id}")
+
+    except asyncio.CancelledError:
+        logger.warning(f"🔌 Client disconnected during stream | session={session_id}")
+        raise
+
+    except Exception as e:
+        logger.exception("❌ Error processing /query/stream request")
+        yield _sse("error", {"detail": str(e)})
+
+    finally:
+        release_speculation(request_id)
+
+
+@router.post("/query/stream")
+async def stream_user_query(query_data: QueryRequest):
+    """
+    Streaming variant of /query (Server-Sent Events).
+
+    Event sequence:
+      routing   → assistant_node decision
+      retrieval → rag_tool finished (chunk count)      [RAG only]
+      sql       → db_tool finished (SQL + row count)   [DB only]
+      token*    → answer tokens from finalize_node
+      final     → full answer + citations
+      error     → emitted instead of `final` on failure
+
+    Session memory is updated by finalize_node once generation completes,
+    exactly like the non-streaming endpoint.
+    """
+    query_text = query_data.query.strip()
+    if not query_text:
+        raise HTTPException(status_code=400, detail="Query cannot be empty.")
+
+    logger.info(
+        f"📡 /query/stream received | session={query_data.session_id} | query='{query_text}'"
+    )
+
+    initial_state = _build_initial_state(query_data.session_id, query_text)
+
+    return StreamingResponse(
+        _stream_query_events(initial_state, bypass_cache=query_data.bypass_cache),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
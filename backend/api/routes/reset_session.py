@@ -6,6 +6,8 @@ from backend.utils.logger import logger
 from backend.utils.file_manager import clear_session_data, session_exists
 from backend.core.memory.session_memory import clear_session_memory
 from backend.core.db.db_manager import disconnect_db
+from backend.core.db.schema_cache import invalidate_schema_cache
+from backend.core.db.result_cache import result_cache
 
 router = APIRouter()
 
@@ -39,6 +41,8 @@ async def reset_session(session_id: str = Query(..., description="Session ID to
         # 3️⃣ Disconnect DB for this session (if connected)
         # --------------------------------------------------
         disconnect_db(session_id)
+        invalidate_schema_cache(session_id)
+        result_cache.clear_session(session_id)
         logger.info("🗄️ Session DB disconnected (if existed).")
 
         # --------------------------------------------------
@@ -15,10 +15,18 @@ Pipeline:
 
 The graph always ends in finalize_node, which returns
 state["final_output"] — consumed by FastAPI /query route.
+
+Speculative mode (opt-in, SPECULATIVE_TOOL_EXECUTION):
+    assistant_node is wrapped so that vector retrieval (and optionally
+    schema loading) starts IN PARALLEL with the routing LLM call.
+    The chosen tool reuses that work; the rest is discarded.
 """
 
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import StateGraph, END
 
+from backend.utils.config import SPECULATIVE_TOOL_EXECUTION, SPECULATIVE_SCHEMA_LOADING
+
 # --- State model ---
 from backend.core.agent.graph_state import AgentState
 
@@ -27,15 +35,65 @@ from backend.core.agent.nodes.assistant_node import assistant_node
 from backend.core.agent.nodes.tool_node import tool_node
 from backend.core.agent.nodes.finalize_node import finalize_node
 
+# --- Speculation ---
+from backend.core.agent.speculation import start_speculation, resolve_speculation
+
+
+# =====================================================================
+# 🏎️ SPECULATIVE ASSISTANT NODE
+# =====================================================================
+
+async def speculative_assistant_node(state: AgentState, config: RunnableConfig):
+    """
+    assistant_node + speculative tool prefetch.
+
+    1) Start retrieval / schema loading in background threads
+    2) Await the routing LLM (assistant_node) meanwhile
+    3) Keep the speculation matching the chosen tool, discard the rest
+
+    Speculation is scoped to config["configurable"]["request_id"]; without
+    one (nothing would release it) this is plain assistant_node.
+    """
+    request_id = config.get("configurable", {}).get("request_id")
+    if request_id is None:
+        return await assistant_node(state, config)
+
+    session_id = state["session_id"]
+    query = state["messages"][-1].content
+
+    start_speculation(
+        request_id,
+        session_id,
+        query,
+        docs=state.get("docs"),
+        include_schema=SPECULATIVE_SCHEMA_LOADING,
+    )
+
+    try:
+        result = await assistant_node(state, config)
+    except BaseException:
+        resolve_speculation(request_id, chosen_tool=None)
+        raise
+
+    tool_calls = getattr(result["messages"][-1], "tool_calls", None) or []
+    chosen_tool = tool_calls[0]["name"] if tool_calls else None
+    resolve_speculation(request_id, chosen_tool)
+
+    return result
+
 
 # =====================================================================
 # 🔨 GRAPH BUILDER FUNCTION
 # =====================================================================
 
-def build_agentic_rag_graph():
+def build_agentic_rag_graph(speculative: bool = SPECULATIVE_TOOL_EXECUTION):
     """
     Creates and compiles the Agentic RAG LangGraph workflow.
 
+    Args:
+        speculative (bool): start tool work in parallel with routing
+                            (see speculative_assistant_node)
+
     Returns:
         graph (CompiledGraph): the fully compiled graph instance
                                with support for both async + sync.
@@ -45,7 +103,10 @@ def build_agentic_rag_graph():
     workflow = StateGraph(AgentState)
 
     # 2️⃣ Register all nodes
-    workflow.add_node("assistant", assistant_node)
+    workflow.add_node(
+        "assistant",
+        speculative_assistant_node if speculative else assistant_node,
+    )
     workflow.add_node("tool", tool_node)               # prebuilt ToolNode executes rag_tool
     workflow.add_node("finalize", finalize_node)
 
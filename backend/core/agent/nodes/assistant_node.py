@@ -6,7 +6,7 @@ from langchain_core.runnables import RunnableConfig
 from backend.core.agent.graph_state import AgentState
 from backend.core.agent.tools.rag_tool import rag_tool
 from backend.core.agent.tools.db_tool import db_tool
-from backend.core.llm.llm_engine import get_llm
+from backend.core.llm.llm_registry import llm_registry
 from backend.utils.logger import logger
 
 
@@ -119,6 +119,20 @@ Do NOT output anything else.
 """
 
 
+# ============================================================
+# 🧰 ROUTER LLM (tools bound ONCE per process)
+# ============================================================
+
+def get_router_llm():
+    """
+    Return the routing LLM with rag_tool + db_tool already bound.
+    The binding is built once by the LLM registry and reused.
+    """
+    return llm_registry.get_bound_client(
+        "gemini-2.5-flash", 0.4, [rag_tool, db_tool]
+    )
+
+
 # ============================================================
 # 🤖 ASSISTANT NODE
 # ============================================================
@@ -141,11 +155,8 @@ async def assistant_node(state: AgentState, config: RunnableConfig):
         f"🧭 Assistant node | session={session_id} | query='{user_msg.content}'"
     )
 
-    # 1️⃣ Load base LLM
-    llm = get_llm()
-
-    # 2️⃣ Bind both tools
-    llm_with_tools = llm.bind_tools([rag_tool, db_tool])
+    # 1️⃣ + 2️⃣ Shared LLM with both tools already bound
+    llm_with_tools = get_router_llm()
 
     # 3️⃣ Latest user message
     user_msg = user_msg
@@ -162,6 +173,7 @@ async def assistant_node(state: AgentState, config: RunnableConfig):
     system_prompt = (
         ASSISTANT_SYSTEM_PROMPT
         + "\n\nSESSION METADATA:\n"
+        + f"session_id: {session_id}\n"
         + docs_text
     )
 
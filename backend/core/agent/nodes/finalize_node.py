@@ -1,15 +1,17 @@
 # backend/core/agent/nodes/finalize_node.py
 
 import json
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Optional
 
 from langchain_core.messages import AIMessage, ToolMessage
+from langchain_core.runnables import RunnableConfig
+from langgraph.config import get_stream_writer
 
 from backend.core.agent.graph_state import AgentState
 from backend.utils.logger import logger
 
 # LLM generation paths
-from backend.core.llm.llm_engine import generate_general_answer
+from backend.core.llm.llm_engine import agenerate_general_answer
 from backend.core.rag.rag_pipeline import run_rag_generation
 from backend.core.db.db_executor import run_db_generation
 
@@ -17,7 +19,21 @@ from backend.core.db.db_executor import run_db_generation
 from backend.core.memory.session_memory import add_to_session_memory, get_session_memory
 
 
-async def finalize_node(state: AgentState) -> AgentState:
+def _get_token_emitter(config: Optional[RunnableConfig]) -> Optional[Callable[[str], None]]:
+    """
+    Return a callback that pushes answer tokens into the LangGraph
+    "custom" stream — only when the caller asked for token streaming
+    (config["configurable"]["stream_tokens"] = True, set by /query/stream).
+    """
+    configurable = (config or {}).get("configurable", {})
+    if not configurable.get("stream_tokens"):
+        return None
+
+    writer = get_stream_writer()
+    return lambda token: writer({"type": "token", "content": token})
+
+
+async def finalize_node(state: AgentState, config: RunnableConfig = None) -> AgentState:
     """
     FINAL NODE of the agent graph.
 
@@ -53,6 +69,7 @@ async def finalize_node(state: AgentState) -> AgentState:
     - This node DOES NOT retrieve documents
     - This node DOES NOT execute SQL
     - This node ONLY orchestrates final answer generation
+    - When streaming, answer tokens are emitted as they are generated
     """
 
 
@@ -62,6 +79,9 @@ async def finalize_node(state: AgentState) -> AgentState:
 
     logger.info(f"🏁 Finalize node triggered | session={session_id}")
 
+    # Token streaming hook (None for the regular /query path)
+    on_token = _get_token_emitter(config)
+
     # ============================================================
     # 1️⃣ CASE: NO TOOL → GENERAL ANSWER
     #    last_msg is AIMessage("NO_TOOL_REQUIRED")
@@ -98,10 +118,11 @@ async def finalize_node(state: AgentState) -> AgentState:
             if memory_for_context else None
         )
 
-        # (C) Generate general answer using LLM
-        llm_result = generate_general_answer(
+        # (C) Generate general answer using LLM (async, non-blocking)
+        llm_result = await agenerate_general_answer(
             query=user_query,
             memory_text=memory_text,
+            on_token=on_token,
         )
 
         # (D) Save assistant response to memory
@@ -187,6 +208,7 @@ async def finalize_node(state: AgentState) -> AgentState:
                 query=query,
                 chunks=chunks,
                 citations=citations,
+                on_token=on_token,
             )
 
             rag_output["mode"] = "rag"
@@ -215,6 +237,7 @@ async def finalize_node(state: AgentState) -> AgentState:
             db_output = await run_db_generation(
                 session_id=session_id,
                 tool_payload=tool_payload,
+                on_token=on_token,
             )
 
             db_output["mode"] = "db"
@@ -0,0 +1,185 @@
+# backend/core/agent/speculation.py
+
+"""
+Speculative tool execution (opt-in).
+
+While assistant_node waits for the routing LLM, we already start the work
+the most likely tools will need:
+
+    rag    → query embedding + Qdrant top-k retrieval
+    schema → DB schema loading (only if SPECULATIVE_SCHEMA_LOADING)
+
+If the router picks the matching tool, the tool CLAIMS the finished (or
+still running) result instead of recomputing it. Otherwise the speculative
+task is cancelled/discarded and counted as wasted work.
+
+Speculations belong to ONE request (config["configurable"]["request_id"]):
+overlapping requests of a session never see each other's work, and
+whatever a request left unclaimed is cancelled by release_speculation()
+when it ends.
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend.utils.logger import logger
+from backend.core.rag.retriever import retrieve_top_k_chunks
+from backend.core.db.db_manager import is_db_connected
+from backend.core.db.schema_cache import get_cached_schema
+
+
+# Tool name (chosen by the router) → speculation kind
+TOOL_TO_KIND: Dict[str, str] = {
+    "rag_tool": "rag",
+    "db_tool": "schema",
+}
+
+# Must match rag_tool's default top_k
+SPECULATIVE_TOP_K = 5
+
+
+# (kind, request_id) → (session_id, normalized query, top_k, task)
+_PENDING: Dict[Tuple[str, str], Tuple[str, str, int, asyncio.Task]] = {}
+
+_METRICS: Dict[str, int] = {
+    "started": 0,
+    "used": 0,
+    "wasted": 0,
+}
+
+
+def _normalize(query: str) -> str:
+    return " ".join(query.lower().split())
+
+
+def _drop(key: Tuple[str, str]) -> None:
+    """Cancel + forget a pending speculation and count it as wasted."""
+    entry = _PENDING.pop(key, None)
+    if entry is None:
+        return
+
+    session_id, _, _, task = entry
+    if task.done() and not task.cancelled():
+        task.exception()  # consume result so failures are not reported as unhandled
+    task.cancel()
+    _METRICS["wasted"] += 1
+    logger.info(f"🗑️ Speculation discarded | kind={key[0]} | session={session_id} | request={key[1]}")
+
+
+# ============================================================
+# 🚀 START
+# ============================================================
+
+def start_speculation(
+    request_id: str,
+    session_id: str,
+    query: str,
+    docs: Optional[List[str]],
+    include_schema: bool = False,
+) -> List[str]:
+    """
+    Kick off speculative work in background threads.
+    Returns the list of speculation kinds started.
+    """
+    started: List[str] = []
+    normalized = _normalize(query)
+
+    if docs:
+        key = ("rag", request_id)
+        _drop(key)
+        task = asyncio.create_task(
+            asyncio.to_thread(retrieve_top_k_chunks, session_id, query, SPECULATIVE_TOP_K)
+        )
+        _PENDING[key] = (session_id, normalized, SPECULATIVE_TOP_K, task)
+        started.append("rag")
+
+    if include_schema and is_db_connected(session_id):
+        key = ("schema", request_id)
+        _drop(key)
+        task = asyncio.create_task(asyncio.to_thread(get_cached_schema, session_id))
+        _PENDING[key] = (session_id, normalized, 0, task)
+        started.append("schema")
+
+    _METRICS["started"] += len(started)
+
+    if started:
+        logger.info(f"🏎️ Speculation started | session={session_id} | kinds={started}")
+
+    return started
+
+
+# ============================================================
+# ✅ CLAIM (called by the tool that the router picked)
+# ============================================================
+
+async def claim_speculative_result(
+    kind: str,
+    request_id: Optional[str],
+    session_id: str,
+    query: str,
+    top_k: int = 0,
+) -> Optional[Any]:
+    """
+    Return the speculative result for (kind, request_id) if it was started
+    for the same session and query (and top_k), else None.
+
+    A failed speculative task also returns None → caller recomputes.
+    """
+    if request_id is None:
+        return None
+
+    key = (kind, request_id)
+    entry = _PENDING.get(key)
+    if entry is None:
+        return None
+
+    spec_session_id, normalized, spec_top_k, task = entry
+    if spec_session_id != session_id or normalized != _normalize(query) or spec_top_k != top_k:
+        _drop(key)
+        return None
+
+    _PENDING.pop(key, None)
+
+    try:
+        result = await task
+    except Exception as e:
+        logger.warning(f"⚠️ Speculative {kind} failed, recomputing: {e}")
+        _METRICS["wasted"] += 1
+        return None
+
+    _METRICS["used"] += 1
+    logger.info(f"🎯 Speculation used | kind={kind} | session={session_id}")
+    return result
+
+
+# ============================================================
+# 🧹 RESOLVE (after the router decided)
+# ============================================================
+
+def resolve_speculation(request_id: str, chosen_tool: Optional[str]) -> None:
+    """
+    Keep the speculation matching the chosen tool, discard the rest.
+    """
+    keep = TOOL_TO_KIND.get(chosen_tool) if chosen_tool else None
+
+    for kind in set(TOOL_TO_KIND.values()):
+        if kind != keep:
+            _drop((kind, request_id))
+
+
+def release_speculation(request_id: str) -> None:
+    """
+    Request finished (answered, failed or client gone): cancel and forget
+    whatever it started but never claimed.
+    """
+    for kind in set(TOOL_TO_KIND.values()):
+        _drop((kind, request_id))
+
+
+def speculation_stats() -> Dict[str, Any]:
+    started = _METRICS["started"]
+    return {
+        **_METRICS,
+        "pending": len(_PENDING),
+        "wasted_ratio": round(_METRICS["wasted"] / started, 4) if started else 0.0,
+    }
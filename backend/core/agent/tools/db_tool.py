@@ -1,11 +1,12 @@
 # backend/core/agent/tools/db_tool.py
 
+from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import tool
 from backend.core.db.db_executor import run_db_execution
 
 
 @tool
-async def db_tool(session_id: str, query: str):
+async def db_tool(session_id: str, query: str, config: RunnableConfig):
     """
     DATABASE QUERY TOOL — Structured Data Retrieval (NO LLM RESPONSE)
 
@@ -66,7 +67,29 @@ async def db_tool(session_id: str, query: str):
                 ...
             ],
             "row_count": <int>,
-            "confidence": "<low | high>"
+            "truncated": <bool>,          # row / byte cap reached
+            "total_count": <int | null>,  # null → truncated and not counted
+            "confidence": "<low | high>",
+            "plan_estimate": {            # EXPLAIN cost guard (if supported)
+                "cost": <float | null>,
+                "rows": <int | null>,
+                "full_scans": <int>,
+                "decision": "<ok | limited>"
+            },
+            "repairs": [                  # only when the SQL needed repair
+                {"stage": "<transpile | schema | llm>", "sql": "...", "error": "...",
+                 "ok": <bool>, "propose_ms": <float>, "execute_ms": <float>}
+            ],
+            "error": {                    # only when execution failed
+                "type": "<timeout | too_expensive | resource_limit | invalid_sql | execution_error>",
+                "message": "<reason>",
+                "timeout_seconds": <float>,   # timeout
+                "estimated_cost": <float>,    # too_expensive
+                "max_cost": <float>,          # too_expensive
+                "limit": "<memory | cpu | wall | cancelled | crash>",  # resource_limit
+                "unknown_tables": [...],      # invalid_sql
+                "unknown_columns": [...]      # invalid_sql
+            }
         }
 
     IMPORTANT NOTES FOR THE ASSISTANT:
@@ -77,6 +100,15 @@ async def db_tool(session_id: str, query: str):
         - Final explanation will be handled by a separate LLM step
     """
 
-    result = await run_db_execution(session_id=session_id, query=query)
+    # Injected by LangGraph (not part of the tool schema the LLM sees)
+    bypass_cache = config.get("configurable", {}).get("bypass_result_cache", False)
+    request_id = config.get("configurable", {}).get("request_id")
+
+    result = await run_db_execution(
+        session_id=session_id,
+        query=query,
+        use_result_cache=not bypass_cache,
+        request_id=request_id,
+    )
 
     return result
\ No newline at end of file
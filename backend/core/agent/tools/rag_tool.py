@@ -1,11 +1,12 @@
 # backend/core/agent/tools/rag_tool.py
 
+from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import tool
 from backend.core.rag.rag_pipeline import run_rag_retrieval
 
 
 @tool
-async def rag_tool(session_id: str, query: str, top_k: int = 5):
+async def rag_tool(session_id: str, query: str, config: RunnableConfig, top_k: int = 5):
     """
     DOCUMENT RETRIEVAL TOOL — Call this tool whenever the user's query
     requires information contained inside the uploaded documents.
@@ -49,7 +50,10 @@ async def rag_tool(session_id: str, query: str, top_k: int = 5):
             }
     """
 
+    # Injected by LangGraph (not part of the tool schema the LLM sees)
+    request_id = config.get("configurable", {}).get("request_id")
+
     # Call retrieval-only part of the pipeline (NO LLM here)
-    result = await run_rag_retrieval(session_id, query, top_k)
+    result = await run_rag_retrieval(session_id, query, top_k, request_id=request_id)
 
     return result
\ No newline at end of file
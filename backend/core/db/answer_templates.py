@@ -0,0 +1,135 @@
+# backend/core/db/answer_templates.py
+
+import re
+from typing import Any, Dict, List, Optional
+
+from backend.utils.logger import logger
+from backend.utils.config import (
+    DB_TEMPLATE_ANSWERS,
+    DB_TEMPLATE_MAX_COLUMNS,
+    DB_TEMPLATE_MAX_LIST_ROWS,
+)
+
+
+# ============================================================
+# 🧾 TEMPLATE ANSWERS (trivial result shapes → no LLM call)
+# ============================================================
+#
+# "How many orders are there?" returns one number; a Gemini round-trip
+# to phrase it doubles the latency. Trivial shapes are answered from
+# templates, everything else still goes to the answer LLM:
+#
+#   - empty   → 0 rows
+#   - scalar  → 1 row × 1 column
+#   - record  → 1 row × ≤ DB_TEMPLATE_MAX_COLUMNS columns
+#   - pairs   → ≤ DB_TEMPLATE_MAX_LIST_ROWS rows × 2 columns
+#
+# Errors, truncated / auto-limited results and blocked queries always
+# use the LLM (they need an explanation, not just the numbers).
+
+_STATS: Dict[str, int] = {"empty": 0, "scalar": 0, "record": 0, "pairs": 0, "llm": 0}
+
+_NON_WORD = re.compile(r"[^0-9a-zA-Z]+")
+_CAMEL = re.compile(r"(?<=[a-z])(?=[A-Z])")
+
+# Columns whose numbers are labels, not quantities: 2024 must not read "2,024"
+_IDENTIFIER_WORDS = {"id", "ids", "uuid", "year", "code", "zip", "zipcode", "postcode", "phone", "sku", "number"}
+
+
+def _label(column: str) -> str:
+    """row_count → "Row count", COUNT(*) → "Count", customerId → "Customer id"."""
+    words = _NON_WORD.sub(" ", _CAMEL.sub(" ", column)).strip()
+    return words[:1].upper() + words[1:].lower() if words else column
+
+
+def _is_identifier(column: str) -> bool:
+    """customer_id, customerId, order_year, zip → True; total_spent, COUNT(*) → False."""
+    words = _NON_WORD.sub(" ", _CAMEL.sub(" ", column)).lower().split()
+    return bool(words) and words[-1] in _IDENTIFIER_WORDS
+
+
+def _format(value: Any, grouped: bool = True) -> str:
+    """Thousands separators only for measures; keys / ids / years stay as stored."""
+    if value is None:
+        return "no value"
+    if isinstance(value, bool):
+        return "yes" if value else "no"
+    if isinstance(value, int):
+        return f"{value:,}" if grouped else str(value)
+    if isinstance(value, float):
+        if not grouped:
+            return str(int(value)) if value.is_integer() else str(value)
+        return f"{value:,.0f}" if value.is_integer() else f"{value:,.2f}"
+    return str(value)
+
+
+def _format_cell(column: str, value: Any) -> str:
+    return _format(value, grouped=not _is_identifier(column))
+
+
+def _shape(rows: List[Dict[str, Any]]) -> Optional[str]:
+    if not rows:
+        return "empty"
+
+    columns = len(rows[0])
+    if len(rows) == 1 and columns == 1:
+        return "scalar"
+    if len(rows) == 1 and columns <= DB_TEMPLATE_MAX_COLUMNS:
+        return "record"
+    if columns == 2 and len(rows) <= DB_TEMPLATE_MAX_LIST_ROWS:
+        return "pairs"
+    return None
+
+
+def _render(shape: str, rows: List[Dict[str, Any]]) -> str:
+    if shape == "empty":
+        return "No matching records were found for your question."
+
+    if shape == "scalar":
+        column, value = next(iter(rows[0].items()))
+        return f"The {_label(column).lower()} is **{_format_cell(column, value)}**."
+
+    if shape == "record":
+        lines = [f"- **{_label(c)}**: {_format_cell(c, v)}" for c, v in rows[0].items()]
+        return "Here is the matching record:\n\n" + "\n".join(lines)
+
+    # The key column labels each line (a year, a category), never a quantity
+    key, value = list(rows[0].keys())
+    lines = [f"- **{_format(row[key], grouped=False)}**: {_format_cell(value, row[value])}" for row in rows]
+    return (
+        f"The query returned {len(rows)} rows ({_label(key).lower()} → {_label(value).lower()}):\n\n"
+        + "\n".join(lines)
+    )
+
+
+def render_template_answer(tool_payload: Dict[str, Any], rows: List[Dict[str, Any]]) -> Optional[str]:
+    """
+    Deterministic answer for a trivial DB result, or None when the answer
+    LLM should explain it (complex shape, error, partial result, disabled).
+    """
+    shape = None
+    if (
+        DB_TEMPLATE_ANSWERS
+        and tool_payload.get("sql")
+        and not tool_payload.get("error")
+        and not tool_payload.get("truncated")
+    ):
+        shape = _shape(rows)
+
+    if shape is None:
+        _STATS["llm"] += 1
+        return None
+
+    _STATS[shape] += 1
+    logger.info(f"🧾 Template DB answer | shape={shape} | rows={len(rows)}")
+    return _render(shape, rows)
+
+
+def template_answer_stats() -> Dict[str, Any]:
+    templated = sum(v for k, v in _STATS.items() if k != "llm")
+    total = templated + _STATS["llm"]
+    return {
+        **_STATS,
+        "enabled": DB_TEMPLATE_ANSWERS,
+        "template_ratio": round(templated / total, 4) if total else 0.0,
+    }
@@ -0,0 +1,247 @@
+# backend/core/db/cost_guard.py
+
+import json
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from backend.utils.logger import logger
+from backend.utils.config import (
+    SQL_COST_GUARD_MODE,
+    SQL_COST_GUARD_MAX_COST,
+    SQL_COST_GUARD_LIMIT_ROWS,
+    SQL_PLAN_LOG_ENABLED,
+    SQL_PLAN_LOG_PATH,
+    SQL_PLAN_LOG_MAX_BYTES,
+    SQL_PLAN_LOG_QUESTIONS,
+)
+from backend.core.db.db_types import DB_DIALECTS
+
+
+# ============================================================
+# 💸 EXPLAIN-BASED COST GUARD (before generated SQL runs)
+# ============================================================
+#
+# The planner's estimate is one cheap round-trip; a runaway join is hours.
+#
+#   estimate: {"cost": float | None, "rows": int | None,
+#              "full_scans": int, "plan": [node summaries]}
+#
+#   - cost  → planner total cost of the (LIMIT-ed) query   [enforced]
+#   - rows  → largest estimated intermediate row count     [recorded]
+#   - SQLite exposes no estimates: its plans are recorded only.
+
+class QueryTooExpensiveError(RuntimeError):
+    """Raised when the planner estimate exceeds the cost budget."""
+
+    def __init__(self, estimate: Dict[str, Any], max_cost: float):
+        super().__init__(
+            f"Estimated query cost {estimate['cost']:,.0f} exceeds the limit of {max_cost:,.0f}"
+        )
+        self.estimate = estimate
+        self.max_cost = max_cost
+
+    def __reduce__(self):
+        # Crosses the sandbox pipe (see sql_sandbox)
+        return (self.__class__, (self.estimate, self.max_cost))
+
+
+_STATS = {"checked": 0, "limited": 0, "rejected": 0, "explain_failures": 0, "logged": 0, "rotated": 0}
+_LOG_LOCK = threading.Lock()
+
+
+# ============================================================
+# 🧾 PLAN PARSERS (per dialect)
+# ============================================================
+
+def _walk(node: Any) -> Iterator[Dict[str, Any]]:
+    """Depth-first walk over nested plan dicts / lists."""
+    if isinstance(node, dict):
+        yield node
+        for value in node.values():
+            if isinstance(value, (dict, list)):
+                yield from _walk(value)
+    elif isinstance(node, list):
+        for item in node:
+            yield from _walk(item)
+
+
+def _json_cell(rows: List[tuple]) -> Any:
+    value = rows[0][0]
+    return json.loads(value) if isinstance(value, (str, bytes)) else value
+
+
+def _parse_postgresql(rows: List[tuple]) -> Dict[str, Any]:
+    plan = _json_cell(rows)[0]["Plan"]
+    nodes = [n for n in _walk(plan) if "Node Type" in n]
+
+    return {
+        "cost": float(plan["Total Cost"]),
+        "rows": max(int(n.get("Plan Rows", 0)) for n in nodes),
+        "full_scans": sum(1 for n in nodes if n["Node Type"] == "Seq Scan"),
+        "plan": [
+            f"{n['Node Type']}" + (f" on {n['Relation Name']}" if "Relation Name" in n else "")
+            for n in nodes
+        ],
+    }
+
+
+def _parse_mysql(rows: List[tuple]) -> Dict[str, Any]:
+    block = _json_cell(rows)["query_block"]
+    tables = [n for n in _walk(block) if "table_name" in n]
+
+    return {
+        "cost": float(block.get("cost_info", {}).get("query_cost", 0)),
+        "rows": max((int(t.get("rows_produced_per_join", 0)) for t in tables), default=0),
+        "full_scans": sum(1 for t in tables if t.get("access_type") == "ALL"),
+        "plan": [f"{t.get('access_type', '?')} on {t['table_name']}" for t in tables],
+    }
+
+
+def _parse_sqlite(rows: List[tuple]) -> Dict[str, Any]:
+    details = [str(row[-1]) for row in rows]
+
+    return {
+        "cost": None,
+        "rows": None,
+        # "SCAN t" = full table scan; "SCAN t USING ... INDEX" walks an index
+        "full_scans": sum(1 for d in details if d.startswith("SCAN") and "INDEX" not in d),
+        "plan": details,
+    }
+
+
+_PARSERS = {
+    "postgresql": _parse_postgresql,
+    "mysql": _parse_mysql,
+    "sqlite": _parse_sqlite,
+}
+
+
+# ============================================================
+# 🔎 ESTIMATE + DECISION
+# ============================================================
+
+def estimate_plan(conn: Connection, sql: str, db_type: str) -> Optional[Dict[str, Any]]:
+    """
+    EXPLAIN the query on `conn` and return the parsed estimate, or None
+    (guard off, dialect unsupported, EXPLAIN failed — never blocks the query).
+    """
+    spec = DB_DIALECTS.get(db_type, {}).get("explain")
+    parser = _PARSERS.get(db_type)
+    if SQL_COST_GUARD_MODE == "off" or not spec or parser is None:
+        return None
+
+    statement = text(spec["sql"].format(sql=sql))
+    try:
+        if spec.get("savepoint"):
+            with conn.begin_nested():
+                rows = conn.execute(statement).fetchall()
+        else:
+            rows = conn.execute(statement).fetchall()
+
+        estimate = parser(rows)
+        _STATS["checked"] += 1
+        return estimate
+
+    except Exception as e:
+        _STATS["explain_failures"] += 1
+        logger.warning(f"⚠️ EXPLAIN failed, cost guard skipped | db={db_type} | {e}")
+        return None
+
+
+def over_budget(estimate: Optional[Dict[str, Any]], max_cost: float = SQL_COST_GUARD_MAX_COST) -> bool:
+    return bool(estimate) and estimate["cost"] is not None and estimate["cost"] > max_cost
+
+
+def guard_plan(
+    conn: Connection,
+    sql: str,
+    db_type: str,
+    max_rows: int,
+    with_limit,
+) -> Dict[str, Any]:
+    """
+    Apply the cost guard to `sql` (bounded with `with_limit(sql, db_type, n)`).
+
+    Returns {"estimate": ... | None, "decision": "ok" | "limited" | "unchecked",
+             "max_rows": rows to fetch}
+    Raises QueryTooExpensiveError when the query must not run.
+    """
+    estimate = estimate_plan(conn, with_limit(sql, db_type, max_rows + 1), db_type)
+    if estimate is None:
+        return {"estimate": None, "decision": "unchecked", "max_rows": max_rows}
+
+    if not over_budget(estimate):
+        return {"estimate": estimate, "decision": "ok", "max_rows": max_rows}
+
+    # Auto-limit: a smaller LIMIT lets the planner stop early (plain scans / joins)
+    if SQL_COST_GUARD_MODE == "limit" and SQL_COST_GUARD_LIMIT_ROWS < max_rows:
+        limited = estimate_plan(
+            conn, with_limit(sql, db_type, SQL_COST_GUARD_LIMIT_ROWS + 1), db_type
+        )
+        if limited is not None and not over_budget(limited):
+            _STATS["limited"] += 1
+            logger.warning(
+                f"💸 Cost guard auto-limit | cost={estimate['cost']:,.0f} → {limited['cost']:,.0f} | "
+                f"rows ≤ {SQL_COST_GUARD_LIMIT_ROWS}"
+            )
+            return {
+                "estimate": {**limited, "unlimited_cost": estimate["cost"]},
+                "decision": "limited",
+                "max_rows": SQL_COST_GUARD_LIMIT_ROWS,
+            }
+
+    _STATS["rejected"] += 1
+    logger.warning(f"💸 Cost guard rejected query | cost={estimate['cost']:,.0f} | db={db_type}")
+    raise QueryTooExpensiveError(estimate, SQL_COST_GUARD_MAX_COST)
+
+
+# ============================================================
+# 📝 PLAN LOG (JSONL — estimates next to actual outcomes)
+# ============================================================
+
+def record_plan(entry: Dict[str, Any]) -> None:
+    """
+    Append one JSON line to SQL_PLAN_LOG_PATH (errors are logged, never raised).
+
+    No-op unless SQL_PLAN_LOG_ENABLED. The file is rotated to "<path>.1"
+    once it passes SQL_PLAN_LOG_MAX_BYTES; "question" is dropped unless
+    SQL_PLAN_LOG_QUESTIONS.
+    """
+    if not SQL_PLAN_LOG_ENABLED:
+        return
+
+    if not SQL_PLAN_LOG_QUESTIONS:
+        entry = {k: v for k, v in entry.items() if k != "question"}
+
+    line = json.dumps({"ts": round(time.time(), 3), **entry}, default=str)
+
+    try:
+        with _LOG_LOCK:
+            SQL_PLAN_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+            if (
+                SQL_PLAN_LOG_MAX_BYTES > 0
+                and SQL_PLAN_LOG_PATH.exists()
+                and SQL_PLAN_LOG_PATH.stat().st_size + len(line) + 1 > SQL_PLAN_LOG_MAX_BYTES
+            ):
+                SQL_PLAN_LOG_PATH.replace(SQL_PLAN_LOG_PATH.with_name(SQL_PLAN_LOG_PATH.name + ".1"))
+                _STATS["rotated"] += 1
+            with SQL_PLAN_LOG_PATH.open("a", encoding="utf-8") as f:
+                f.write(line + "\n")
+        _STATS["logged"] += 1
+
+    except OSError as e:
+        logger.warning(f"⚠️ Plan log write failed: {e}")
+
+
+def cost_guard_stats() -> Dict[str, Any]:
+    return {
+        **_STATS,
+        "mode": SQL_COST_GUARD_MODE,
+        "max_cost": SQL_COST_GUARD_MAX_COST,
+        "limit_rows": SQL_COST_GUARD_LIMIT_ROWS,
+        "plan_log": SQL_PLAN_LOG_ENABLED,
+    }
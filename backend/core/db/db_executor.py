@@ -1,19 +1,63 @@
 # backend/core/db/db_executor.py
 
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from functools import partial
+from time import monotonic
+import asyncio
+import json
+import threading
 from datetime import datetime, date, time
 from decimal import Decimal
 from uuid import UUID
 
+import sqlglot
+from sqlglot import exp
+from sqlglot.errors import SqlglotError
 from sqlalchemy import text
-from sqlalchemy.engine import Result
+from sqlalchemy.engine import Connection, Engine, Result
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine
 
 from backend.utils.logger import logger
+from backend.utils.config import (
+    SQL_MAX_ROWS,
+    SQL_MAX_RESULT_BYTES,
+    SQL_FETCH_BATCH_SIZE,
+    SQL_COUNT_TRUNCATED_RESULTS,
+    SQL_RESULT_FORMAT,
+    SQL_STATEMENT_TIMEOUT_SECONDS,
+    SQL_REPAIR_ENABLED,
+    DB_EXECUTOR_THREADS,
+    DB_MAX_CONCURRENT_QUERIES_PER_TARGET,
+)
 
 # DB core
-from backend.core.db.db_manager import get_db_engine
-from backend.core.db.schema_inspector import inspect_schema
-from backend.core.db.db_query_generator import generate_sql_query
+from backend.core.db.db_manager import (
+    disable_async_db_engine,
+    get_async_db_engine,
+    get_db_engine,
+    get_db_type,
+    url_fingerprint,
+)
+from backend.core.db.db_types import DB_DIALECTS
+from backend.core.db.schema_cache import get_cached_schema
+from backend.core.db.db_query_generator import agenerate_sql_query
+from backend.core.db.sql_validator import UnsafeSQLError
+from backend.core.db.sql_analyzer import InvalidSQLError, analyze_sql, sqlglot_dialect
+from backend.core.db.sql_repair import SQLRepairer, error_message
+from backend.core.db.sql_cache import sql_cache
+from backend.core.db.schema_renderer import schema_version
+from backend.core.db.result_cache import result_cache
+from backend.core.db.result_summarizer import summarize_rows
+from backend.core.db.row_encoder import encode_rows
+from backend.core.db.answer_templates import render_template_answer
+from backend.core.db.cost_guard import QueryTooExpensiveError, guard_plan, record_plan
+from backend.core.db.sql_sandbox import SandboxLimitError, execute_sandboxed, sandbox_applies
+
+# Speculative tool execution
+from backend.core.agent.speculation import claim_speculative_result
 
 # Memory
 from backend.core.memory.session_memory import (
@@ -22,7 +66,7 @@ from backend.core.memory.session_memory import (
 )
 
 # LLM (final explanation only)
-from backend.core.llm.llm_engine import generate_db_answer
+from backend.core.llm.llm_engine import agenerate_db_answer
 
 
 # ============================================================
@@ -61,34 +105,563 @@ def make_json_safe(value: Any) -> Any:
     return str(value)
 
 
-def _execute_sql(engine, sql: str) -> List[Dict[str, Any]]:
+# ============================================================
+# ⚡ COLUMN-TYPED CONVERSION (hot path for large results)
+# ============================================================
+
+_PRIMITIVES = (str, int, float, bool)
+
+# Exact class → JSON-safe conversion
+_FAST_CONVERTERS: Dict[type, Callable[[Any], Any]] = {
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+    time: time.isoformat,
+    Decimal: float,
+    UUID: str,
+}
+
+
+def _column_converter(sample: Any) -> Callable[[Any], Any]:
+    """
+    Build one converter for a column from a sample value.
+
+    Values whose exact class matches the sample take the fast path; anything
+    else (NULLs, mixed SQLite types) falls back to make_json_safe.
+    """
+    if sample is None:
+        return make_json_safe
+
+    cls = sample.__class__
+
+    if cls in _PRIMITIVES:
+        return lambda v: v if v.__class__ is cls or v is None else make_json_safe(v)
+
+    fast = _FAST_CONVERTERS.get(cls)
+    if fast is not None:
+        return lambda v: fast(v) if v.__class__ is cls else make_json_safe(v)
+
+    return make_json_safe
+
+
+def _build_column_converters(batch_columns: List[tuple]) -> List[Callable[[Any], Any]]:
+    """
+    One converter per column, from its first non-NULL value in the batch.
+    """
+    return [
+        _column_converter(next((v for v in values if v is not None), None))
+        for values in batch_columns
+    ]
+
+
+# ============================================================
+# 📏 BOUNDED FETCH
+# ============================================================
+
+def _with_row_limit(sql: str, db_type: str, limit: int) -> str:
+    """
+    Bound the query's top-level row count at `limit` (sqlglot AST):
+      - no LIMIT / FETCH FIRST → append DB_DIALECTS[...]["limit_syntax"]
+      - a literal one above `limit` → lowered to `limit`
+      - anything else (smaller, non-literal, unparseable) → left as written;
+        the bounded fetch still stops at max_rows
+    """
+    dialect = DB_DIALECTS.get(db_type)
+    if not dialect:
+        return sql
+
+    try:
+        tree = sqlglot.parse_one(sql, read=sqlglot_dialect(db_type))
+    except SqlglotError:
+        return sql
+    if not isinstance(tree, exp.Query):
+        return sql
+
+    existing = tree.args.get("limit")
+    if existing is None:
+        # New line: a trailing "-- comment" must not swallow the clause
+        return f"{sql}\n{dialect['limit_syntax'].format(limit=limit, offset=0)}"
+
+    if isinstance(existing, exp.Fetch):
+        options = existing.args.get("limit_options")
+        count = None if options is not None and options.args.get("percent") else existing.args.get("count")
+    else:
+        count = existing.expression
+
+    if not (isinstance(count, exp.Literal) and count.is_int) or int(count.this) <= limit:
+        return sql
+
+    count.replace(exp.Literal.number(limit))
+    return tree.sql(dialect=sqlglot_dialect(db_type))
+
+
+def _count_rows(conn: Connection, sql: str) -> Optional[int]:
     """
-    Execute a READ-ONLY SQL query and return JSON-safe rows.
+    Exact row count of the ORIGINAL query (no injected limit).
+    """
+    try:
+        return conn.execute(text(f"SELECT COUNT(*) FROM ({sql}) AS _total")).scalar()
+    except Exception as e:
+        logger.warning(f"⚠️ Row count query failed: {e}")
+        return None
+
+
+def _run_bounded(
+    conn: Connection,
+    sql: str,
+    db_type: str,
+    max_rows: int = SQL_MAX_ROWS,
+    max_bytes: int = SQL_MAX_RESULT_BYTES,
+    result_format: str = SQL_RESULT_FORMAT,
+    count_truncated: bool = SQL_COUNT_TRUNCATED_RESULTS,
+) -> Dict[str, Any]:
+    """
+    Execute a READ-ONLY SQL query on an open connection and return
+    JSON-safe data, bounded. Runs on a thread (sync engine) or inside
+    AsyncConnection.run_sync (async engine).
+
+    - LIMIT max_rows + 1 is injected (the extra row detects truncation)
+    - rows are streamed (server-side cursor where supported) in batches
+    - values are converted column-wise (see _build_column_converters)
+    - reading stops at `max_rows` rows or ~`max_bytes` serialized bytes
+
+    Returns (result_format="rows"):
+    {
+        "rows": [{...}, ...],
+        "row_count": int,
+        "truncated": bool,
+        "total_count": int | None   # None → truncated and not counted
+    }
+
+    result_format="columnar" replaces "rows" with
+    "columns": [names] + "column_values": [[values of column 0], ...]
+    """
+    bounded_sql = _with_row_limit(sql, db_type, max_rows + 1)
+
+    columns: List[str] = []
+    column_values: List[List[Any]] = []
+    converters: Optional[List[Callable[[Any], Any]]] = None
+    row_count = 0
+    size = 0
+    truncated = False
+
+    result: Result = conn.execution_options(
+        stream_results=True,
+        max_row_buffer=SQL_FETCH_BATCH_SIZE,
+    ).execute(text(bounded_sql))
+
+    try:
+        columns = [str(name) for name in result.keys()]
+        column_values = [[] for _ in columns]
+
+        while not truncated:
+            batch = result.fetchmany(SQL_FETCH_BATCH_SIZE)
+            if not batch:
+                break
+
+            if len(batch) > max_rows - row_count:
+                batch = batch[:max_rows - row_count]
+                truncated = True
+
+            # Column-wise conversion (types inspected once, on the first batch)
+            batch_columns = list(zip(*batch))
+            if converters is None:
+                converters = _build_column_converters(batch_columns)
+
+            converted = [
+                list(map(convert, values))
+                for convert, values in zip(converters, batch_columns)
+            ]
+
+            # Byte cap: average serialized row size of this batch
+            batch_bytes = len(json.dumps(converted, separators=(",", ":")))
+            if size + batch_bytes > max_bytes:
+                per_row = max(1, batch_bytes // len(batch))
+                keep = max(0, (max_bytes - size) // per_row)
+                converted = [values[:keep] for values in converted]
+                batch_bytes = keep * per_row
+                truncated = True
+
+            for target, values in zip(column_values, converted):
+                target.extend(values)
+
+            row_count += len(converted[0]) if converted else 0
+            size += batch_bytes
+    finally:
+        # Stops the server-side cursor without draining remaining rows
+        result.close()
+
+    if not truncated:
+        total_count = row_count
+    elif count_truncated:
+        total_count = _count_rows(conn, sql)
+    else:
+        total_count = None
+
+    if truncated:
+        logger.warning(
+            f"✂️ Result truncated | kept={row_count} rows | ~{size} bytes | total={total_count}"
+        )
+
+    if result_format == "columnar":
+        data: Dict[str, Any] = {"columns": columns, "column_values": column_values}
+    else:
+        data = {"rows": [dict(zip(columns, values)) for values in zip(*column_values)]}
+
+    return {**data, "row_count": row_count, "truncated": truncated, "total_count": total_count}
+
+
+def _run_guarded(
+    conn: Connection,
+    sql: str,
+    db_type: str,
+    max_rows: int = SQL_MAX_ROWS,
+    **limits: Any,
+) -> Dict[str, Any]:
+    """
+    _run_bounded behind the EXPLAIN cost guard (see cost_guard.guard_plan).
+
+    An auto-limited query fetches fewer rows and is never COUNT(*)-ed (the
+    count would run the expensive query after all). The estimate is
+    attached as "plan_estimate" when the dialect provides one.
+    """
+    guard = guard_plan(conn, sql, db_type, max_rows, _with_row_limit)
+
+    if guard["decision"] == "limited":
+        limits["count_truncated"] = False
+
+    result = _run_bounded(conn, sql, db_type, max_rows=guard["max_rows"], **limits)
+
+    if guard["estimate"] is not None:
+        result["plan_estimate"] = {**guard["estimate"], "decision": guard["decision"]}
+
+    return result
+
+
+# ============================================================
+# ⏱️ STATEMENT DEADLINE + CANCELLATION (per dialect, see db_types)
+# ============================================================
+
+class QueryTimeoutError(RuntimeError):
+    """Raised when the database aborts a query at the execution deadline."""
+
+    def __init__(self, timeout_seconds: float):
+        super().__init__(f"Query exceeded the {timeout_seconds:g} s execution limit")
+        self.timeout_seconds = timeout_seconds
+
+    def __reduce__(self):
+        # Crosses the sandbox pipe (see sql_sandbox)
+        return (self.__class__, (self.timeout_seconds,))
+
+
+# SQLite VM instructions between deadline checks
+_SQLITE_PROGRESS_OPS = 10_000
+
+
+class _QueryHandle:
+    """
+    What another thread needs to cancel a running query. `lock` is held
+    while cancelling and while the query finishes, so a cancel can never
+    reach a connection that was already returned to the pool. `cancelled`
+    tells a client-disconnect abort apart from a deadline abort.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = False
+        self.cancelled = False
+        self.backend_id: Optional[int] = None
+        self.sqlite_conn: Any = None
+        self.kill: Optional[Callable[[], None]] = None  # sandboxed: stop its worker
+
+
+def _begin_statement(
+    conn: Connection,
+    db_type: str,
+    timeout_seconds: float,
+    handle: _QueryHandle,
+) -> Callable[[], None]:
+    """
+    Arm the dialect's deadline on this connection and record how to cancel
+    the query. Returns the cleanup to run once the query is done.
+    """
+    spec = DB_DIALECTS.get(db_type, {}).get("statement_timeout", {})
+
+    if spec.get("progress_handler"):
+        raw = conn.connection.driver_connection
+        raw = getattr(raw, "_conn", raw)  # aiosqlite wraps the sqlite3 connection
+
+        if timeout_seconds > 0:
+            deadline = monotonic() + timeout_seconds
+            raw.set_progress_handler(lambda: monotonic() > deadline, _SQLITE_PROGRESS_OPS)
+
+        with handle.lock:
+            handle.sqlite_conn = raw
+            handle.running = True
+
+        def cleanup() -> None:
+            with handle.lock:
+                handle.running = False
+            # Pooled connection: never leave a stale deadline behind
+            with suppress(Exception):
+                raw.set_progress_handler(None, 0)
+
+        return cleanup
+
+    # Server-side deadline (transaction / session scoped) + backend id
+    ms = int(timeout_seconds * 1000)
+    for statement in spec.get("setup_sql", []):
+        result = conn.execute(text(statement.format(ms=ms)))
+        if result.returns_rows:
+            handle.backend_id = int(result.fetchone()[-1])
+
+    with handle.lock:
+        handle.running = True
+
+    def cleanup() -> None:
+        with handle.lock:
+            handle.running = False
+        # Session-scoped deadlines must not outlive this query on a pooled connection
+        for statement in spec.get("reset_sql", []):
+            try:
+                conn.execute(text(statement))
+            except Exception as e:
+                logger.warning(f"⚠️ Statement deadline reset failed, dropping connection | db={db_type} | {e}")
+                conn.invalidate()
+                break
+
+    return cleanup
+
+
+def _is_timeout(db_type: str, error: DBAPIError) -> bool:
+    markers = DB_DIALECTS.get(db_type, {}).get("statement_timeout", {}).get("error_markers", [])
+    message = str(getattr(error, "orig", error)).lower()
+    return any(marker in message for marker in markers)
+
+
+def _run_with_deadline(
+    conn: Connection,
+    sql: str,
+    db_type: str,
+    timeout_seconds: float = SQL_STATEMENT_TIMEOUT_SECONDS,
+    handle: Optional[_QueryHandle] = None,
+    **limits: Any,
+) -> Dict[str, Any]:
+    """
+    _run_guarded under the execution deadline (EXPLAIN included); a
+    deadline abort becomes QueryTimeoutError.
+    """
+    handle = handle or _QueryHandle()
+    cleanup = _begin_statement(conn, db_type, timeout_seconds, handle)
+
+    try:
+        return _run_guarded(conn, sql, db_type, **limits)
+    except DBAPIError as e:
+        # A client-disconnect cancel can look like a deadline abort (SQLite
+        # reports both as "interrupted"): only the latter is a timeout
+        if _is_timeout(db_type, e) and not handle.cancelled:
+            logger.warning(f"⏱️ Query hit the execution deadline | db={db_type} | {timeout_seconds:g}s")
+            raise QueryTimeoutError(timeout_seconds) from e
+        raise
+    finally:
+        cleanup()
+
+
+def _cancel_query(engine: Engine, db_type: str, handle: _QueryHandle) -> None:
+    """
+    Stop a running query server-side (client went away). Runs on its own
+    thread: the DB thread pool may be saturated by the very queries to cancel.
+    """
+    with handle.lock:
+        if not handle.running:
+            return
+        handle.cancelled = True
+
+        if handle.kill is not None:
+            handle.kill()
+            logger.warning("🛑 Sandboxed query worker killed (client disconnected)")
+            return
+
+        if handle.sqlite_conn is not None:
+            handle.sqlite_conn.interrupt()
+            logger.warning("🛑 SQLite query interrupted (client disconnected)")
+            return
+
+        cancel_sql = DB_DIALECTS.get(db_type, {}).get("statement_timeout", {}).get("cancel_sql")
+        if not cancel_sql or handle.backend_id is None:
+            return
+
+        try:
+            with engine.connect() as conn:
+                conn.execute(text(cancel_sql.format(backend_id=handle.backend_id)))
+            logger.warning(f"🛑 Query cancelled server-side | db={db_type} | backend={handle.backend_id}")
+        except Exception as e:
+            logger.warning(f"⚠️ Query cancellation failed | db={db_type} | {e}")
+
+
+def _execute_sql(engine: Engine, sql: str, db_type: str, **options: Any) -> Dict[str, Any]:
+    """
+    Sync execution (see _run_bounded / _run_guarded / _run_with_deadline for options).
     """
     with engine.connect() as conn:
-        result: Result = conn.execute(text(sql))
-        rows: List[Dict[str, Any]] = []
+        return _run_with_deadline(conn, sql, db_type, **options)
+
 
-        for row in result:
-            raw_row = dict(row._mapping)
-            safe_row = make_json_safe(raw_row)
-            rows.append(safe_row)
+class _AsyncConnectError(RuntimeError):
+    """The async driver could not open a connection (before any SQL ran)."""
 
-        return rows
+
+async def _aexecute_sql(engine: AsyncEngine, sql: str, db_type: str, **options: Any) -> Dict[str, Any]:
+    """
+    Async execution: network waits yield to the event loop (asyncpg /
+    aiomysql / aiosqlite), the bounded fetch logic is shared via run_sync.
+    Connect failures are raised as _AsyncConnectError.
+    """
+    try:
+        conn = await engine.connect()
+    except Exception as e:
+        raise _AsyncConnectError(str(e)) from e
+
+    try:
+        return await conn.run_sync(lambda sync_conn: _run_with_deadline(sync_conn, sql, db_type, **options))
+    finally:
+        await conn.close()
+
+
+async def _aexecute_or_offload(
+    session_id: str,
+    async_engine: AsyncEngine,
+    engine: Engine,
+    sql: str,
+    db_type: str,
+    handle: "_QueryHandle",
+) -> Dict[str, Any]:
+    """
+    Async execution, falling back to the sync engine on a thread when the
+    async driver cannot connect (e.g. a URL option it rejects with
+    TypeError). Driver incompatibilities disable the async twin for good.
+    """
+    try:
+        return await _aexecute_sql(async_engine, sql, db_type, handle=handle)
+    except _AsyncConnectError as e:
+        logger.warning(f"⚠️ Async connect failed, retrying on the sync engine | db={db_type} | {e}")
+        if not isinstance(e.__cause__, (DBAPIError, OSError)):
+            disable_async_db_engine(session_id)
+        return await run_in_db_thread(_execute_sql, engine, sql, db_type, handle=handle)
+
+
+# ============================================================
+# 🚦 NON-BLOCKING EXECUTION (async engine / bounded threads)
+# ============================================================
+#
+# Sync DB work must never run on the event loop: one slow analytical
+# query would freeze every chat on the worker. Queries run on the
+# target's AsyncEngine when its driver is installed, otherwise on a
+# bounded thread pool. Each target database admits at most
+# DB_MAX_CONCURRENT_QUERIES_PER_TARGET concurrent queries. With the process
+# sandbox enabled (see sql_sandbox), a DB thread only waits on a worker.
+
+_DB_THREADS = ThreadPoolExecutor(max_workers=DB_EXECUTOR_THREADS, thread_name_prefix="db-exec")
+
+# url fingerprint -> semaphore (created on the event loop on first use)
+_TARGET_SEMAPHORES: Dict[str, asyncio.Semaphore] = {}
+
+
+async def run_in_db_thread(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run blocking DB work (reflection, rehydration, sync queries) off the loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_DB_THREADS, partial(fn, *args, **kwargs))
+
+
+async def execute_sql_nonblocking(session_id: str, engine: Engine, sql: str, db_type: str) -> Dict[str, Any]:
+    """
+    Execute SQL without blocking the event loop, capped per target database.
+
+    If the awaiting task is cancelled (HTTP client disconnected), the query
+    is cancelled server-side too instead of running on for nobody. The
+    query itself is shielded until then: it keeps its connection (and its
+    concurrency slot) until the database has actually stopped it.
+    """
+    target = url_fingerprint(engine.url)
+    semaphore = _TARGET_SEMAPHORES.setdefault(
+        target, asyncio.Semaphore(DB_MAX_CONCURRENT_QUERIES_PER_TARGET)
+    )
+    handle = _QueryHandle()
+
+    await semaphore.acquire()
+    try:
+        async_engine = get_async_db_engine(session_id)
+        if sandbox_applies(engine, db_type):
+            work = asyncio.ensure_future(
+                run_in_db_thread(execute_sandboxed, engine, sql, db_type, handle=handle)
+            )
+        elif async_engine is not None:
+            work = asyncio.ensure_future(
+                _aexecute_or_offload(session_id, async_engine, engine, sql, db_type, handle)
+            )
+        else:
+            work = asyncio.ensure_future(
+                run_in_db_thread(_execute_sql, engine, sql, db_type, handle=handle)
+            )
+    except BaseException:
+        semaphore.release()
+        raise
+
+    work.add_done_callback(lambda _: semaphore.release())
+
+    try:
+        return await asyncio.shield(work)
+
+    except asyncio.CancelledError:
+        # The interrupted query's error is expected — consume it quietly
+        work.add_done_callback(lambda t: t.cancelled() or t.exception())
+        threading.Thread(
+            target=_cancel_query, args=(engine, db_type, handle), daemon=True
+        ).start()
+        raise
+
+
+def rows_from_payload(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Row dicts from either payload format ("rows" or columnar).
+    """
+    if "rows" in payload:
+        return payload["rows"]
+
+    columns = payload.get("columns", [])
+    return [dict(zip(columns, values)) for values in zip(*payload.get("column_values", []))]
 
 
 # ============================================================
 # 1️⃣ TOOL FUNCTION — NO LLM
 # ============================================================
 
+def _sql_error(error: Exception) -> Dict[str, Any]:
+    """Structured error for SQL that was rejected locally or failed to run."""
+    if isinstance(error, DBAPIError):
+        return {"type": "execution_error", "message": error_message(error)}
+
+    return {
+        "type": "invalid_sql",
+        "message": str(error),
+        "unknown_tables": getattr(error, "unknown_tables", []),
+        "unknown_columns": getattr(error, "unknown_columns", []),
+    }
+
+
 async def run_db_execution(
     session_id: str,
     query: str,
+    use_result_cache: bool = True,
+    request_id: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     DB TOOL (tool-safe, NO LLM).
 
     This function MUST return JSON-serializable data only.
+    `use_result_cache=False` skips cached rows (fresh rows are still cached).
+    `request_id` lets it claim the schema load speculated during routing.
+    SQL that fails is repaired locally first, then by at most one LLM call
+    (see sql_repair); the attempts are returned under "repairs".
     """
 
     logger.info(f"🗄️ DB Execution | Session={session_id} | Query='{query}'")
@@ -96,46 +669,203 @@ async def run_db_execution(
     # Save user query
     add_to_session_memory(session_id, "user", query)
 
-    # Inspect schema
-    schema = inspect_schema(session_id)
-
-    # Generate SQL
-    sql_payload = generate_sql_query(
-        session_id=session_id,
-        user_question=query,
-        schema=schema,
-    )
+    # Schema (speculative load this request started during routing, else per-session cache)
+    schema = await claim_speculative_result("schema", request_id, session_id, query)
+    if schema is None:
+        schema = await run_in_db_thread(get_cached_schema, session_id)
+
+    # Generate SQL (async, bounded by LLM_TIMEOUT_SECONDS)
+    try:
+        sql_payload = await agenerate_sql_query(
+            session_id=session_id,
+            user_question=query,
+            schema=schema,
+        )
+    except asyncio.TimeoutError:
+        logger.warning("⏳ SQL generation timed out")
+        sql_payload = {"sql": None, "db_type": get_db_type(session_id)}
 
     sql = sql_payload.get("sql")
+    db_type = sql_payload["db_type"]
+
+    # Set when the SQL came from the NL → SQL cache (deleted if it fails)
+    cache_key = sql_payload.get("cache_key")
+
+    # Read-only gate (fresh AND cached SQL) — local AST, no DB round-trip.
+    # SQL that does not parse is left to the repair stages below.
+    if sql and not sql.upper().startswith("NO SQL"):
+        try:
+            sql = analyze_sql(sql, db_type)["sql"]
+        except UnsafeSQLError as e:
+            logger.warning(f"🛡️ SQL rejected by read-only validator: {e}")
+            sql = None
+        except InvalidSQLError:
+            pass
 
     # Safety fallback
     if not sql or sql.upper().startswith("NO SQL"):
         logger.warning("🚫 SQL generation blocked")
+        if cache_key is not None:
+            await asyncio.to_thread(sql_cache.delete, cache_key)
         return {
             "query": query,
             "sql": None,
-            "db_type": sql_payload.get("db_type"),
+            "db_type": db_type,
             "tables_used": [],
             "rows": [],
             "row_count": 0,
+            "truncated": False,
+            "total_count": 0,
             "confidence": "low",
         }
 
-    # Execute SQL
-    engine = get_db_engine(session_id)
-    rows = _execute_sql(engine, sql)
+    repairer = SQLRepairer(query, db_type, schema) if SQL_REPAIR_ENABLED else None
+
+    def repairs() -> Dict[str, Any]:
+        return {"repairs": repairer.attempts} if repairer is not None and repairer.attempts else {}
+
+    def error_payload(error: Dict[str, Any]) -> Dict[str, Any]:
+        # Structured error: the answer LLM explains it instead of a 500
+        return {
+            "query": query,
+            "sql": sql,
+            "db_type": db_type,
+            "tables_used": sql_payload["tables_used"],
+            "rows": [],
+            "row_count": 0,
+            "truncated": False,
+            "total_count": None,
+            "confidence": sql_payload["confidence"],
+            "error": error,
+            **repairs(),
+        }
 
-    logger.info(f"✅ DB Execution Complete | Rows={len(rows)}")
+    def log_plan(attempt_sql: str, outcome: Dict[str, Any], started: float) -> None:
+        # Estimate vs actual, for tuning the cost thresholds offline
+        record_plan({
+            "session_id": session_id,
+            "db_type": db_type,
+            "question": query,
+            "sql": attempt_sql,
+            "elapsed_ms": round((monotonic() - started) * 1000, 1),
+            **outcome,
+        })
+
+    engine = await run_in_db_thread(get_db_engine, session_id)
+
+    async def attempt(candidate: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        # Schema check, then execute (or reuse a fresh-enough cached result,
+        # keyed by canonical SQL)
+        analysis = analyze_sql(candidate, db_type, schema)
+        result_key = analysis["normalized"]
+
+        result = result_cache.get(session_id, engine, result_key) if use_result_cache else None
+        if result is not None:
+            return analysis, result
+
+        started = monotonic()
+        try:
+            result = await execute_sql_nonblocking(session_id, engine, analysis["sql"], db_type)
+        except QueryTimeoutError:
+            log_plan(analysis["sql"], {"decision": "timeout"}, started)
+            raise
+        except SandboxLimitError as e:
+            log_plan(analysis["sql"], {"decision": "killed", "limit": e.limit}, started)
+            raise
+        except QueryTooExpensiveError as e:
+            log_plan(analysis["sql"], {"estimate": e.estimate, "decision": "rejected"}, started)
+            raise
+        except DBAPIError as e:
+            log_plan(analysis["sql"], {"decision": "error", "error": error_message(e)}, started)
+            raise
+
+        estimate = result.get("plan_estimate")
+        log_plan(analysis["sql"], {
+            "estimate": estimate,
+            "decision": estimate["decision"] if estimate else "unchecked",
+            "row_count": result["row_count"],
+            "truncated": result["truncated"],
+        }, started)
+
+        result_cache.set(session_id, engine, result_key, result)
+        return analysis, result
+
+    # Execute; failed SQL goes through local repairs, then at most one LLM repair
+    while True:
+        try:
+            analysis, result = await attempt(sql)
+            break
+
+        except QueryTimeoutError as e:
+            failure, error = e, {
+                "type": "timeout",
+                "message": str(e),
+                "timeout_seconds": e.timeout_seconds,
+            }
+        except QueryTooExpensiveError as e:
+            failure, error = e, {
+                "type": "too_expensive",
+                "message": str(e),
+                "estimated_cost": e.estimate["cost"],
+                "max_cost": e.max_cost,
+            }
+        except SandboxLimitError as e:
+            failure, error = e, {
+                "type": "resource_limit",
+                "message": str(e),
+                "limit": e.limit,
+            }
+        except (UnsafeSQLError, InvalidSQLError, DBAPIError) as e:
+            failure, error = e, _sql_error(e)
+
+        logger.warning(f"🧩 SQL failed | {error['type']} | {error['message'][:200]}")
+
+        if cache_key is not None:
+            # Cached SQL that fails is never served again
+            await asyncio.to_thread(sql_cache.delete, cache_key)
+            cache_key = None
+
+        if repairer is None:
+            return error_payload(error)
+
+        repairer.resolve(ok=False)
+
+        # Deadline / budget / resource failures are not syntax problems
+        if isinstance(failure, (QueryTimeoutError, QueryTooExpensiveError, SandboxLimitError)):
+            return error_payload(error)
+
+        candidate = await repairer.propose(sql, error["message"])
+        if candidate is None:
+            return error_payload(error)
+        sql = candidate
+
+    sql = analysis["sql"]
+
+    if repairer is not None:
+        repairer.resolve(ok=True)
+
+    # Only SQL that just ran successfully is cached; next time the same
+    # question reuses it (repaired SQL replaces the failed original)
+    repaired = repairer is not None and bool(repairer.attempts)
+    if sql_payload["confidence"] == "high" and (repaired or "cache_key" not in sql_payload):
+        await asyncio.to_thread(
+            sql_cache.set, schema_version(schema), db_type, query,
+            {**sql_payload, "sql": sql, "tables_used": analysis["tables"]},
+        )
+
+    logger.info(
+        f"✅ DB Execution Complete | Rows={result['row_count']} | truncated={result['truncated']}"
+    )
 
     # 🔒 TOOL-SAFE PAYLOAD (ABSOLUTELY JSON)
     return {
         "query": query,
         "sql": sql,
-        "db_type": sql_payload["db_type"],
-        "tables_used": sql_payload["tables_used"],
-        "rows": rows,
-        "row_count": len(rows),
+        "db_type": db_type,
+        "tables_used": analysis["tables"],
+        **result,
         "confidence": sql_payload["confidence"],
+        **repairs(),
     }
 
 
@@ -146,17 +876,21 @@ async def run_db_execution(
 async def run_db_generation(
     session_id: str,
     tool_payload: Dict[str, Any],
+    on_token: Optional[Callable[[str], None]] = None,
 ) -> Dict[str, Any]:
     """
     FINAL DB ANSWER GENERATION (LLM).
 
     tool_payload is GUARANTEED JSON-safe here.
+    `on_token` (optional) receives answer tokens as they are generated.
+    Trivial results (see answer_templates) are answered without the LLM;
+    the response then reports model="template".
     """
 
     logger.info(f"🤖 DB Generation | Session={session_id}")
 
     query = tool_payload["query"]
-    rows = tool_payload["rows"]
+    rows = rows_from_payload(tool_payload)
     sql = tool_payload["sql"]
     db_type = tool_payload["db_type"]
     tables_used = tool_payload["tables_used"]
@@ -172,14 +906,78 @@ async def run_db_generation(
         if memory_for_context else None
     )
 
-    # LLM explanation
-    llm_result = generate_db_answer(
-        query=query,
-        sql=sql,
-        rows=rows,
-        db_type=db_type,
-        memory_text=memory_text,
-    )
+    # Tell the LLM when it only sees part of the result (or none of it)
+    result_note = None
+    error = tool_payload.get("error")
+    if error and error.get("type") == "timeout":
+        result_note = (
+            f"The query was stopped after exceeding the {error['timeout_seconds']:g} second "
+            "execution limit, so no rows were returned. Explain this and suggest narrowing "
+            "the question (filters, a shorter date range, fewer tables)."
+        )
+    elif error and error.get("type") == "too_expensive":
+        result_note = (
+            f"The query was not run: its estimated cost ({error['estimated_cost']:,.0f}) is above "
+            f"the allowed {error['max_cost']:,.0f}, so no rows were returned. Explain this and "
+            "suggest narrowing the question (filters, a shorter date range, fewer tables)."
+        )
+    elif error and error.get("type") == "resource_limit":
+        result_note = (
+            f"The query was stopped because it used too many resources ({error['message']}), "
+            "so no rows were returned. Explain this and suggest narrowing the question "
+            "(filters, a shorter date range, fewer tables)."
+        )
+    elif error and error.get("type") == "execution_error":
+        result_note = (
+            f"The database rejected the query ({error['message']}) and automatic repair "
+            "did not succeed, so no rows were returned. Explain this briefly and suggest "
+            "rephrasing the question."
+        )
+    elif error and error.get("type") == "invalid_sql":
+        result_note = (
+            f"The generated query was not run because it does not match the database "
+            f"({error['message']}), so no rows were returned. Explain this and suggest "
+            "rephrasing the question with the table or column names that exist."
+        )
+    elif (tool_payload.get("plan_estimate") or {}).get("decision") == "limited" and tool_payload.get("truncated"):
+        result_note = (
+            f"The full query was too expensive to run, so only the first {len(rows)} rows were "
+            "fetched. Say that the answer is based on a partial result."
+        )
+    elif tool_payload.get("truncated"):
+        total = tool_payload.get("total_count")
+        result_note = (
+            f"Only the first {len(rows)} rows are shown"
+            + (f" out of {total} total rows." if total is not None else " (more rows exist).")
+        )
+
+    # Trivial result shapes: deterministic template, no LLM round-trip
+    result_summary = None
+    template_answer = render_template_answer(tool_payload, rows)
+
+    if template_answer is not None:
+        if on_token is not None:
+            on_token(template_answer)
+        llm_result = {"response": template_answer, "model": "template"}
+
+    else:
+        # Large results: the LLM sees column profiles + a sample, not every row
+        result_summary = await asyncio.to_thread(summarize_rows, rows)
+
+        # Rows (or the summary's sample) → compact prompt text, see row_encoder
+        rows_text = encode_rows(result_summary["sample_rows"] if result_summary else rows)
+
+        # LLM explanation (async, non-blocking)
+        llm_result = await agenerate_db_answer(
+            query=query,
+            sql=sql,
+            rows_text=rows_text,
+            db_type=db_type,
+            memory_text=memory_text,
+            result_note=result_note,
+            result_summary=result_summary,
+            on_token=on_token,
+        )
 
     # Save assistant reply
     add_to_session_memory(session_id, "assistant", llm_result["response"])
@@ -205,6 +1003,10 @@ async def run_db_generation(
         "used_chunks": 0,
         "rows": rows,
         "row_count": tool_payload["row_count"],
+        "truncated": tool_payload.get("truncated", False),
+        "total_count": tool_payload.get("total_count"),
+        "summarized_for_llm": result_summary is not None,
+        "error": tool_payload.get("error"),
         "confidence": tool_payload["confidence"],
         "citations": [db_citation],
         "formatted_citations": formatted_citations,
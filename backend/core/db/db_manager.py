@@ -1,29 +1,110 @@
 # backend/core/db/db_manager.py
 
-from typing import Dict, TypedDict
+from typing import Any, Dict, List, Optional, Set, TypedDict, Union
+from collections import OrderedDict
+from importlib.util import find_spec
 from pathlib import Path
+import asyncio
+import hashlib
 import json
+import threading
+import time
 
 from sqlalchemy import create_engine, text
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import URL, Engine, make_url
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
 from backend.utils.logger import logger
-from backend.utils.config import DATA_DIR
+from backend.utils.config import (
+    DATA_DIR,
+    DB_MAX_ENGINES,
+    DB_ENGINE_IDLE_TTL_SECONDS,
+    DB_HEALTH_CHECK_INTERVAL_SECONDS,
+    DB_POOL_PRE_PING,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_RECYCLE_SECONDS,
+    DB_ASYNC_EXECUTION,
+)
+from backend.core.db.db_types import DB_DIALECTS
 
 
 # ============================================================
-# 🧠 Session-scoped DB connection metadata (IN-MEMORY)
+# 🧠 Shared engines + session references (IN-MEMORY)
 # ============================================================
 
-class DBSession(TypedDict):
+class SharedEngine(TypedDict, total=False):
     engine: Engine
-    db_type: str   # postgresql | mysql | sqlite | etc.
+    db_type: str         # postgresql | mysql | sqlite | etc.
+    sessions: Set[str]   # sessions holding a reference (refcount = len)
+    last_used: float     # time.time() of the last get_db_engine()
+    last_checked: float  # time.time() of the last successful health check
+    # Lazily created by get_async_db_engine (None = driver not available)
+    async_engine: Optional[AsyncEngine]
+    async_loop: Optional[asyncio.AbstractEventLoop]
 
 
-# session_id -> DBSession (runtime cache)
+class DBSession(TypedDict):
+    fingerprint: str     # key into _ENGINES
+    db_type: str
+
+
+# url fingerprint -> SharedEngine (least recently used first)
+#
+# Sessions connecting the SAME database with the SAME credentials share one
+# engine (one pool per target), so the number of sessions no longer
+# multiplies connections to a server. Engines are governed, not kept forever:
+#   - at most DB_MAX_ENGINES live engines (LRU eviction beyond that)
+#   - engines idle for DB_ENGINE_IDLE_TTL_SECONDS are disposed
+#   - an engine is disposed when its last session disconnects
+# Evicted sessions keep their db_config.json and rehydrate lazily.
+_ENGINES: "OrderedDict[str, SharedEngine]" = OrderedDict()
+
+# session_id -> DBSession
 _DB_CONNECTIONS: Dict[str, DBSession] = {}
 
+_LOCK = threading.RLock()
+
+_STATS = {
+    "created": 0,
+    "shared_attaches": 0,
+    "rehydrated": 0,
+    "released": 0,
+    "evicted_lru": 0,
+    "evicted_idle": 0,
+    "health_checks": 0,
+    "health_failures": 0,
+}
+
+# Default ports, so "host" and "host:5432" share an engine
+_DEFAULT_PORTS = {"postgresql": 5432, "mysql": 3306, "mariadb": 3306, "mssql": 1433}
+
+
+def url_fingerprint(url: Union[str, URL]) -> str:
+    """
+    Stable id of a connection target + credentials (normalized URL, hashed):
+    lowercase driver / host, default port filled in, query params sorted,
+    SQLite paths resolved. Used to share engines (and cached results).
+    """
+    url = make_url(url)
+    backend = url.get_backend_name()
+
+    database = url.database or ""
+    if backend == "sqlite" and database and database != ":memory:":
+        database = str(Path(database).resolve())
+
+    parts = [
+        url.drivername.lower(),
+        url.username or "",
+        url.password or "",
+        (url.host or "").lower(),
+        str(url.port or _DEFAULT_PORTS.get(backend, "")),
+        database,
+        json.dumps(sorted((k, str(v)) for k, v in url.query.items())),
+    ]
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()[:16]
+
 
 # ============================================================
 # 📁 Persistent DB config path helpers
@@ -36,6 +117,188 @@ def _get_db_config_path(session_id: str) -> Path:
     return _get_db_session_dir(session_id) / "db_config.json"
 
 
+# ============================================================
+# 🏗️ ENGINE CONSTRUCTION (per-dialect pool settings)
+# ============================================================
+
+def _pool_kwargs(connection_string: Union[str, URL]) -> Dict[str, Any]:
+    """
+    Pool settings for the URL's dialect (db_types "pool"), with the
+    DB_POOL_SIZE / DB_MAX_OVERFLOW / DB_POOL_RECYCLE_SECONDS overrides.
+    Dialects with an empty "pool" (SQLite) keep SQLAlchemy's default pool.
+    """
+    backend = make_url(connection_string).get_backend_name()
+    pool = dict(DB_DIALECTS.get(backend, {}).get("pool", {}))
+
+    if pool:
+        overrides = {
+            "pool_size": DB_POOL_SIZE,
+            "max_overflow": DB_MAX_OVERFLOW,
+            "pool_recycle": DB_POOL_RECYCLE_SECONDS,
+        }
+        pool.update({k: v for k, v in overrides.items() if v is not None})
+
+    return pool
+
+
+def _create_engine(connection_string: str) -> Engine:
+    """
+    Create an engine and validate it with one round-trip.
+    No per-checkout ping: idle pools are health-checked in the background.
+    """
+    engine = create_engine(
+        connection_string,
+        pool_pre_ping=DB_POOL_PRE_PING,
+        future=True,
+        **_pool_kwargs(connection_string),
+    )
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+    return engine
+
+
+def _async_driver(db_type: str) -> Optional[str]:
+    """
+    The dialect's asyncio driver if async execution is enabled and both
+    the driver and greenlet (needed by SQLAlchemy's asyncio layer) are installed.
+    """
+    driver = DB_DIALECTS.get(db_type, {}).get("async_driver")
+    if not DB_ASYNC_EXECUTION or not driver:
+        return None
+    if find_spec(driver) is None or find_spec("greenlet") is None:
+        return None
+    return driver
+
+
+def _async_url(url: URL, db_type: str, driver: str) -> URL:
+    """
+    The sync URL rewritten for the async driver. Query parameters are
+    translated per dialect (db_types "async_query_params"); dialects
+    without a mapping keep them unchanged.
+    """
+    url = url.set(drivername=f"{url.get_backend_name()}+{driver}")
+
+    mapping = DB_DIALECTS.get(db_type, {}).get("async_query_params")
+    if mapping is None or not url.query:
+        return url
+
+    dropped = sorted(set(url.query) - set(mapping))
+    if dropped:
+        logger.info(f"⚡ Async URL: unsupported parameters dropped | db={db_type} | {dropped}")
+
+    return url.set(query={mapping[k]: v for k, v in url.query.items() if k in mapping})
+
+
+# Async disposals scheduled on the running loop (awaited at shutdown)
+_PENDING_DISPOSALS: Set["asyncio.Task[None]"] = set()
+
+
+def _dispose(entry: SharedEngine) -> None:
+    """
+    Dispose a shared engine and its async twin (if any).
+
+    AsyncEngine.dispose() is a coroutine bound to the loop that created the
+    connections, so it is scheduled there; without a running loop the pool
+    is only de-referenced.
+    """
+    entry["engine"].dispose()
+
+    async_engine = entry.get("async_engine")
+    if async_engine is None:
+        return
+
+    loop = entry.get("async_loop")
+    if loop is not None and loop.is_running():
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        if running is loop:
+            task = loop.create_task(async_engine.dispose())
+            _PENDING_DISPOSALS.add(task)
+            task.add_done_callback(_PENDING_DISPOSALS.discard)
+        else:
+            asyncio.run_coroutine_threadsafe(async_engine.dispose(), loop)
+    else:
+        async_engine.sync_engine.dispose(close=False)
+
+
+# ============================================================
+# 🔗 ENGINE REFERENCES (shared per target, refcounted by session)
+# ============================================================
+
+def _drop_engine(fingerprint: str) -> SharedEngine:
+    """Remove an engine and detach its sessions (caller holds _LOCK)."""
+    entry = _ENGINES.pop(fingerprint)
+    for session_id in entry["sessions"]:
+        _DB_CONNECTIONS.pop(session_id, None)
+    return entry
+
+
+def _acquire(session_id: str, connection_string: str) -> SharedEngine:
+    """
+    Attach a session to the shared engine of its target, creating (and
+    validating) the engine only if no session holds one yet.
+    Enforces DB_MAX_ENGINES (least recently used engine evicted first).
+    """
+    fingerprint = url_fingerprint(connection_string)
+
+    with _LOCK:
+        entry = _ENGINES.get(fingerprint)
+        if entry is not None:
+            entry["sessions"].add(session_id)
+            entry["last_used"] = time.time()
+            _ENGINES.move_to_end(fingerprint)
+            _DB_CONNECTIONS[session_id] = {"fingerprint": fingerprint, "db_type": entry["db_type"]}
+            _STATS["shared_attaches"] += 1
+            logger.info(
+                f"🔗 Shared DB engine attached | session={session_id} | refs={len(entry['sessions'])}"
+            )
+            return entry
+
+    # Network round-trip outside the lock
+    engine = _create_engine(connection_string)
+    discarded: List[SharedEngine] = []
+
+    with _LOCK:
+        entry = _ENGINES.get(fingerprint)
+        if entry is not None:
+            # Another session created it while we were connecting
+            discarded.append({"engine": engine})
+            _STATS["shared_attaches"] += 1
+        else:
+            now = time.time()
+            entry = {
+                "engine": engine,
+                "db_type": engine.dialect.name,
+                "sessions": set(),
+                "last_used": now,
+                "last_checked": now,
+            }
+            _ENGINES[fingerprint] = entry
+            _STATS["created"] += 1
+
+        entry["sessions"].add(session_id)
+        _ENGINES.move_to_end(fingerprint)
+        _DB_CONNECTIONS[session_id] = {"fingerprint": fingerprint, "db_type": entry["db_type"]}
+
+        while len(_ENGINES) > DB_MAX_ENGINES:
+            lru_fingerprint = next(iter(_ENGINES))
+            lru = _drop_engine(lru_fingerprint)
+            discarded.append(lru)
+            _STATS["evicted_lru"] += 1
+            logger.info(f"♻️ DB engine evicted (LRU) | sessions={len(lru['sessions'])}")
+
+    # Dispose outside the lock (closes pooled connections)
+    for old in discarded:
+        _dispose(old)
+
+    return entry
+
+
 # ============================================================
 # 🔌 CONNECT TO DATABASE (EXPLICIT USER ACTION)
 # ============================================================
@@ -44,10 +307,10 @@ def connect_db(session_id: str, connection_string: str) -> None:
     """
     Explicitly connect a database for a session.
 
-    - Creates SQLAlchemy engine
-    - Validates connection immediately
+    - Reuses the shared engine of the same target + credentials, or
+      creates one (per-dialect pool settings) and validates it
     - Detects DB type
-    - Stores engine in memory
+    - Stores the session reference in memory (LRU / idle-TTL governed)
     - Persists connection config on disk
 
     Parameters:
@@ -67,23 +330,8 @@ def connect_db(session_id: str, connection_string: str) -> None:
     try:
         logger.info(f"🔌 Connecting DB for session {session_id}")
 
-        engine = create_engine(
-            connection_string,
-            pool_pre_ping=True,
-            future=True
-        )
-
-        # Test connection immediately
-        with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
-
-        db_type = engine.dialect.name  # DB type Detection
-
-        # 🧠 Cache in memory
-        _DB_CONNECTIONS[session_id] = {
-            "engine": engine,
-            "db_type": db_type
-        }
+        # 🧠 Shared engine (cached in memory)
+        db_type = _acquire(session_id, connection_string)["db_type"]  # DB type Detection
 
         # 💾 Persist config to disk
         session_dir = _get_db_session_dir(session_id)
@@ -119,16 +367,21 @@ def get_db_engine(session_id: str) -> Engine:
     Retrieve the SQLAlchemy Engine for a session.
 
     Behavior:
-    1️⃣ If engine exists in memory → return it
-    2️⃣ Else if persisted config exists → recreate engine (lazy init)
+    1️⃣ If the session holds an engine reference → mark as recently used
+    2️⃣ Else if persisted config exists → re-attach / recreate the shared
+       engine (lazy init, also the path taken after LRU / idle eviction)
     3️⃣ Else → raise error (DB never connected)
     """
 
     # 1️⃣ Fast path: engine already in memory
-    session = _DB_CONNECTIONS.get(session_id)
-    if session:
-        return session["engine"]
-    
+    with _LOCK:
+        session = _DB_CONNECTIONS.get(session_id)
+        if session:
+            entry = _ENGINES[session["fingerprint"]]
+            entry["last_used"] = time.time()
+            _ENGINES.move_to_end(session["fingerprint"])
+            return entry["engine"]
+
     # 2️⃣ Lazy load from disk
     config_path = _get_db_config_path(session_id)
 
@@ -137,40 +390,90 @@ def get_db_engine(session_id: str) -> Engine:
             f"❌ No database connected for session {session_id}. "
             "User must provide a connection string first."
         )
-    
+
     try:
         logger.info(f"♻️ Rehydrating DB connection for session {session_id}")
 
         config = json.loads(config_path.read_text(encoding="utf-8"))
-        connection_string = config["connection_string"]
-        db_type = config["db_type"]
-
-        engine = create_engine(
-            connection_string,
-            pool_pre_ping=True,
-            future=True,
-        )
-
-        # Optional quick validation
-        with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
-
-        _DB_CONNECTIONS[session_id] = {
-            "engine": engine,
-            "db_type": db_type,
-        }
+        entry = _acquire(session_id, config["connection_string"])
+        _STATS["rehydrated"] += 1
 
         logger.info(
-            f"✅ DB connection restored | session={session_id} | db_type={db_type}"
+            f"✅ DB connection restored | session={session_id} | db_type={entry['db_type']}"
         )
 
-        return engine
-    
+        return entry["engine"]
+
     except Exception as e:
         logger.exception("❌ Failed to restore DB connection")
         raise RuntimeError(f"Failed to restore DB connection: {e}")
 
 
+# ============================================================
+# ⚡ ASYNC ENGINE (SQLAlchemy asyncio, same target + pool settings)
+# ============================================================
+
+def get_async_db_engine(session_id: str) -> Optional[AsyncEngine]:
+    """
+    AsyncEngine twin of the session's shared engine, or None when the
+    dialect's async driver (asyncpg / aiomysql / aiosqlite) or greenlet
+    is not installed — callers then offload the sync engine to threads.
+
+    Call from the event loop (no network I/O; the engine is bound to it).
+    The session must already hold an engine (get_db_engine first).
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+    with _LOCK:
+        session = _DB_CONNECTIONS.get(session_id)
+        entry = _ENGINES.get(session["fingerprint"]) if session else None
+        if entry is None:
+            return None
+
+        if "async_engine" in entry:
+            return entry["async_engine"]
+
+        driver = _async_driver(entry["db_type"])
+        async_engine = None
+
+        if driver:
+            url = entry["engine"].url
+            try:
+                async_engine = create_async_engine(
+                    _async_url(url, entry["db_type"], driver),
+                    pool_pre_ping=DB_POOL_PRE_PING,
+                    **_pool_kwargs(url),
+                )
+                logger.info(f"⚡ Async DB engine created | db={entry['db_type']} | driver={driver}")
+            except Exception as e:
+                logger.warning(f"⚠️ Async engine unavailable, using thread offload | {e}")
+
+        entry["async_engine"] = async_engine
+        entry["async_loop"] = loop if async_engine is not None else None
+        return async_engine
+
+
+def disable_async_db_engine(session_id: str) -> None:
+    """
+    Stop using the async twin of the session's engine (its driver could
+    not connect); queries fall back to the thread-offloaded sync engine.
+    """
+    with _LOCK:
+        session = _DB_CONNECTIONS.get(session_id)
+        entry = _ENGINES.get(session["fingerprint"]) if session else None
+        if entry is None or entry.get("async_engine") is None:
+            return
+        async_engine = entry["async_engine"]
+        entry["async_engine"] = None
+        entry["async_loop"] = None
+
+    logger.warning(f"⚠️ Async DB engine disabled, using thread offload | db={entry['db_type']}")
+    async_engine.sync_engine.dispose(close=False)
+
+
 # ============================================================
 # 🏷 GET DATABASE TYPE
 # ============================================================
@@ -195,22 +498,157 @@ def get_db_type(session_id: str) -> str:
     return config["db_type"]
 
 
+# ============================================================
+# ❓ IS DATABASE CONNECTED
+# ============================================================
+
+def is_db_connected(session_id: str) -> bool:
+    """
+    Cheap check (no network): True if the session has a live engine
+    in memory or a persisted connection config on disk.
+    """
+    return session_id in _DB_CONNECTIONS or _get_db_config_path(session_id).exists()
+
+
 # ============================================================
 # 🔥 DISCONNECT DATABASE
 # ============================================================
 
 def disconnect_db(session_id: str) -> None:
     """
-    Dispose and remove DB connection for a session.
+    Release the session's engine reference. The shared engine is disposed
+    only when no other session still uses it.
     Does NOT delete persisted config (handled by reset_session).
     """
 
-    session = _DB_CONNECTIONS.pop(session_id, None)
+    disposed = None
+    remaining = 0
 
-    if session:
-        logger.info(f"🔌 Disconnecting DB for session {session_id}")
-        session["engine"].dispose()
-        logger.info(f"✅ DB disconnected for session {session_id}")
+    with _LOCK:
+        session = _DB_CONNECTIONS.pop(session_id, None)
+        if session is None:
+            return
+
+        entry = _ENGINES.get(session["fingerprint"])
+        if entry is not None:
+            entry["sessions"].discard(session_id)
+            _STATS["released"] += 1
+            remaining = len(entry["sessions"])
+            if not remaining:
+                disposed = _ENGINES.pop(session["fingerprint"])
+
+    logger.info(f"🔌 Disconnecting DB for session {session_id}")
+    if disposed is not None:
+        _dispose(disposed)
+        logger.info(f"✅ DB disconnected for session {session_id} (engine disposed)")
+    else:
+        logger.info(f"✅ DB disconnected for session {session_id} | shared refs left={remaining}")
+
+
+# ============================================================
+# 🩺 POOL GOVERNANCE (idle eviction + background health checks)
+# ============================================================
+
+def evict_idle_engines(idle_ttl_seconds: int = DB_ENGINE_IDLE_TTL_SECONDS) -> int:
+    """
+    Dispose engines unused for `idle_ttl_seconds`. Returns how many were evicted.
+    Their sessions rehydrate from db_config.json on next use.
+    """
+    cutoff = time.time() - idle_ttl_seconds
+
+    with _LOCK:
+        idle = [fp for fp, e in _ENGINES.items() if e["last_used"] < cutoff]
+        evicted = [_drop_engine(fp) for fp in idle]
+
+    for entry in evicted:
+        _dispose(entry)
+        _STATS["evicted_idle"] += 1
+        logger.info(f"💤 DB engine evicted (idle) | sessions={len(entry['sessions'])}")
+
+    return len(evicted)
+
+
+def check_engine_health(interval_seconds: int = DB_HEALTH_CHECK_INTERVAL_SECONDS) -> int:
+    """
+    Ping engines that have been neither used nor checked for `interval_seconds`
+    (recent traffic already proves a pool healthy). A failed ping disposes
+    the pool so the next checkout opens fresh connections.
+    Returns the number of failed checks.
+    """
+    cutoff = time.time() - interval_seconds
+
+    with _LOCK:
+        due = [
+            e for e in _ENGINES.values()
+            if e["last_used"] < cutoff and e["last_checked"] < cutoff
+        ]
+
+    failures = 0
+    for entry in due:
+        _STATS["health_checks"] += 1
+        try:
+            with entry["engine"].connect() as conn:
+                conn.execute(text("SELECT 1"))
+            entry["last_checked"] = time.time()
+
+        except Exception as e:
+            failures += 1
+            _STATS["health_failures"] += 1
+            entry["engine"].dispose()
+            logger.warning(f"🩺 DB health check failed | db={entry['db_type']} | {e}")
+
+    return failures
+
+
+async def run_db_maintenance(interval_seconds: int = DB_HEALTH_CHECK_INTERVAL_SECONDS) -> None:
+    """
+    Background loop started in the app lifespan: idle eviction, then health
+    checks of the remaining idle pools. Cancel the task to stop it.
+    """
+    logger.info(f"🩺 DB maintenance started | interval={interval_seconds}s")
+
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await asyncio.to_thread(evict_idle_engines)
+            await asyncio.to_thread(check_engine_health, interval_seconds)
+        except Exception:
+            logger.exception("❌ DB maintenance iteration failed")
+
+
+def db_pool_stats() -> Dict[str, Any]:
+    """
+    Engine manager counters + pool usage summed over live engines.
+    """
+    with _LOCK:
+        entries = list(_ENGINES.values())
+        sessions = len(_DB_CONNECTIONS)
+
+    by_dialect: Dict[str, int] = {}
+    checked_out = checked_in = 0
+
+    for entry in entries:
+        by_dialect[entry["db_type"]] = by_dialect.get(entry["db_type"], 0) + 1
+        pool = entry["engine"].pool
+        # Not every pool class (e.g. SQLite's SingletonThreadPool) has these
+        if hasattr(pool, "checkedout"):
+            checked_out += pool.checkedout()
+        if hasattr(pool, "checkedin"):
+            checked_in += pool.checkedin()
+
+    return {
+        **_STATS,
+        "engines": len(entries),
+        "sessions": sessions,
+        "shared_engines": sum(1 for e in entries if len(e["sessions"]) > 1),
+        "async_engines": sum(1 for e in entries if e.get("async_engine") is not None),
+        "max_refs": max((len(e["sessions"]) for e in entries), default=0),
+        "max_engines": DB_MAX_ENGINES,
+        "idle_ttl_seconds": DB_ENGINE_IDLE_TTL_SECONDS,
+        "engines_by_dialect": by_dialect,
+        "connections_checked_out": checked_out,
+        "connections_idle": checked_in,
+    }
 
 
 # ============================================================
@@ -225,8 +663,22 @@ def clear_all_db_connections() -> None:
 
     logger.warning("🧹 Clearing ALL DB connections")
 
-    for session_id, session in _DB_CONNECTIONS.items():
-        logger.info(f"🔌 Closing DB for session {session_id}")
-        session["engine"].dispose()
+    with _LOCK:
+        entries = list(_ENGINES.values())
+        _ENGINES.clear()
+        _DB_CONNECTIONS.clear()
+
+    for entry in entries:
+        logger.info(f"🔌 Closing DB engine | db={entry['db_type']} | sessions={len(entry['sessions'])}")
+        _dispose(entry)
+
+
+async def aclear_all_db_connections() -> None:
+    """
+    Async-aware shutdown: dispose everything, then wait for async engine
+    disposals scheduled on this loop (they would be cancelled otherwise).
+    """
+    clear_all_db_connections()
 
-    _DB_CONNECTIONS.clear()
\ No newline at end of file
+    if _PENDING_DISPOSALS:
+        await asyncio.gather(*list(_PENDING_DISPOSALS), return_exceptions=True)
@@ -1,15 +1,19 @@
 # backend/core/db/db_query_generator.py
 
-from typing import Dict, Any, List
-import json
-import re
+from typing import Dict, Any, List, Optional
+import asyncio
 
 from langchain_core.prompts import PromptTemplate
 from langchain_core.runnables import RunnableSequence
 
-from backend.core.llm.llm_engine import get_llm
+from backend.core.llm.llm_engine import get_llm, invoke_chain, ainvoke_chain
+from backend.core.llm.llm_registry import llm_registry
 from backend.core.db.db_manager import get_db_type
 from backend.core.db.db_types import get_db_dialect
+from backend.core.db.schema_renderer import render_schema, schema_version
+from backend.core.db.schema_selector import select_relevant_schema
+from backend.core.db.sql_cache import sql_cache
+from backend.core.db.sql_analyzer import extract_tables
 from backend.utils.logger import logger
 
 
@@ -59,7 +63,47 @@ STRICT RULES (MANDATORY):
 - DO NOT wrap output in backticks
 - Return ONLY ONE valid SQL query
 
-Database Schema (JSON):
+Database Schema:
+{schema}
+
+User Question:
+{question}
+
+Return ONLY SQL:
+""".strip()
+
+
+SQL_REPAIR_PROMPT_TEMPLATE = """
+You are an expert SQL debugger.
+
+A query generated for the user's question failed. Fix it.
+
+Database Engine:
+- Name: {db_name}
+
+DIALECT RULES (STRICT):
+- Case-insensitive text matching uses: {case_insensitive_like}
+- Boolean TRUE is represented as: {boolean_true}
+- Boolean FALSE is represented as: {boolean_false}
+- Current timestamp function: {date_now}
+- Pagination syntax: {limit_syntax}
+- Notes: {notes}
+
+REPAIR RULES (MANDATORY):
+- Fix ONLY what the error requires, keep the intent of the query
+- ONLY a single READ-ONLY SELECT query
+- The character ';' is strictly forbidden anywhere in the output
+- Use ONLY tables and columns from the schema
+- DO NOT add explanations, comments or markdown
+- DO NOT wrap output in backticks
+
+Failed SQL:
+{sql}
+
+Database Error:
+{error}
+
+Database Schema:
 {schema}
 
 User Question:
@@ -102,18 +146,58 @@ def _build_sql_chain() -> RunnableSequence:
     return RunnableSequence(prompt | llm)
 
 
+def get_sql_chain() -> RunnableSequence:
+    """
+    Return the prebuilt SQL generation chain (built once per process).
+    """
+    return llm_registry.get_chain(("sql", "gemini-2.5-flash", 0.0), _build_sql_chain)
+
+
+def _build_sql_repair_chain() -> RunnableSequence:
+    """
+    Build Prompt → LLM chain for repairing failed SQL (temperature = 0).
+    """
+    llm = get_llm(model_name="gemini-2.5-flash", temperature=0.0)
+
+    prompt = PromptTemplate(
+        input_variables=[
+            "db_name",
+            "case_insensitive_like",
+            "boolean_true",
+            "boolean_false",
+            "date_now",
+            "limit_syntax",
+            "notes",
+            "sql",
+            "error",
+            "schema",
+            "question",
+        ],
+        template=SQL_REPAIR_PROMPT_TEMPLATE,
+    )
+
+    return RunnableSequence(prompt | llm)
+
+
+def get_sql_repair_chain() -> RunnableSequence:
+    """
+    Return the prebuilt SQL repair chain (built once per process).
+    """
+    return llm_registry.get_chain(("sql_repair", "gemini-2.5-flash", 0.0), _build_sql_repair_chain)
+
+
 
 # ============================================================
 # 🔍 TABLE EXTRACTION (POST-GENERATION)
 # ============================================================
 
-def _extract_tables_from_sql(sql: str) -> List[str]:
+def _extract_tables_from_sql(sql: str, db_type: str) -> List[str]:
     """
-    Extract table names from FROM / JOIN clauses.
+    Extract base table names (CTEs, subqueries, quoted and schema-qualified
+    names handled by the sqlglot AST — see sql_analyzer).
     This parses the GENERATED SQL, not the schema.
     """
-    pattern = r"(?:FROM|JOIN)\s+([a-zA-Z_][a-zA-Z0-9_]*)"
-    return list(set(re.findall(pattern, sql, re.IGNORECASE)))
+    return extract_tables(sql, db_type)
 
 
 
@@ -121,29 +205,13 @@ def _extract_tables_from_sql(sql: str) -> List[str]:
 # 🧠 NATURAL LANGUAGE → SQL (PUBLIC API)
 # ============================================================
 
-def generate_sql_query(session_id: str, user_question: str, schema: Dict) -> Dict[str, Any]:
+def _build_sql_inputs(db_type: str, user_question: str, schema: Dict) -> Dict[str, Any]:
     """
-    Generate structured SQL output from NL query.
-
-    Returns:
-    {
-        sql: str,
-        db_type: str,
-        tables_used: List[str],
-        confidence: "high" | "low"
-    }
+    Build chain inputs from dialect rules + schema + question.
     """
-
-    logger.info("🧠 Generating SQL query from natural language")
-
-    # 1️⃣ Detect DB type
-    db_type = get_db_type(session_id)
-
-    # 2️⃣ Load dialect rules
     dialect = get_db_dialect(db_type)
 
-    # 3️⃣ Build chain inputs
-    chain_inputs = {
+    return {
         "db_name": dialect["name"],
         "case_insensitive_like": dialect["case_insensitive_like"],
         "boolean_true": dialect["boolean_true"],
@@ -151,20 +219,21 @@ def generate_sql_query(session_id: str, user_question: str, schema: Dict) -> Dic
         "date_now": dialect["date_now"],
         "limit_syntax": dialect["limit_syntax"],
         "notes": dialect["notes"],
-        "schema": json.dumps(schema, indent=2),
+        "schema": render_schema(schema),
         "question": user_question,
     }
 
-    # 4️⃣ Run LLM
-    chain = _build_sql_chain()
-    result = chain.invoke(chain_inputs)
 
+def _build_sql_payload(result: Any, db_type: str) -> Dict[str, Any]:
+    """
+    Turn the raw LLM result into the structured SQL payload.
+    """
     sql = getattr(result, "content", str(result)).strip()
 
-    # 5️⃣ Extract tables
-    tables_used = _extract_tables_from_sql(sql)
+    # Extract tables
+    tables_used = _extract_tables_from_sql(sql, db_type)
 
-    # 6️⃣ Confidence heuristic
+    # Confidence heuristic
     confidence = "low" if "INSUFFICIENT_SCHEMA" in sql.upper() else "high"
 
     logger.info(f"✅ SQL generated | db={db_type} | tables={tables_used} | confidence={confidence}")
@@ -174,4 +243,110 @@ def generate_sql_query(session_id: str, user_question: str, schema: Dict) -> Dic
         "db_type": db_type,
         "tables_used": tables_used,
         "confidence": confidence,
-    }
\ No newline at end of file
+    }
+
+
+def generate_sql_query(session_id: str, user_question: str, schema: Dict) -> Dict[str, Any]:
+    """
+    Generate structured SQL output from NL query.
+
+    Returns:
+    {
+        sql: str,
+        db_type: str,
+        tables_used: List[str],
+        confidence: "high" | "low"
+    }
+    """
+
+    logger.info("🧠 Generating SQL query from natural language")
+
+    # 1️⃣ Detect DB type
+    db_type = get_db_type(session_id)
+
+    # 💾 Same question on the same schema → reuse SQL that already ran
+    # (written by the executor after a successful execution only)
+    fingerprint = schema_version(schema)
+    cached = sql_cache.get(fingerprint, db_type, user_question)
+    if cached is not None:
+        return cached
+
+    # 2️⃣ Keep only tables relevant to the question (large schemas)
+    schema = select_relevant_schema(schema, user_question)
+
+    # 3️⃣ Load dialect rules + build chain inputs
+    chain_inputs = _build_sql_inputs(db_type, user_question, schema)
+
+    # 4️⃣ Run LLM
+    chain = get_sql_chain()
+    result = invoke_chain(chain, chain_inputs, "gemini-2.5-flash", 0.0)
+
+    # 5️⃣ + 6️⃣ Extract tables + confidence
+    return _build_sql_payload(result, db_type)
+
+
+async def agenerate_sql_query(
+    session_id: str,
+    user_question: str,
+    schema: Dict,
+    timeout: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Async variant of generate_sql_query.
+
+    Uses `ainvoke` so the event loop stays free while Gemini works.
+    Raises asyncio.TimeoutError after `timeout` seconds
+    (default: LLM_TIMEOUT_SECONDS) and propagates cancellation.
+    Repeated (or near-identical) questions are served from the NL → SQL cache;
+    cache hits carry "cache_key".
+    """
+
+    logger.info("🧠 Generating SQL query from natural language (async)")
+
+    db_type = get_db_type(session_id)
+
+    fingerprint = schema_version(schema)
+    cached = await asyncio.to_thread(sql_cache.get, fingerprint, db_type, user_question)
+    if cached is not None:
+        return cached
+
+    schema = await asyncio.to_thread(select_relevant_schema, schema, user_question)
+    chain_inputs = _build_sql_inputs(db_type, user_question, schema)
+
+    chain = get_sql_chain()
+    result = await ainvoke_chain(
+        chain, chain_inputs, "gemini-2.5-flash", 0.0, timeout=timeout
+    )
+
+    return _build_sql_payload(result, db_type)
+
+
+async def arepair_sql_query(
+    user_question: str,
+    sql: str,
+    error: str,
+    db_type: str,
+    schema: Dict,
+    timeout: Optional[float] = None,
+) -> str:
+    """
+    One LLM attempt at fixing SQL that failed with `error`.
+
+    Returns the candidate SQL (unvalidated — the executor re-checks it).
+    Raises asyncio.TimeoutError after `timeout` seconds.
+    """
+
+    logger.info(f"🩹 Repairing SQL with LLM | db={db_type} | error='{error[:120]}'")
+
+    schema = await asyncio.to_thread(select_relevant_schema, schema, user_question)
+    chain_inputs = {
+        **_build_sql_inputs(db_type, user_question, schema),
+        "sql": sql,
+        "error": error,
+    }
+
+    result = await ainvoke_chain(
+        get_sql_repair_chain(), chain_inputs, "gemini-2.5-flash", 0.0, timeout=timeout
+    )
+
+    return getattr(result, "content", str(result)).strip()
@@ -10,35 +10,237 @@ from typing import Dict, Any
 DB_DIALECTS: Dict[str, Dict[str, Any]] = {
     "postgresql": {
         "name": "PostgreSQL",
+        # sqlglot dialect for local SQL analysis (sql_analyzer)
+        "sqlglot_dialect": "postgres",
         "supports_joins": True,
         "case_insensitive_like": "ILIKE",
         "boolean_true": "TRUE",
         "boolean_false": "FALSE",
         "date_now": "NOW()",
         "limit_syntax": "LIMIT {limit} OFFSET {offset}",
-        "notes": "Use ILIKE for case-insensitive text search"
+        "notes": "Use ILIKE for case-insensitive text search",
+        # SQLAlchemy pool settings (recycle below typical proxy / LB idle timeouts)
+        "pool": {"pool_size": 5, "max_overflow": 5, "pool_recycle": 1800, "pool_timeout": 30},
+        # SQLAlchemy asyncio driver (used when installed, else thread offload)
+        "async_driver": "asyncpg",
+        # URL query parameters the async driver accepts (libpq name → asyncpg
+        # connect() argument); the rest (connect_timeout, application_name ...)
+        # are dropped from the async URL: asyncpg raises TypeError on them
+        "async_query_params": {
+            "sslmode": "ssl",
+            "ssl": "ssl",
+            "host": "host",
+            "target_session_attrs": "target_session_attrs",
+            "prepared_statement_cache_size": "prepared_statement_cache_size",
+        },
+        # Planner estimate before execution (cost guard); savepoint keeps a failed
+        # EXPLAIN from aborting the surrounding transaction
+        "explain": {"sql": "EXPLAIN (FORMAT JSON) {sql}", "savepoint": True},
+        # Statement deadline + server-side cancellation. The last column of the
+        # last setup statement is the backend id that cancel_sql targets.
+        "statement_timeout": {
+            "setup_sql": ["SELECT set_config('statement_timeout', '{ms}', true), pg_backend_pid()"],
+            "cancel_sql": "SELECT pg_cancel_backend({backend_id})",
+            "error_markers": ["statement timeout"],
+        },
+        # md5 over catalog columns + PK/FK constraints of the current schema
+        "schema_fingerprint_sql": """
+            SELECT md5(
+                coalesce((
+                    SELECT string_agg(
+                        c.relname || '.' || a.attname || ':' ||
+                        format_type(a.atttypid, a.atttypmod) || ':' || a.attnotnull,
+                        ',' ORDER BY c.relname, a.attnum
+                    )
+                    FROM pg_class c
+                    JOIN pg_namespace n ON n.oid = c.relnamespace
+                    JOIN pg_attribute a ON a.attrelid = c.oid
+                    WHERE n.nspname = current_schema()
+                      AND c.relkind IN ('r', 'p')
+                      AND a.attnum > 0 AND NOT a.attisdropped
+                ), '')
+                || '|' ||
+                coalesce((
+                    SELECT string_agg(
+                        con.conname || ':' || pg_get_constraintdef(con.oid),
+                        ',' ORDER BY con.conname
+                    )
+                    FROM pg_constraint con
+                    JOIN pg_namespace n ON n.oid = con.connamespace
+                    WHERE n.nspname = current_schema() AND con.contype IN ('p', 'f')
+                ), '')
+            )
+        """,
+        # Bulk reflection: one query each for columns / PKs / FKs across all tables
+        "reflection_sql": {
+            "columns": """
+                SELECT c.relname, a.attname,
+                       upper(format_type(a.atttypid, a.atttypmod)), NOT a.attnotnull
+                FROM pg_class c
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                JOIN pg_attribute a ON a.attrelid = c.oid
+                WHERE n.nspname = current_schema()
+                  AND c.relkind IN ('r', 'p')
+                  AND a.attnum > 0 AND NOT a.attisdropped
+                ORDER BY c.relname, a.attnum
+            """,
+            "primary_keys": """
+                SELECT c.relname, a.attname
+                FROM pg_constraint con
+                JOIN pg_class c ON c.oid = con.conrelid
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                CROSS JOIN LATERAL unnest(con.conkey) WITH ORDINALITY AS k(attnum, ord)
+                JOIN pg_attribute a ON a.attrelid = c.oid AND a.attnum = k.attnum
+                WHERE n.nspname = current_schema() AND con.contype = 'p'
+                ORDER BY c.relname, k.ord
+            """,
+            "foreign_keys": """
+                SELECT c.relname, a.attname, rc.relname, ra.attname
+                FROM pg_constraint con
+                JOIN pg_class c ON c.oid = con.conrelid
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                JOIN pg_class rc ON rc.oid = con.confrelid
+                CROSS JOIN LATERAL unnest(con.conkey, con.confkey)
+                    WITH ORDINALITY AS k(attnum, ref_attnum, ord)
+                JOIN pg_attribute a ON a.attrelid = c.oid AND a.attnum = k.attnum
+                JOIN pg_attribute ra ON ra.attrelid = rc.oid AND ra.attnum = k.ref_attnum
+                WHERE n.nspname = current_schema() AND con.contype = 'f'
+                ORDER BY c.relname, con.conname, k.ord
+            """,
+        },
+        # format_type() spellings → the Inspector's (str(SQLAlchemy type)), so
+        # bulk and per-table reflection render the same schema
+        "reflection_type_aliases": [
+            (r"^CHARACTER VARYING\b", "VARCHAR"),
+            (r"^CHARACTER\b", "CHAR"),
+            (r"^(TIMESTAMP|TIME)(\(\d+\))? WITH(OUT)? TIME ZONE$", r"\1"),
+            (r"^(NUMERIC)\((\d+),(\d+)\)$", r"\1(\2, \3)"),
+            (r"^BIT( VARYING)?(\(\d+\))?$", "BIT"),
+            (r"^INTERVAL\b.*", "INTERVAL"),
+            (r".*\[\]$", "ARRAY"),
+        ],
     },
 
     "mysql": {
         "name": "MySQL",
+        "sqlglot_dialect": "mysql",
         "supports_joins": True,
         "case_insensitive_like": "LIKE",
         "boolean_true": "1",
         "boolean_false": "0",
         "date_now": "NOW()",
         "limit_syntax": "LIMIT {offset}, {limit}",
-        "notes": "LIMIT offset, limit syntax"
+        "notes": "LIMIT offset, limit syntax",
+        # Recycle well below the server's wait_timeout (stale connections otherwise)
+        "pool": {"pool_size": 5, "max_overflow": 5, "pool_recycle": 1800, "pool_timeout": 30},
+        # SQLAlchemy asyncio driver (used when installed, else thread offload)
+        "async_driver": "aiomysql",
+        "explain": {"sql": "EXPLAIN FORMAT=JSON {sql}"},
+        # MAX_EXECUTION_TIME applies to read-only SELECTs (all we run); it is
+        # session scoped, so reset_sql restores it before the connection is pooled
+        "statement_timeout": {
+            "setup_sql": ["SET SESSION MAX_EXECUTION_TIME = {ms}", "SELECT CONNECTION_ID()"],
+            "reset_sql": ["SET SESSION MAX_EXECUTION_TIME = DEFAULT"],
+            "cancel_sql": "KILL QUERY {backend_id}",
+            "error_markers": ["3024", "maximum statement execution time exceeded"],
+        },
+        # CRC32 checksums over information_schema columns + foreign keys
+        "schema_fingerprint_sql": """
+            SELECT
+                (SELECT CONCAT(COUNT(*), '-', COALESCE(SUM(CRC32(CONCAT_WS(':',
+                        table_name, column_name, column_type, is_nullable, column_key))), 0))
+                 FROM information_schema.columns
+                 WHERE table_schema = DATABASE()),
+                (SELECT CONCAT(COUNT(*), '-', COALESCE(SUM(CRC32(CONCAT_WS(':',
+                        table_name, column_name, referenced_table_name, referenced_column_name))), 0))
+                 FROM information_schema.key_column_usage
+                 WHERE table_schema = DATABASE() AND referenced_table_name IS NOT NULL)
+        """,
+        # Bulk reflection: one query each for columns / PKs / FKs across all tables
+        "reflection_sql": {
+            "columns": """
+                SELECT col.table_name, col.column_name,
+                       UPPER(col.column_type), col.is_nullable = 'YES'
+                FROM information_schema.columns col
+                JOIN information_schema.tables t
+                  ON t.table_schema = col.table_schema AND t.table_name = col.table_name
+                WHERE col.table_schema = DATABASE() AND t.table_type = 'BASE TABLE'
+                ORDER BY col.table_name, col.ordinal_position
+            """,
+            "primary_keys": """
+                SELECT table_name, column_name
+                FROM information_schema.key_column_usage
+                WHERE table_schema = DATABASE() AND constraint_name = 'PRIMARY'
+                ORDER BY table_name, ordinal_position
+            """,
+            "foreign_keys": """
+                SELECT table_name, column_name, referenced_table_name, referenced_column_name
+                FROM information_schema.key_column_usage
+                WHERE table_schema = DATABASE() AND referenced_table_name IS NOT NULL
+                ORDER BY table_name, constraint_name, ordinal_position
+            """,
+        },
+        # UPPER(column_type) spellings → the Inspector's (str(SQLAlchemy type)),
+        # which drops display widths, UNSIGNED / ZEROFILL, fsp and enum values
+        "reflection_type_aliases": [
+            (r" (UNSIGNED|ZEROFILL)\b", ""),
+            (r"^INT\b", "INTEGER"),
+            (r"^(INTEGER|TINYINT|SMALLINT|MEDIUMINT|BIGINT|YEAR)\(\d+\)$", r"\1"),
+            (r"^(DECIMAL|NUMERIC)\((\d+),(\d+)\)$", r"\1(\2, \3)"),
+            (r"^(FLOAT|DOUBLE)\([\d,]+\)$", r"\1"),
+            (r"^(DATETIME|TIMESTAMP|TIME)\(\d+\)$", r"\1"),
+            (r"^(ENUM|SET)\(.*\)$", r"\1"),
+            (r"^BIT\(\d+\)$", "BIT"),
+        ],
     },
 
     "sqlite": {
         "name": "SQLite",
+        "sqlglot_dialect": "sqlite",
         "supports_joins": True,
         "case_insensitive_like": "LIKE",
         "boolean_true": "1",
         "boolean_false": "0",
         "date_now": "CURRENT_TIMESTAMP",
         "limit_syntax": "LIMIT {limit} OFFSET {offset}",
-        "notes": "Limited ALTER TABLE support"
+        "notes": "Limited ALTER TABLE support",
+        # Local file: SQLAlchemy's default pool is already the right choice
+        "pool": {},
+        # SQLAlchemy asyncio driver (used when installed, else thread offload)
+        "async_driver": "aiosqlite",
+        # No cost / row estimates: plans are recorded, never enforced
+        "explain": {"sql": "EXPLAIN QUERY PLAN {sql}"},
+        # In-process: a progress handler aborts past the deadline, interrupt() cancels
+        "statement_timeout": {
+            "progress_handler": True,
+            "error_markers": ["interrupted"],
+        },
+        # Incremented by SQLite on every schema change
+        "schema_fingerprint_sql": "PRAGMA schema_version",
+        # Bulk reflection via pragma table-valued functions over sqlite_master
+        "reflection_sql": {
+            "columns": """
+                SELECT m.name, p.name, UPPER(p.type), NOT p."notnull"
+                FROM sqlite_master m
+                JOIN pragma_table_info(m.name) p
+                WHERE m.type = 'table' AND m.name NOT LIKE 'sqlite_%'
+                ORDER BY m.name, p.cid
+            """,
+            "primary_keys": """
+                SELECT m.name, p.name
+                FROM sqlite_master m
+                JOIN pragma_table_info(m.name) p
+                WHERE m.type = 'table' AND m.name NOT LIKE 'sqlite_%' AND p.pk > 0
+                ORDER BY m.name, p.pk
+            """,
+            "foreign_keys": """
+                SELECT m.name, f."from", f."table", f."to"
+                FROM sqlite_master m
+                JOIN pragma_foreign_key_list(m.name) f
+                WHERE m.type = 'table' AND m.name NOT LIKE 'sqlite_%'
+                ORDER BY m.name, f.id, f.seq
+            """,
+        },
     },
 }
 
@@ -0,0 +1,147 @@
+# backend/core/db/result_cache.py
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy.engine import Engine
+
+from backend.utils.logger import logger
+from backend.utils.config import (
+    RESULT_CACHE_ENABLED,
+    RESULT_CACHE_TTL_SECONDS,
+    RESULT_CACHE_MAX_ENTRY_BYTES,
+    RESULT_CACHE_MAX_TOTAL_BYTES,
+)
+from backend.core.db.db_manager import url_fingerprint
+
+
+# ============================================================
+# 🧊 DB QUERY RESULT CACHE (in-memory, process-local)
+# ============================================================
+
+def engine_fingerprint(engine: Engine) -> str:
+    """
+    Stable id of the database an engine points at (normalized URL, hashed —
+    the same key db_manager shares engines by). Sessions connected to the
+    same database share cached results.
+    """
+    return url_fingerprint(engine.url)
+
+
+class QueryResultCache:
+    """
+    Caches JSON-safe results of executed SQL.
+
+    Key   → (engine URL fingerprint, SQL text)
+    Value → result exactly as returned by the executor (rows + truncation info)
+
+    Freshness is decided by the REQUESTING session's TTL, so one session
+    can accept 10-minute-old aggregates while another wants 30 seconds.
+
+    Limits:
+      - results above `max_entry_bytes` (serialized) are never cached
+      - least recently used entries are evicted above `max_total_bytes`
+    """
+
+    def __init__(self, default_ttl_seconds: int, max_entry_bytes: int, max_total_bytes: int):
+        self.default_ttl_seconds = default_ttl_seconds
+        self.max_entry_bytes = max_entry_bytes
+        self.max_total_bytes = max_total_bytes
+
+        self._lock = threading.Lock()
+        # (fingerprint, sql) → (result, size_bytes, created_at)
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[Dict[str, Any], int, float]]" = OrderedDict()
+        self._total_bytes = 0
+        self._session_ttl: Dict[str, int] = {}
+        self._stats = {"hits": 0, "misses": 0, "bytes_saved": 0, "too_large": 0, "evicted": 0}
+
+    # --------------------------------------------------------
+    # ⏳ Per-session TTL
+    # --------------------------------------------------------
+    def set_session_ttl(self, session_id: str, ttl_seconds: Optional[int]) -> None:
+        if ttl_seconds is None:
+            self._session_ttl.pop(session_id, None)
+        else:
+            self._session_ttl[session_id] = max(0, int(ttl_seconds))
+
+    def session_ttl(self, session_id: str) -> int:
+        return self._session_ttl.get(session_id, self.default_ttl_seconds)
+
+    def clear_session(self, session_id: str) -> None:
+        self._session_ttl.pop(session_id, None)
+
+    # --------------------------------------------------------
+    # 📥 Read / 📤 Write
+    # --------------------------------------------------------
+    def get(self, session_id: str, engine: Engine, sql: str) -> Optional[Dict[str, Any]]:
+        ttl = self.session_ttl(session_id)
+        if not RESULT_CACHE_ENABLED or ttl <= 0:
+            return None
+
+        key = (engine_fingerprint(engine), sql.strip())
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or time.time() - entry[2] > ttl:
+                self._stats["misses"] += 1
+                return None
+
+            result, size, _ = entry
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            self._stats["bytes_saved"] += size
+
+        logger.info(
+            f"🧊 Result cache hit | session={session_id} | rows={result['row_count']} | bytes={size}"
+        )
+        return result
+
+    def set(self, session_id: str, engine: Engine, sql: str, result: Dict[str, Any]) -> None:
+        if not RESULT_CACHE_ENABLED or self.session_ttl(session_id) <= 0:
+            return
+
+        size = len(json.dumps(result, separators=(",", ":")).encode("utf-8"))
+        if size > self.max_entry_bytes:
+            self._stats["too_large"] += 1
+            logger.info(f"🧊 Result not cached (too large) | bytes={size}")
+            return
+
+        key = (engine_fingerprint(engine), sql.strip())
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._total_bytes -= previous[1]
+
+            self._entries[key] = (result, size, time.time())
+            self._total_bytes += size
+
+            while self._total_bytes > self.max_total_bytes and self._entries:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._total_bytes -= evicted_size
+                self._stats["evicted"] += 1
+
+    # --------------------------------------------------------
+    # 📈 Observability
+    # --------------------------------------------------------
+    def stats(self) -> Dict[str, Any]:
+        lookups = self._stats["hits"] + self._stats["misses"]
+        return {
+            **self._stats,
+            "enabled": RESULT_CACHE_ENABLED,
+            "entries": len(self._entries),
+            "bytes_cached": self._total_bytes,
+            "hit_ratio": round(self._stats["hits"] / lookups, 4) if lookups else 0.0,
+        }
+
+
+# Singleton instance
+result_cache = QueryResultCache(
+    default_ttl_seconds=RESULT_CACHE_TTL_SECONDS,
+    max_entry_bytes=RESULT_CACHE_MAX_ENTRY_BYTES,
+    max_total_bytes=RESULT_CACHE_MAX_TOTAL_BYTES,
+)
@@ -0,0 +1,124 @@
+# backend/core/db/result_summarizer.py
+
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from backend.utils.logger import logger
+from backend.utils.config import (
+    DB_SUMMARY_ROW_THRESHOLD,
+    DB_SUMMARY_SAMPLE_ROWS,
+    DB_SUMMARY_TOP_K,
+)
+
+
+# ============================================================
+# 📊 RESULT SUMMARIZATION (large results → LLM-sized profile)
+# ============================================================
+#
+# The answer LLM does not need 1,000 raw rows to explain a result. Above
+# DB_SUMMARY_ROW_THRESHOLD it receives per-column statistics plus a small
+# representative sample instead. The frontend still gets the full rows.
+
+# Share of parseable values needed to treat a text column as dates
+_DATETIME_RATIO = 0.9
+
+
+def _round(value: Any) -> Any:
+    if isinstance(value, (float, np.floating)):
+        return round(float(value), 4)
+    if isinstance(value, np.integer):
+        return int(value)
+    return value
+
+
+def _profile_column(series: pd.Series, top_k: int) -> Dict[str, Any]:
+    total = len(series)
+    non_null = series.dropna()
+
+    profile: Dict[str, Any] = {
+        "count": int(non_null.size),
+        "null_ratio": round(1 - non_null.size / total, 4) if total else 0.0,
+    }
+    if non_null.empty:
+        profile["type"] = "empty"
+        return profile
+
+    # Numeric (bools are categories, not numbers)
+    if pd.api.types.is_numeric_dtype(non_null) and not pd.api.types.is_bool_dtype(non_null):
+        profile.update({
+            "type": "numeric",
+            "min": _round(non_null.min()),
+            "max": _round(non_null.max()),
+            "mean": _round(non_null.mean()),
+            "sum": _round(non_null.sum()),
+        })
+        return profile
+
+    values = non_null.astype(str)
+
+    # ISO dates / timestamps (JSON-safe rows carry them as strings)
+    parsed = pd.to_datetime(values, errors="coerce", format="ISO8601")
+    if parsed.notna().mean() >= _DATETIME_RATIO:
+        profile.update({
+            "type": "datetime",
+            "min": parsed.min().isoformat(),
+            "max": parsed.max().isoformat(),
+        })
+        return profile
+
+    counts = values.value_counts()
+    profile.update({
+        "type": "categorical",
+        "distinct": int(counts.size),
+        "top_values": {str(k): int(v) for k, v in counts.head(top_k).items()},
+    })
+    return profile
+
+
+def _sample_rows(rows: List[Dict[str, Any]], sample_size: int) -> List[Dict[str, Any]]:
+    """
+    Deterministic, evenly spread sample (first and last rows included),
+    so ordered results keep their shape and prompts stay cacheable.
+    """
+    if len(rows) <= sample_size:
+        return rows
+
+    indices = np.unique(np.linspace(0, len(rows) - 1, num=sample_size).astype(int))
+    return [rows[i] for i in indices]
+
+
+def summarize_rows(
+    rows: List[Dict[str, Any]],
+    threshold: int = DB_SUMMARY_ROW_THRESHOLD,
+    sample_size: int = DB_SUMMARY_SAMPLE_ROWS,
+    top_k: int = DB_SUMMARY_TOP_K,
+) -> Optional[Dict[str, Any]]:
+    """
+    Return a JSON-safe summary of a large result, or None when the result
+    is small enough to be passed to the LLM unchanged.
+
+    Structure:
+    {
+        "row_count": int,
+        "columns": {"col": {"type": ..., "count": ..., "null_ratio": ..., ...}},
+        "sample_rows": [...]
+    }
+    """
+    if len(rows) <= threshold:
+        return None
+
+    df = pd.DataFrame.from_records(rows)
+
+    summary = {
+        "row_count": len(rows),
+        "columns": {str(col): _profile_column(df[col], top_k) for col in df.columns},
+        "sample_rows": _sample_rows(rows, sample_size),
+    }
+
+    logger.info(
+        f"📊 Result summarized for LLM | rows={len(rows)} | columns={len(df.columns)} | "
+        f"sample={len(summary['sample_rows'])}"
+    )
+    return summary
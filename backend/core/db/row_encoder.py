@@ -0,0 +1,139 @@
+# backend/core/db/row_encoder.py
+
+from typing import Any, Dict, List
+
+from backend.utils.logger import logger
+from backend.utils.config import (
+    DB_PROMPT_ROW_FORMAT,
+    DB_PROMPT_MAX_CELL_CHARS,
+    DB_PROMPT_TOKEN_BUDGET,
+)
+from backend.core.db.schema_renderer import CHARS_PER_TOKEN, estimate_tokens
+
+
+# ============================================================
+# 🧮 COMPACT ROW ENCODER (DB answer prompts)
+# ============================================================
+#
+# Rendering rows with Python repr repeats every column name on every row
+# and spells values as Decimal('12.50') / datetime.datetime(2024, 1, 5, 0, 0).
+# The compact forms carry one header line, then one line per row:
+#
+#   tsv       id<TAB>name<TAB>amount
+#             1<TAB>user_1<TAB>12.50
+#
+#   markdown  | id | name | amount |
+#             | --- | --- | --- |
+#             | 1 | user_1 | 12.50 |
+#
+# Long cells are cut to DB_PROMPT_MAX_CELL_CHARS; rows past the token
+# budget are dropped and counted in a trailing note.
+
+FORMATS = ("tsv", "markdown", "repr")
+
+NULL = "NULL"
+
+_ELLIPSIS = "…"
+
+
+def _cell(value: Any, max_chars: int, fmt: str) -> str:
+    if value is None:
+        text = NULL
+    elif isinstance(value, bool):
+        text = "true" if value else "false"
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        text = f"<{len(value)} bytes>"
+    else:
+        text = str(value)
+
+    # One row per line: separators / newlines inside a value are flattened
+    if fmt == "tsv":
+        text = text.replace("\t", " ")
+    else:
+        text = text.replace("|", "\\|")
+    text = " ".join(text.splitlines())
+
+    if max_chars > 0 and len(text) > max_chars:
+        text = text[: max(1, max_chars - 1)] + _ELLIPSIS
+    return text
+
+
+def _columns(rows: List[Dict[str, Any]]) -> List[str]:
+    """Union of row keys in first-seen order (rows may be ragged)."""
+    seen: Dict[str, None] = {}
+    for row in rows:
+        for key in row:
+            seen.setdefault(key, None)
+    return list(seen)
+
+
+def _line(cells: List[str], fmt: str) -> str:
+    if fmt == "tsv":
+        return "\t".join(cells)
+    return "| " + " | ".join(cells) + " |"
+
+
+def _header(columns: List[str], fmt: str, max_chars: int) -> List[str]:
+    names = [_cell(c, max_chars, fmt) for c in columns]
+    if fmt == "tsv":
+        return [_line(names, fmt)]
+    return [_line(names, fmt), _line(["---"] * len(columns), fmt)]
+
+
+# ============================================================
+# 🧠 PUBLIC API
+# ============================================================
+
+def encode_rows(
+    rows: List[Dict[str, Any]],
+    fmt: str = DB_PROMPT_ROW_FORMAT,
+    max_cell_chars: int = DB_PROMPT_MAX_CELL_CHARS,
+    token_budget: int = DB_PROMPT_TOKEN_BUDGET,
+) -> str:
+    """
+    Render result rows for the answer prompt.
+
+    Formats:
+      - "tsv"      → header line + tab-separated rows (default)
+      - "markdown" → single-header markdown table
+      - "repr"     → legacy str(rows), no truncation or budget applied
+
+    `max_cell_chars` / `token_budget` of 0 disable the respective limit.
+    """
+    if fmt == "repr":
+        return str(rows)
+
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported row format: {fmt}")
+
+    if not rows:
+        return "(no rows)"
+
+    columns = _columns(rows)
+    lines = _header(columns, fmt, max_cell_chars)
+
+    char_budget = token_budget * CHARS_PER_TOKEN if token_budget > 0 else None
+    used = sum(len(line) + 1 for line in lines)
+
+    for index, row in enumerate(rows):
+        line = _line([_cell(row.get(c), max_cell_chars, fmt) for c in columns], fmt)
+
+        # Always keep the first row: a header alone tells the model nothing
+        if index and char_budget is not None and used + len(line) + 1 > char_budget:
+            omitted = len(rows) - index
+            lines.append(f"... {omitted} more rows not shown (prompt budget)")
+            logger.warning(
+                f"✂️ Result rows over budget | budget≈{token_budget} tokens | "
+                f"rendered={index} | omitted={omitted}"
+            )
+            break
+
+        lines.append(line)
+        used += len(line) + 1
+
+    encoded = "\n".join(lines)
+    logger.info(
+        f"🧮 Rows encoded | format={fmt} | rows={len(rows)} | cols={len(columns)} | "
+        f"≈{estimate_tokens(encoded)} tokens"
+    )
+    return encoded
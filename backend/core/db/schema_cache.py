@@ -0,0 +1,170 @@
+# backend/core/db/schema_cache.py
+
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from backend.utils.logger import logger
+from backend.utils.config import (
+    SCHEMA_CACHE_TTL_SECONDS,
+    SCHEMA_FINGERPRINT_INTERVAL_SECONDS,
+)
+from backend.core.db.db_manager import get_db_engine, get_db_type, url_fingerprint
+from backend.core.db.db_types import get_db_dialect
+from backend.core.db.schema_inspector import inspect_schema
+from backend.core.db.schema_selector import warm_schema_index
+
+
+# ============================================================
+# 🗂️ PER-SESSION SCHEMA CACHE
+# ============================================================
+#
+# Full inspection = get_columns + get_pk_constraint + get_foreign_keys for
+# every table (seconds on remote DBs). A dialect fingerprint query is one
+# round-trip, so warm sessions only pay:
+#   - nothing            → within SCHEMA_FINGERPRINT_INTERVAL_SECONDS
+#   - one cheap query    → after that, until the fingerprint changes
+#   - full re-inspection → fingerprint changed, TTL expired or database target changed
+
+# session_id -> {schema, target, fingerprint, loaded_at, checked_at}
+# (target = normalized URL fingerprint, not engine identity: evicted or
+#  shared engines rehydrate without a re-inspection)
+_SCHEMA_CACHE: Dict[str, Dict[str, Any]] = {}
+
+# Per-session locks: background warm-up and requests never inspect twice
+_LOCKS: Dict[str, threading.Lock] = {}
+_LOCKS_GUARD = threading.Lock()
+
+_STATS = {"hits": 0, "fingerprint_checks": 0, "reloads": 0, "invalidations": 0}
+
+
+def _session_lock(session_id: str) -> threading.Lock:
+    with _LOCKS_GUARD:
+        return _LOCKS.setdefault(session_id, threading.Lock())
+
+
+# ============================================================
+# 🔎 CHEAP CHANGE DETECTION
+# ============================================================
+
+def _fingerprint(engine: Engine, db_type: str) -> Optional[str]:
+    """
+    Run the dialect's schema fingerprint query.
+    Returns None when the dialect has none (TTL-only invalidation).
+    """
+    try:
+        sql = get_db_dialect(db_type).get("schema_fingerprint_sql")
+    except ValueError:
+        return None
+
+    if not sql:
+        return None
+
+    try:
+        with engine.connect() as conn:
+            row = conn.execute(text(sql)).fetchone()
+        return "|".join(str(v) for v in row) if row else None
+
+    except Exception as e:
+        logger.warning(f"⚠️ Schema fingerprint failed | db={db_type} | {e}")
+        return None
+
+
+# ============================================================
+# 📦 PUBLIC API
+# ============================================================
+
+def get_cached_schema(session_id: str) -> Dict[str, Any]:
+    """
+    Return the inspected schema for a session (same shape as inspect_schema).
+
+    The returned dict is shared between callers — treat it as read-only.
+    """
+    engine = get_db_engine(session_id)
+    target = url_fingerprint(engine.url)
+    entry = _SCHEMA_CACHE.get(session_id)
+    now = time.time()
+
+    # ⚡ Fast path: fresh entry, fingerprint checked recently
+    if (
+        entry is not None
+        and entry["target"] == target
+        and now - entry["loaded_at"] < SCHEMA_CACHE_TTL_SECONDS
+        and now - entry["checked_at"] < SCHEMA_FINGERPRINT_INTERVAL_SECONDS
+    ):
+        _STATS["hits"] += 1
+        return entry["schema"]
+
+    with _session_lock(session_id):
+        entry = _SCHEMA_CACHE.get(session_id)
+        now = time.time()
+        db_type = get_db_type(session_id)
+
+        if (
+            entry is not None
+            and entry["target"] == target
+            and now - entry["loaded_at"] < SCHEMA_CACHE_TTL_SECONDS
+        ):
+            # Another caller may have refreshed while we waited for the lock
+            if now - entry["checked_at"] < SCHEMA_FINGERPRINT_INTERVAL_SECONDS:
+                _STATS["hits"] += 1
+                return entry["schema"]
+
+            _STATS["fingerprint_checks"] += 1
+            fingerprint = _fingerprint(engine, db_type)
+
+            if fingerprint is not None and fingerprint == entry["fingerprint"]:
+                entry["checked_at"] = now
+                _STATS["hits"] += 1
+                return entry["schema"]
+
+            logger.info(f"🔄 Schema changed or unverifiable | session={session_id}")
+
+        # 🐢 Slow path: full inspection
+        fingerprint = _fingerprint(engine, db_type)
+
+        started = time.perf_counter()
+        schema = inspect_schema(session_id)
+        elapsed_ms = round((time.perf_counter() - started) * 1000, 2)
+
+        _SCHEMA_CACHE[session_id] = {
+            "schema": schema,
+            "target": target,
+            "fingerprint": fingerprint,
+            "loaded_at": now,
+            "checked_at": now,
+        }
+        _STATS["reloads"] += 1
+
+        logger.info(
+            f"🗂️ Schema cached | session={session_id} | "
+            f"tables={len(schema.get('tables', {}))} | inspect={elapsed_ms} ms"
+        )
+        return schema
+
+
+def warm_schema_cache(session_id: str) -> None:
+    """
+    Background warm-up after /db/connect (errors are logged, never raised).
+    Also pre-computes the table descriptor embeddings used for schema pruning.
+    """
+    try:
+        warm_schema_index(get_cached_schema(session_id))
+    except Exception:
+        logger.exception(f"❌ Schema warm-up failed | session={session_id}")
+
+
+def invalidate_schema_cache(session_id: str) -> None:
+    """
+    Drop the cached schema for a session (disconnect / reconnect).
+    """
+    if _SCHEMA_CACHE.pop(session_id, None) is not None:
+        _STATS["invalidations"] += 1
+        logger.info(f"🧹 Schema cache invalidated | session={session_id}")
+
+
+def schema_cache_stats() -> Dict[str, Any]:
+    return {**_STATS, "sessions": len(_SCHEMA_CACHE)}
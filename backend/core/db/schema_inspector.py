@@ -1,13 +1,139 @@
 # backend/core/db/schema_inspector.py
 
-from typing import Dict, Any
-from sqlalchemy import inspect
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Sequence, Tuple
+
+from sqlalchemy import inspect, text
 from sqlalchemy.engine import Engine
 
-from backend.core.db.db_manager import get_db_engine
+from backend.core.db.db_manager import get_db_engine, get_db_type
+from backend.core.db.db_types import DB_DIALECTS
+from backend.utils.config import SCHEMA_REFLECTION_WORKERS
 from backend.utils.logger import logger
 
 
+# ============================================================
+# ⚡ BULK REFLECTION (3 queries for the whole database)
+# ============================================================
+
+def _canonical_type(col_type: str, aliases: Sequence[Tuple[str, str]]) -> str:
+    """
+    Rewrite a catalog type name to the Inspector's spelling
+    (DB_DIALECTS[...]["reflection_type_aliases"]), e.g.
+    CHARACTER VARYING(255) → VARCHAR(255).
+    """
+    for pattern, replacement in aliases:
+        col_type = re.sub(pattern, replacement, col_type)
+    return col_type
+
+
+def _reflect_bulk(
+    engine: Engine,
+    queries: Dict[str, str],
+    type_aliases: Sequence[Tuple[str, str]] = (),
+) -> Dict[str, Any]:
+    """
+    Run the dialect's bulk columns / primary_keys / foreign_keys queries
+    (see DB_DIALECTS[...]["reflection_sql"]) and assemble the schema dict.
+    """
+    tables: Dict[str, Dict[str, Any]] = {}
+
+    with engine.connect() as conn:
+        # Columns → (table, column, type, nullable), ordered by position
+        for table_name, column, col_type, nullable in conn.execute(text(queries["columns"])):
+            table = tables.setdefault(
+                table_name,
+                {"columns": [], "primary_key": [], "foreign_keys": []},
+            )
+            table["columns"].append({
+                "name": column,
+                "type": _canonical_type(col_type, type_aliases),
+                "nullable": bool(nullable),
+            })
+
+        # Primary keys → (table, column), ordered by key position
+        for table_name, column in conn.execute(text(queries["primary_keys"])):
+            if table_name in tables:
+                tables[table_name]["primary_key"].append(column)
+
+        # Foreign keys → (table, column, ref_table, ref_column)
+        fk_rows = conn.execute(text(queries["foreign_keys"])).fetchall()
+
+    for table_name, column, ref_table, ref_column in fk_rows:
+        if table_name not in tables:
+            continue
+
+        # SQLite leaves the target column empty for "REFERENCES t" → t's PK
+        if ref_column is None:
+            ref_pk = tables.get(ref_table, {}).get("primary_key", [])
+            ref_column = ref_pk[0] if ref_pk else None
+
+        tables[table_name]["foreign_keys"].append({
+            "column": column,
+            "ref_table": ref_table,
+            "ref_column": ref_column,
+        })
+
+    return {"tables": dict(sorted(tables.items()))}
+
+
+# ============================================================
+# 🐢 PER-TABLE REFLECTION (fallback, parallel)
+# ============================================================
+
+def _reflect_table(engine: Engine, table_name: str) -> Dict[str, Any]:
+    """
+    Reflect one table through the SQLAlchemy Inspector.
+    Each call uses its own Inspector (they are not thread-safe).
+    """
+    inspector = inspect(engine)
+
+    # Columns
+    columns_info = []
+    for col in inspector.get_columns(table_name):
+        columns_info.append({
+            "name": col["name"],
+            "type": str(col["type"]),
+            "nullable": col["nullable"],
+        })
+
+    # Primary key
+    pk_constraint = inspector.get_pk_constraint(table_name)
+    primary_keys = pk_constraint.get("constrained_columns", [])
+
+    # Foreign keys
+    foreign_keys_info = []
+    for fk in inspector.get_foreign_keys(table_name):
+        for local_col, ref_col in zip(
+            fk.get("constrained_columns", []),
+            fk.get("referred_columns", []),
+        ):
+            foreign_keys_info.append({
+                "column": local_col,
+                "ref_table": fk.get("referred_table"),
+                "ref_column": ref_col,
+            })
+
+    return {
+        "columns": columns_info,
+        "primary_key": primary_keys,
+        "foreign_keys": foreign_keys_info,
+    }
+
+
+def _reflect_parallel(engine: Engine) -> Dict[str, Any]:
+    """
+    Inspector-based reflection, tables fanned out over a small thread pool.
+    """
+    table_names: List[str] = inspect(engine).get_table_names()
+
+    workers = max(1, min(SCHEMA_REFLECTION_WORKERS, len(table_names)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="schema-reflect") as pool:
+        reflected = pool.map(lambda name: _reflect_table(engine, name), table_names)
+        return {"tables": dict(zip(table_names, reflected))}
+
+
 # ============================================================
 # 🧠 DATABASE SCHEMA INSPECTOR
 # ============================================================
@@ -21,6 +147,10 @@ def inspect_schema(session_id: str) -> Dict[str, Any]:
       - NL → SQL generation
       - Debugging / UI display
 
+    Strategy:
+      - Known dialects → bulk reflection (one query each for columns / PKs / FKs)
+      - Unknown dialect, or bulk query failure → parallel per-table Inspector
+
     Structure:
     {
         "tables": {
@@ -44,45 +174,24 @@ def inspect_schema(session_id: str) -> Dict[str, Any]:
     logger.info(f"🔍 Inspecting DB schema for session {session_id}")
 
     engine: Engine = get_db_engine(session_id)
-    inspector = inspect(engine)
+    db_type = get_db_type(session_id)
 
-    schema: Dict[str, Any] = {"tables": {}}
+    dialect = DB_DIALECTS.get(db_type, {})
+    queries = dialect.get("reflection_sql")
+    schema = None
 
-    for table_name in inspector.get_table_names():
-        logger.info(f"📄 Found table: {table_name}")
+    if queries:
+        try:
+            schema = _reflect_bulk(engine, queries, dialect.get("reflection_type_aliases", ()))
+        except Exception as e:
+            logger.warning(f"⚠️ Bulk reflection failed, using Inspector | db={db_type} | {e}")
 
-        # Columns
-        columns_info = []
-        for col in inspector.get_columns(table_name):
-            columns_info.append({
-                "name": col["name"],
-                "type": str(col["type"]),
-                "nullable": col["nullable"],
-            })
-
-        # Primary key
-        pk_constraint = inspector.get_pk_constraint(table_name)
-        primary_keys = pk_constraint.get("constrained_columns", [])
-
-        # Foreign keys
-        foreign_keys_info = []
-        for fk in inspector.get_foreign_keys(table_name):
-            for local_col, ref_col in zip(
-                fk.get("constrained_columns", []),
-                fk.get("referred_columns", []),
-            ):
-                foreign_keys_info.append({
-                    "column": local_col,
-                    "ref_table": fk.get("referred_table"),
-                    "ref_column": ref_col,
-                })
-
-        schema["tables"][table_name] = {
-            "columns": columns_info,
-            "primary_key": primary_keys,
-            "foreign_keys": foreign_keys_info,
-        }
+    if schema is None:
+        schema = _reflect_parallel(engine)
 
-    logger.info(f"✅ Schema inspection completed for session {session_id}")
+    logger.info(
+        f"✅ Schema inspection completed for session {session_id} | "
+        f"tables={len(schema['tables'])}"
+    )
 
-    return schema
\ No newline at end of file
+    return schema
@@ -0,0 +1,173 @@
+# backend/core/db/schema_renderer.py
+
+import hashlib
+import json
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple
+
+from backend.utils.logger import logger
+from backend.utils.config import SQL_SCHEMA_FORMAT, SQL_SCHEMA_TOKEN_BUDGET
+
+
+# ============================================================
+# 🧾 COMPACT SCHEMA RENDERER (NL → SQL prompts)
+# ============================================================
+#
+# JSON with indent=2 spends most of its tokens on whitespace and repeated
+# keys ("name", "type", "nullable", ...). The compact form carries the same
+# information the model needs, one table per line:
+#
+#   orders(id INTEGER PK, user_id INTEGER -> users.id, amount NUMERIC(10, 2))
+#
+# Rendered text is cached per schema version (content hash), so repeated
+# questions against the same database never re-render.
+
+COMPACT_HEADER = "-- table(column TYPE [PK] [-> ref_table.ref_column])"
+
+# Rough chars-per-token ratio for schema text (identifiers + SQL types)
+CHARS_PER_TOKEN = 4
+
+_RENDER_CACHE_SIZE = 64
+
+# Verbose type spellings → shorter equivalents the model understands equally well
+_TYPE_REWRITES: List[Tuple[re.Pattern, str]] = [
+    (re.compile(r"\s+COLLATE\s+\S+", re.IGNORECASE), ""),
+    (re.compile(r"TIMESTAMP(\(\d+\))? WITHOUT TIME ZONE", re.IGNORECASE), r"TIMESTAMP\1"),
+    (re.compile(r"TIMESTAMP(\(\d+\))? WITH TIME ZONE", re.IGNORECASE), r"TIMESTAMPTZ\1"),
+    (re.compile(r"CHARACTER VARYING", re.IGNORECASE), "VARCHAR"),
+    (re.compile(r"DOUBLE PRECISION", re.IGNORECASE), "DOUBLE"),
+]
+
+_cache: "OrderedDict[Tuple[str, str, int], str]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+# ============================================================
+# 🔑 SCHEMA VERSION + TOKEN ESTIMATE
+# ============================================================
+
+def schema_version(schema: Dict[str, Any]) -> str:
+    """
+    Stable content hash of an inspected schema.
+    Any column / key change produces a new version.
+    """
+    raw = json.dumps(schema, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Cheap token estimate (no tokenizer dependency).
+    """
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+# ============================================================
+# 🧱 COMPACT FORMAT
+# ============================================================
+
+def _short_type(type_name: str) -> str:
+    for pattern, replacement in _TYPE_REWRITES:
+        type_name = pattern.sub(replacement, type_name)
+    return type_name.strip()
+
+
+def _render_table(table_name: str, table: Dict[str, Any]) -> str:
+    primary_keys = set(table.get("primary_key", []))
+    references = {
+        fk["column"]: f"{fk['ref_table']}.{fk['ref_column']}"
+        for fk in table.get("foreign_keys", [])
+    }
+
+    columns = []
+    for col in table.get("columns", []):
+        parts = [col["name"], _short_type(col["type"])]
+        if col["name"] in primary_keys:
+            parts.append("PK")
+        if col["name"] in references:
+            parts.append(f"-> {references[col['name']]}")
+        columns.append(" ".join(parts))
+
+    return f"{table_name}({', '.join(columns)})"
+
+
+def _render_compact(schema: Dict[str, Any], token_budget: int) -> str:
+    """
+    One line per table. When the budget is exceeded, the remaining tables
+    are listed by name only so the model still knows they exist
+    (or just counted, if even the names do not fit).
+    """
+    tables = schema.get("tables", {})
+    char_budget = token_budget * CHARS_PER_TOKEN if token_budget > 0 else None
+
+    lines = [COMPACT_HEADER]
+    used = len(COMPACT_HEADER)
+    omitted: List[str] = []
+
+    for table_name, table in tables.items():
+        line = _render_table(table_name, table)
+
+        if omitted or (char_budget is not None and used + len(line) + 1 > char_budget):
+            omitted.append(table_name)
+            continue
+
+        lines.append(line)
+        used += len(line) + 1
+
+    if omitted:
+        names_line = f"-- {len(omitted)} more tables (columns omitted): {', '.join(omitted)}"
+        if used + len(names_line) + 1 > char_budget:
+            names_line = f"-- {len(omitted)} more tables omitted (schema over budget)"
+        lines.append(names_line)
+        logger.warning(
+            f"✂️ Schema over budget | budget≈{token_budget} tokens | "
+            f"rendered={len(tables) - len(omitted)} | names_only={len(omitted)}"
+        )
+
+    return "\n".join(lines)
+
+
+# ============================================================
+# 🧠 PUBLIC API
+# ============================================================
+
+def render_schema(
+    schema: Dict[str, Any],
+    fmt: str = SQL_SCHEMA_FORMAT,
+    token_budget: int = SQL_SCHEMA_TOKEN_BUDGET,
+) -> str:
+    """
+    Render an inspected schema for the SQL generation prompt.
+
+    Formats:
+      - "compact" → table(col TYPE PK, col TYPE -> ref.col) lines (default)
+      - "json"    → legacy json.dumps(schema, indent=2), no budget applied
+    """
+    if fmt == "json":
+        return json.dumps(schema, indent=2)
+
+    if fmt != "compact":
+        raise ValueError(f"Unsupported schema format: {fmt}")
+
+    key = (schema_version(schema), fmt, token_budget)
+
+    with _cache_lock:
+        rendered = _cache.get(key)
+        if rendered is not None:
+            _cache.move_to_end(key)
+            return rendered
+
+    rendered = _render_compact(schema, token_budget)
+
+    with _cache_lock:
+        _cache[key] = rendered
+        while len(_cache) > _RENDER_CACHE_SIZE:
+            _cache.popitem(last=False)
+
+    logger.info(
+        f"🧾 Schema rendered | version={key[0]} | tables={len(schema.get('tables', {}))} | "
+        f"≈{estimate_tokens(rendered)} tokens"
+    )
+    return rendered
@@ -0,0 +1,237 @@
+# backend/core/db/schema_selector.py
+
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Set, Tuple
+
+import numpy as np
+
+from backend.utils.logger import logger
+from backend.utils.config import (
+    SQL_SCHEMA_SELECTION,
+    SQL_SCHEMA_SELECT_MIN_TABLES,
+    SQL_SCHEMA_TOP_K_TABLES,
+    SQL_SCHEMA_MAX_TABLES,
+)
+from backend.core.rag.resource_store import resource_store
+from backend.core.db.schema_renderer import schema_version
+
+
+# ============================================================
+# 🎯 RELEVANCE-PRUNED SCHEMA SELECTION
+# ============================================================
+#
+# Large databases (hundreds of tables) do not fit the SQL prompt. We keep
+# only the subgraph relevant to the question:
+#
+#   1. score every table descriptor against the question
+#      (embeddings when the shared embedding model is loaded,
+#       identifier-overlap otherwise)
+#   2. keep the top-K tables
+#   3. add their FK neighbours (referenced tables first — needed for joins)
+#   4. cap at SQL_SCHEMA_MAX_TABLES
+#
+# Table descriptor embeddings are computed ONCE per schema version.
+
+_INDEX_CACHE_SIZE = 16
+
+# schema version → (table names, normalized descriptor embeddings)
+_INDEX: "OrderedDict[str, Tuple[List[str], np.ndarray]]" = OrderedDict()
+_INDEX_LOCK = threading.Lock()
+
+_STATS = {"queries": 0, "pruned_queries": 0, "tables_pruned_total": 0, "last_tables_pruned": 0}
+
+_WORD = re.compile(r"[A-Za-z][a-z]*|\d+")
+
+
+# ============================================================
+# 🧾 TABLE DESCRIPTORS
+# ============================================================
+
+def _words(text: str) -> Set[str]:
+    """Lowercase words, identifiers split on _ / camelCase, plural 's' dropped."""
+    words = set()
+    for word in _WORD.findall(text):
+        word = word.lower()
+        if len(word) > 3 and word.endswith("s"):
+            word = word[:-1]
+        words.add(word)
+    return words
+
+
+def _describe_table(table_name: str, table: Dict[str, Any]) -> str:
+    columns = ", ".join(col["name"] for col in table.get("columns", []))
+    refs = ", ".join(sorted({fk["ref_table"] for fk in table.get("foreign_keys", [])}))
+
+    descriptor = f"table {table_name}: columns {columns}"
+    if refs:
+        descriptor += f"; references {refs}"
+    return descriptor
+
+
+# ============================================================
+# 🧮 SCORING
+# ============================================================
+
+def _table_index(version: str, schema: Dict[str, Any], model) -> Tuple[List[str], np.ndarray]:
+    with _INDEX_LOCK:
+        cached = _INDEX.get(version)
+        if cached is not None:
+            _INDEX.move_to_end(version)
+            return cached
+
+    tables = schema["tables"]
+    names = list(tables)
+    descriptors = [_describe_table(name, tables[name]) for name in names]
+    embeddings = np.asarray(model.encode(descriptors, normalize_embeddings=True))
+
+    with _INDEX_LOCK:
+        _INDEX[version] = (names, embeddings)
+        while len(_INDEX) > _INDEX_CACHE_SIZE:
+            _INDEX.popitem(last=False)
+
+    logger.info(f"🧮 Schema descriptors embedded | version={version} | tables={len(names)}")
+    return names, embeddings
+
+
+def _score_tables(schema: Dict[str, Any], question: str) -> Tuple[Dict[str, float], str]:
+    """
+    Return ({table: score}, method).
+    """
+    model = resource_store.embedding_model
+
+    if model is not None:
+        names, embeddings = _table_index(schema_version(schema), schema, model)
+        query_vector = np.asarray(model.encode(question, normalize_embeddings=True))
+        scores = embeddings @ query_vector
+        return dict(zip(names, scores.tolist())), "embedding"
+
+    # Lexical fallback: share of question words found in the table descriptor
+    question_words = _words(question)
+    scores = {}
+    for name, table in schema["tables"].items():
+        table_words = _words(_describe_table(name, table))
+        name_words = _words(name)
+        overlap = len(question_words & table_words) + 2 * len(question_words & name_words)
+        scores[name] = overlap / (len(question_words) or 1)
+
+    return scores, "lexical"
+
+
+# ============================================================
+# 🔗 FK NEIGHBOURHOOD
+# ============================================================
+
+def _with_fk_neighbours(
+    schema: Dict[str, Any],
+    seeds: List[str],
+    scores: Dict[str, float],
+    max_tables: int,
+) -> List[str]:
+    tables = schema["tables"]
+    selected = list(seeds)
+    chosen = set(seeds)
+
+    # Referenced tables (outgoing FKs) — required to express joins
+    outgoing = [
+        fk["ref_table"]
+        for name in seeds
+        for fk in tables[name].get("foreign_keys", [])
+        if fk["ref_table"] in tables
+    ]
+
+    # Referencing tables (incoming FKs) — best-scoring first
+    incoming = sorted(
+        (
+            name for name, table in tables.items()
+            if any(fk["ref_table"] in chosen for fk in table.get("foreign_keys", []))
+        ),
+        key=lambda name: scores.get(name, 0.0),
+        reverse=True,
+    )
+
+    for name in outgoing + incoming:
+        if len(selected) >= max_tables:
+            break
+        if name not in chosen:
+            selected.append(name)
+            chosen.add(name)
+
+    return selected
+
+
+# ============================================================
+# 🧠 PUBLIC API
+# ============================================================
+
+def select_relevant_schema(
+    schema: Dict[str, Any],
+    question: str,
+    top_k: int = SQL_SCHEMA_TOP_K_TABLES,
+    max_tables: int = SQL_SCHEMA_MAX_TABLES,
+) -> Dict[str, Any]:
+    """
+    Return the sub-schema (same shape) relevant to the question.
+
+    Small schemas (< SQL_SCHEMA_SELECT_MIN_TABLES) and a disabled
+    SQL_SCHEMA_SELECTION flag return the schema unchanged.
+    """
+    tables = schema.get("tables", {})
+    _STATS["queries"] += 1
+
+    if not SQL_SCHEMA_SELECTION or len(tables) < SQL_SCHEMA_SELECT_MIN_TABLES:
+        _STATS["last_tables_pruned"] = 0
+        return schema
+
+    scores, method = _score_tables(schema, question)
+    ranked = sorted(tables, key=lambda name: scores[name], reverse=True)[:top_k]
+    seeds = [name for name in ranked if scores[name] > 0]
+
+    # Nothing matched at all → let the renderer's token budget handle it
+    if not seeds:
+        _STATS["last_tables_pruned"] = 0
+        logger.info(f"🎯 Schema not pruned | method={method} | no relevant tables found")
+        return schema
+
+    selected = _with_fk_neighbours(schema, seeds, scores, max(max_tables, top_k))
+
+    # Keep the original table order (stable prompts → better cache hits)
+    keep = set(selected)
+    sub_schema = {"tables": {name: t for name, t in tables.items() if name in keep}}
+
+    pruned = len(tables) - len(keep)
+    _STATS["pruned_queries"] += 1
+    _STATS["tables_pruned_total"] += pruned
+    _STATS["last_tables_pruned"] = pruned
+
+    logger.info(
+        f"🎯 Schema pruned | method={method} | tables={len(tables)} → {len(keep)} | "
+        f"pruned={pruned} | top={seeds[:5]}"
+    )
+    return sub_schema
+
+
+def warm_schema_index(schema: Dict[str, Any]) -> None:
+    """
+    Pre-compute descriptor embeddings for a schema version (no-op without
+    the embedding model or for small schemas).
+    """
+    model = resource_store.embedding_model
+    if (
+        model is None
+        or not SQL_SCHEMA_SELECTION
+        or len(schema.get("tables", {})) < SQL_SCHEMA_SELECT_MIN_TABLES
+    ):
+        return
+    _table_index(schema_version(schema), schema, model)
+
+
+def schema_selection_stats() -> Dict[str, Any]:
+    pruned_queries = _STATS["pruned_queries"]
+    return {
+        **_STATS,
+        "avg_tables_pruned": (
+            round(_STATS["tables_pruned_total"] / pruned_queries, 2) if pruned_queries else 0.0
+        ),
+    }
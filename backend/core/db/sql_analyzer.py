@@ -0,0 +1,230 @@
+# backend/core/db/sql_analyzer.py
+
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Optional, Set, Tuple, TypedDict
+
+import sqlglot
+from sqlglot import exp
+from sqlglot.errors import SqlglotError
+
+from backend.core.db.db_types import DB_DIALECTS
+from backend.core.db.sql_validator import UnsafeSQLError, validate_read_only_sql
+
+
+# ============================================================
+# 🌳 AST-BASED SQL ANALYSIS (sqlglot, no database round-trip)
+# ============================================================
+#
+# Generated SQL is parsed once locally, then:
+#   - safety  → exactly one query statement, no DML / DDL anywhere
+#               (writable CTEs, SELECT INTO, FOR UPDATE included)
+#   - tables  → real tables only (CTE names, table functions skipped)
+#   - columns → qualified columns resolved through table aliases
+#   - schema  → unknown tables / columns rejected before execution
+#   - cache   → canonical SQL text (whitespace / keyword case) as cache key
+#
+# Everything schema-independent is cached per (sql, dialect), so SQL
+# served from the NL → SQL cache is re-checked with a few set lookups.
+
+class InvalidSQLError(ValueError):
+    """Raised when SQL does not parse or references unknown tables / columns."""
+
+    def __init__(self, message: str, unknown_tables: Optional[List[str]] = None,
+                 unknown_columns: Optional[List[str]] = None):
+        super().__init__(message)
+        self.unknown_tables = unknown_tables or []
+        self.unknown_columns = unknown_columns or []
+
+
+class SQLAnalysis(TypedDict):
+    sql: str                 # validated SQL (what runs)
+    normalized: str          # canonical form (cache keys)
+    tables: List[str]        # base tables referenced
+    columns: List[str]       # "table.column" when resolved, else "column"
+
+
+class _QueryFacts(NamedTuple):
+    normalized: str
+    tables: Tuple[Tuple[str, str, str], ...]     # (schema, name, alias or name)
+    columns: Tuple[Tuple[str, str], ...]         # (qualifier, name)
+    output_aliases: FrozenSet[str]
+    derived_sources: bool                        # CTEs / subqueries / table functions
+
+
+_WRITE_NODES = (
+    exp.Insert, exp.Update, exp.Delete, exp.Merge, exp.Drop,
+    exp.Create, exp.Alter, exp.Command, exp.Into, exp.Lock,
+)
+
+# Schemas the reflected (default-schema) table names live in
+_DEFAULT_SCHEMAS = {"", "public", "main", "dbo"}
+
+
+def sqlglot_dialect(db_type: Optional[str]) -> Optional[str]:
+    return DB_DIALECTS.get(db_type or "", {}).get("sqlglot_dialect")
+
+
+# ============================================================
+# 🔍 PARSE + FACTS (cached, schema-independent)
+# ============================================================
+
+def _base_tables(tree: exp.Expression) -> List[exp.Table]:
+    """Table nodes that name stored tables (not CTEs / table functions)."""
+    ctes = {cte.alias_or_name.lower() for cte in tree.find_all(exp.CTE)}
+    return [
+        table for table in tree.find_all(exp.Table)
+        if isinstance(table.this, exp.Identifier)
+        and (table.db or table.name.lower() not in ctes)
+    ]
+
+
+def _has_derived_sources(tree: exp.Expression) -> bool:
+    """CTEs, FROM / JOIN subqueries, table functions: columns not in the schema."""
+    if any(True for _ in tree.find_all(exp.CTE, exp.Unnest, exp.Lateral)):
+        return True
+    if any(not isinstance(t.this, exp.Identifier) for t in tree.find_all(exp.Table)):
+        return True
+    return any(isinstance(sub.parent, (exp.From, exp.Join)) for sub in tree.find_all(exp.Subquery))
+
+
+@lru_cache(maxsize=512)
+def _query_facts(sql: str, dialect: Optional[str]) -> _QueryFacts:
+    """
+    Parse `sql` and enforce a single read-only query.
+    Raises UnsafeSQLError / InvalidSQLError (exceptions are not cached).
+    """
+    try:
+        statements = [s for s in sqlglot.parse(sql, read=dialect) if s is not None]
+    except SqlglotError as e:
+        raise InvalidSQLError(f"SQL does not parse: {str(e).splitlines()[0]}") from e
+
+    if len(statements) != 1:
+        raise UnsafeSQLError("Multiple statements are not allowed")
+
+    tree = statements[0]
+    if not isinstance(tree, exp.Query):
+        raise UnsafeSQLError("Only SELECT queries are allowed")
+
+    write = next(tree.find_all(*_WRITE_NODES), None)
+    if write is not None:
+        raise UnsafeSQLError(f"Forbidden clause: {write.key.upper()}")
+
+    return _QueryFacts(
+        normalized=tree.sql(dialect=dialect),
+        tables=tuple((t.db, t.name, t.alias_or_name) for t in _base_tables(tree)),
+        columns=tuple(
+            (c.table, c.name) for c in tree.find_all(exp.Column)
+            if not isinstance(c.this, exp.Star)
+        ),
+        output_aliases=frozenset(a.alias.lower() for a in tree.find_all(exp.Alias)),
+        derived_sources=_has_derived_sources(tree),
+    )
+
+
+def _table_name(db: str, name: str) -> str:
+    return f"{db}.{name}" if db else name
+
+
+# ============================================================
+# 🗂️ SCHEMA CHECK
+# ============================================================
+
+def _check_schema(facts: _QueryFacts, schema: Dict[str, Any]) -> None:
+    """
+    Reject references the database would reject anyway. Anything that
+    cannot be resolved with certainty (other schemas, derived columns,
+    output aliases) is left to the database.
+    """
+    known = {
+        name.lower(): {c["name"].lower() for c in table.get("columns", [])}
+        for name, table in schema.get("tables", {}).items()
+    }
+
+    unknown_tables: Set[str] = set()
+    alias_columns: Dict[str, Set[str]] = {}   # alias / table name → columns
+    in_scope: Set[str] = set()                # columns of every referenced table
+    unverifiable = False                      # table outside the reflected schema
+
+    for db, name, alias in facts.tables:
+        if db.lower() not in _DEFAULT_SCHEMAS:
+            unverifiable = True
+            continue
+        columns = known.get(name.lower())
+        if columns is None:
+            unknown_tables.add(_table_name(db, name))
+            continue
+        alias_columns[alias.lower()] = columns
+        alias_columns[name.lower()] = columns
+        in_scope |= columns
+
+    if unknown_tables:
+        raise InvalidSQLError(
+            f"Unknown table(s): {', '.join(sorted(unknown_tables))}",
+            unknown_tables=sorted(unknown_tables),
+        )
+
+    check_unqualified = not unverifiable and not facts.derived_sources
+    unknown_columns: Set[str] = set()
+
+    for qualifier, name in facts.columns:
+        if qualifier:
+            columns = alias_columns.get(qualifier.lower())
+            if columns is not None and name.lower() not in columns:
+                unknown_columns.add(f"{qualifier}.{name}")
+        elif (
+            check_unqualified
+            and name.lower() not in in_scope
+            and name.lower() not in facts.output_aliases
+        ):
+            unknown_columns.add(name)
+
+    if unknown_columns:
+        raise InvalidSQLError(
+            f"Unknown column(s): {', '.join(sorted(unknown_columns))}",
+            unknown_columns=sorted(unknown_columns),
+        )
+
+
+# ============================================================
+# 🧠 PUBLIC API
+# ============================================================
+
+def analyze_sql(sql: str, db_type: Optional[str], schema: Optional[Dict[str, Any]] = None) -> SQLAnalysis:
+    """
+    Validate and analyze one generated query.
+
+    Raises:
+        UnsafeSQLError  → not a single read-only query
+        InvalidSQLError → does not parse, or (with `schema`) references
+                          tables / columns the database does not have
+    """
+    sql = validate_read_only_sql(sql)  # cheap keyword gate + trailing ';'
+    facts = _query_facts(sql, sqlglot_dialect(db_type))
+
+    if schema and schema.get("tables"):
+        _check_schema(facts, schema)
+
+    aliases = {alias.lower(): name for _, name, alias in facts.tables}
+    columns = {
+        f"{aliases[q.lower()]}.{name}" if q and q.lower() in aliases else name
+        for q, name in facts.columns
+    }
+
+    return {
+        "sql": sql,
+        "normalized": facts.normalized,
+        "tables": sorted({_table_name(db, name) for db, name, _ in facts.tables}),
+        "columns": sorted(columns),
+    }
+
+
+def extract_tables(sql: str, db_type: Optional[str]) -> List[str]:
+    """
+    Base tables referenced by `sql` ([] if it is not a single read-only query).
+    """
+    try:
+        facts = _query_facts(sql.strip().rstrip(";").rstrip(), sqlglot_dialect(db_type))
+    except (UnsafeSQLError, InvalidSQLError):
+        return []
+
+    return sorted({_table_name(db, name) for db, name, _ in facts.tables})
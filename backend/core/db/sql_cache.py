@@ -0,0 +1,350 @@
+# backend/core/db/sql_cache.py
+
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from backend.utils.logger import logger
+from backend.utils.config import (
+    CACHE_DIR,
+    SQL_CACHE_ENABLED,
+    SQL_CACHE_TTL_SECONDS,
+    SQL_CACHE_MAX_ENTRIES,
+    SQL_CACHE_SIMILARITY_THRESHOLD,
+)
+from backend.core.rag.resource_store import resource_store
+
+
+# ============================================================
+# 💾 PERSISTENT NL → SQL CACHE (SQLite)
+# ============================================================
+
+_TOKEN = re.compile(r"\d+(?:\.\d+)?|\w+")
+
+# Words that never change which SQL a question needs
+_STOPWORDS = frozenset(
+    "a an the of in on at for to by with from and is are was were be been there "
+    "what which who whom me my our i we you please show list give get find tell "
+    "do does did can could would all".split()
+)
+
+
+def normalize_question(question: str) -> str:
+    """Lowercase, collapse whitespace, drop trailing punctuation."""
+    return " ".join(question.lower().split()).rstrip("?.! ")
+
+
+def content_tokens(question: str) -> frozenset:
+    """
+    Words that carry meaning (entities, filters, numbers), plural "s" folded.
+    "orders shipped in March" and "orders cancelled in March" differ here
+    even though their embeddings are nearly identical.
+    """
+    tokens = set()
+    for token in _TOKEN.findall(normalize_question(question)):
+        if token in _STOPWORDS:
+            continue
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.add(token)
+    return frozenset(tokens)
+
+
+class NLSQLCache:
+    """
+    Cache of generated SQL payloads, persisted in a local SQLite file.
+
+    Key   → sha256(schema fingerprint | db_type | normalized question)
+    Value → SQL payload (sql, db_type, tables_used, confidence)
+
+    Lookup:
+      1. exact match on the key
+      2. nearest neighbour on question embeddings within the same
+         (fingerprint, db_type), accepted only when cosine similarity
+         ≥ `similarity_threshold` AND both questions have the same content
+         tokens (numbers, entities, filter words: "top 5" never reuses
+         "top 10", "shipped" never reuses "cancelled")
+
+    Only SQL that executed successfully is written (by the executor), and
+    a hit whose SQL then fails is deleted. Returned payloads carry their
+    entry's "cache_key" for that purpose.
+    """
+
+    PURGE_EVERY = 50
+
+    def __init__(
+        self,
+        db_path: Path,
+        ttl_seconds: int,
+        max_entries: int,
+        similarity_threshold: float,
+    ):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._writes = 0
+        self._stats = {
+            "exact_hits": 0, "semantic_hits": 0, "misses": 0,
+            "writes": 0, "invalidated": 0, "evicted": 0,
+        }
+
+        # (fingerprint, db_type) → (keys, questions, normalized embeddings)
+        self._vectors: Dict[Tuple[str, str], Tuple[List[str], List[str], np.ndarray]] = {}
+
+    # --------------------------------------------------------
+    # 🔌 Lazy connection (file created on first use)
+    # --------------------------------------------------------
+    def _get_conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS sql_cache (
+                    key           TEXT PRIMARY KEY,
+                    fingerprint   TEXT NOT NULL,
+                    db_type       TEXT NOT NULL,
+                    question      TEXT NOT NULL,
+                    embedding     BLOB,
+                    payload       TEXT NOT NULL,
+                    created_at    REAL NOT NULL,
+                    last_accessed REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_sql_cache_scope ON sql_cache(fingerprint, db_type)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_sql_cache_accessed ON sql_cache(last_accessed)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def make_key(fingerprint: str, db_type: str, question: str) -> str:
+        raw = f"{fingerprint}\x1f{db_type}\x1f{normalize_question(question)}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _embed(question: str) -> Optional[np.ndarray]:
+        model = resource_store.embedding_model
+        if model is None:
+            return None
+        vector = model.encode(normalize_question(question), normalize_embeddings=True)
+        return np.asarray(vector, dtype=np.float32)
+
+    # --------------------------------------------------------
+    # 🧭 Nearest-neighbour index (per fingerprint + db_type)
+    # --------------------------------------------------------
+    def _load_vectors(self, conn: sqlite3.Connection, scope: Tuple[str, str]):
+        vectors = self._vectors.get(scope)
+        if vectors is not None:
+            return vectors
+
+        rows = conn.execute(
+            """
+            SELECT key, question, embedding FROM sql_cache
+            WHERE fingerprint = ? AND db_type = ? AND embedding IS NOT NULL AND created_at >= ?
+            """,
+            (*scope, time.time() - self.ttl_seconds),
+        ).fetchall()
+
+        keys = [r[0] for r in rows]
+        questions = [r[1] for r in rows]
+        matrix = (
+            np.vstack([np.frombuffer(r[2], dtype=np.float32) for r in rows])
+            if rows else np.empty((0, 0), dtype=np.float32)
+        )
+
+        vectors = (keys, questions, matrix)
+        self._vectors[scope] = vectors
+        return vectors
+
+    def _nearest(
+        self,
+        conn: sqlite3.Connection,
+        scope: Tuple[str, str],
+        question: str,
+        vector: np.ndarray,
+    ) -> Optional[Tuple[str, float]]:
+        keys, questions, matrix = self._load_vectors(conn, scope)
+        if not keys:
+            return None
+
+        similarities = matrix @ vector
+        best = int(np.argmax(similarities))
+        similarity = float(similarities[best])
+
+        if similarity < self.similarity_threshold:
+            return None
+        if content_tokens(questions[best]) != content_tokens(question):
+            return None
+
+        return keys[best], similarity
+
+    # --------------------------------------------------------
+    # 📥 Read / 📤 Write
+    # --------------------------------------------------------
+    def get(self, fingerprint: str, db_type: str, question: str) -> Optional[Dict[str, Any]]:
+        if not SQL_CACHE_ENABLED:
+            return None
+
+        try:
+            # 1️⃣ Exact match
+            key = self.make_key(fingerprint, db_type, question)
+            payload = self._read(key)
+            if payload is not None:
+                self._stats["exact_hits"] += 1
+                logger.info(f"💾 NL→SQL cache hit | exact | db={db_type}")
+                return payload
+
+            # 2️⃣ Nearest neighbour (embedding computed outside the lock)
+            vector = self._embed(question)
+            if vector is not None:
+                with self._lock:
+                    match = self._nearest(self._get_conn(), (fingerprint, db_type), question, vector)
+
+                if match is not None:
+                    payload = self._read(match[0])
+                    if payload is not None:
+                        self._stats["semantic_hits"] += 1
+                        logger.info(
+                            f"💾 NL→SQL cache hit | semantic ({match[1]:.3f}) | db={db_type}"
+                        )
+                        return payload
+
+            self._stats["misses"] += 1
+            return None
+
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ NL→SQL cache read failed: {e}")
+            return None
+
+    def _read(self, key: str) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        with self._lock:
+            conn = self._get_conn()
+            row = conn.execute(
+                "SELECT payload, created_at FROM sql_cache WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None or now - row[1] > self.ttl_seconds:
+                return None
+
+            conn.execute("UPDATE sql_cache SET last_accessed = ? WHERE key = ?", (now, key))
+            conn.commit()
+
+        return {**json.loads(row[0]), "cache_key": key}
+
+    def set(self, fingerprint: str, db_type: str, question: str, payload: Dict[str, Any]) -> None:
+        if not SQL_CACHE_ENABLED:
+            return
+
+        key = self.make_key(fingerprint, db_type, question)
+        normalized = normalize_question(question)
+        vector = self._embed(question)
+        now = time.time()
+
+        try:
+            with self._lock:
+                conn = self._get_conn()
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO sql_cache
+                        (key, fingerprint, db_type, question, embedding,
+                         payload, created_at, last_accessed)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        key, fingerprint, db_type, normalized,
+                        vector.tobytes() if vector is not None else None,
+                        json.dumps({k: v for k, v in payload.items() if k != "cache_key"}),
+                        now, now,
+                    ),
+                )
+                conn.commit()
+                self._stats["writes"] += 1
+
+                # Rebuilt lazily on the next nearest-neighbour lookup
+                self._vectors.pop((fingerprint, db_type), None)
+
+                self._writes += 1
+                if self._writes % self.PURGE_EVERY == 0:
+                    self._purge(conn, now)
+
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ NL→SQL cache write failed: {e}")
+
+    def delete(self, key: str) -> None:
+        """Drop one entry (cached SQL that failed when it was reused)."""
+        try:
+            with self._lock:
+                conn = self._get_conn()
+                deleted = conn.execute("DELETE FROM sql_cache WHERE key = ?", (key,)).rowcount
+                conn.commit()
+                if deleted:
+                    self._stats["invalidated"] += 1
+                    self._vectors.clear()
+                    logger.info("🗑️ NL→SQL cache entry invalidated (SQL failed on reuse)")
+
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ NL→SQL cache delete failed: {e}")
+
+    def _purge(self, conn: sqlite3.Connection, now: float) -> None:
+        """Drop expired rows, then trim least-recently-used rows above max_entries."""
+        expired = conn.execute(
+            "DELETE FROM sql_cache WHERE created_at < ?", (now - self.ttl_seconds,)
+        ).rowcount
+
+        overflow = conn.execute(
+            """
+            DELETE FROM sql_cache WHERE key IN (
+                SELECT key FROM sql_cache
+                ORDER BY last_accessed DESC
+                LIMIT -1 OFFSET ?
+            )
+            """,
+            (self.max_entries,),
+        ).rowcount
+        conn.commit()
+
+        evicted = expired + overflow
+        if evicted:
+            self._stats["evicted"] += evicted
+            self._vectors.clear()
+            logger.info(f"🧹 NL→SQL cache purge | expired={expired} | lru_evicted={overflow}")
+
+    # --------------------------------------------------------
+    # 📈 Observability
+    # --------------------------------------------------------
+    def stats(self) -> Dict[str, Any]:
+        hits = self._stats["exact_hits"] + self._stats["semantic_hits"]
+        lookups = hits + self._stats["misses"]
+        return {
+            **self._stats,
+            "enabled": SQL_CACHE_ENABLED,
+            "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+# Singleton instance
+sql_cache = NLSQLCache(
+    db_path=CACHE_DIR / "sql_cache.sqlite3",
+    ttl_seconds=SQL_CACHE_TTL_SECONDS,
+    max_entries=SQL_CACHE_MAX_ENTRIES,
+    similarity_threshold=SQL_CACHE_SIMILARITY_THRESHOLD,
+)
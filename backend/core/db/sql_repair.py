@@ -0,0 +1,333 @@
+# backend/core/db/sql_repair.py
+
+import asyncio
+import re
+from difflib import get_close_matches
+from time import monotonic
+from typing import Any, Dict, List, Optional, Tuple
+
+import sqlglot
+from sqlglot import exp
+from sqlglot.errors import SqlglotError
+from sqlalchemy.exc import DBAPIError
+
+from backend.utils.config import SQL_REPAIR_LLM_TIMEOUT_SECONDS
+from backend.utils.logger import logger
+from backend.core.db.db_types import DB_DIALECTS
+from backend.core.db.db_query_generator import arepair_sql_query
+from backend.core.db.sql_analyzer import sqlglot_dialect
+
+
+# ============================================================
+# 🩹 FAILED SQL RECOVERY (cheap local fixes first)
+# ============================================================
+#
+# Stages, in order, each tried at most once per query:
+#   1. transpile → read as another dialect, write the target dialect
+#                  (ILIKE on SQLite, backticks on Postgres, LIMIT a, b ...)
+#   2. schema    → identifiers matched against the cached schema:
+#                  exact case (+ quoting), close typos, ambiguous join keys
+#   3. llm       → ONE bounded repair call with the database error
+#
+# Every candidate goes through the same analyzer + executor as generated
+# SQL; stages that produce no (new) candidate are skipped.
+
+STAGES = ("transpile", "schema", "llm")
+
+_STATS: Dict[str, Dict[str, float]] = {
+    stage: {"attempts": 0, "fixed": 0, "no_candidate": 0, "total_ms": 0.0}
+    for stage in STAGES
+}
+
+# Typo tolerance for identifier repair (difflib ratio)
+_CLOSE_MATCH_CUTOFF = 0.75
+
+_PLAIN_IDENTIFIER = re.compile(r"^[a-z_][a-z0-9_]*$")
+
+
+def error_message(error: Exception) -> str:
+    """The database's own message (first lines), without SQLAlchemy framing."""
+    message = str(error.orig if isinstance(error, DBAPIError) else error)
+    return message.strip()[:500]
+
+
+# ============================================================
+# 1️⃣ DIALECT TRANSPILATION
+# ============================================================
+
+def _shape(sql: str) -> str:
+    return " ".join(sql.split()).upper()
+
+
+def transpile_repair(sql: str, db_type: str) -> Optional[str]:
+    """
+    Rewrite the query into `db_type`'s dialect: read as the target dialect
+    first (sqlglot maps e.g. ILIKE for SQLite), then as every other one.
+    Returns the first rendering that actually changes the query, or None.
+    """
+    target = sqlglot_dialect(db_type)
+    if not target:
+        return None
+
+    sources = [target] + [
+        spec["sqlglot_dialect"] for spec in DB_DIALECTS.values()
+        if spec.get("sqlglot_dialect") not in (None, target)
+    ]
+
+    for source in sources:
+        try:
+            candidate = sqlglot.transpile(sql, read=source, write=target)[0]
+        except SqlglotError:
+            continue
+        if _shape(candidate) != _shape(sql):
+            return candidate
+
+    return None
+
+
+# ============================================================
+# 2️⃣ SCHEMA-AWARE IDENTIFIER REPAIR
+# ============================================================
+
+def _identifier(name: str) -> exp.Identifier:
+    # Quote anything a case-folding database would otherwise rewrite
+    return exp.to_identifier(name, quoted=not _PLAIN_IDENTIFIER.match(name))
+
+
+def _resolve(name: str, known: Dict[str, str]) -> Optional[str]:
+    """Exact schema spelling for `name` (case-insensitive, then close typo)."""
+    exact = known.get(name.lower())
+    if exact is not None:
+        return exact
+    match = get_close_matches(name.lower(), known.keys(), n=1, cutoff=_CLOSE_MATCH_CUTOFF)
+    return known[match[0]] if match else None
+
+
+def _conjuncts(condition: exp.Expression):
+    condition = condition.unnest()
+    if isinstance(condition, exp.And):
+        yield from _conjuncts(condition.left)
+        yield from _conjuncts(condition.right)
+    else:
+        yield condition
+
+
+def _joined_on(tree: exp.Expression, name: str, references: set) -> bool:
+    """
+    True when every table in `references` is equi-joined to the others on
+    column `name` (a.user_id = b.user_id), so any of them gives the same
+    value. RIGHT / FULL joins can null the FROM side: never true there.
+    """
+    edges: Dict[str, set] = {}
+    for join in tree.find_all(exp.Join):
+        if join.side.upper() in ("RIGHT", "FULL"):
+            return False
+        condition = join.args.get("on")
+        if condition is None:
+            continue
+        for predicate in _conjuncts(condition):
+            if not isinstance(predicate, exp.EQ):
+                continue
+            left, right = predicate.left, predicate.right
+            if not (isinstance(left, exp.Column) and isinstance(right, exp.Column)):
+                continue
+            if left.name.lower() != name or right.name.lower() != name:
+                continue
+            a, b = left.table.lower(), right.table.lower()
+            edges.setdefault(a, set()).add(b)
+            edges.setdefault(b, set()).add(a)
+
+    start = next(iter(references))
+    reached, frontier = {start}, [start]
+    while frontier:
+        for neighbour in edges.get(frontier.pop(), ()):
+            if neighbour not in reached:
+                reached.add(neighbour)
+                frontier.append(neighbour)
+    return references <= reached
+
+
+def schema_repair(sql: str, db_type: str, schema: Dict[str, Any], error: str) -> Optional[str]:
+    """
+    Align table / column identifiers with the cached schema. Returns None
+    when nothing needed changing.
+    """
+    tables = schema.get("tables", {})
+    if not tables:
+        return None
+
+    try:
+        tree = sqlglot.parse_one(sql, read=sqlglot_dialect(db_type))
+    except SqlglotError:
+        return None
+
+    known_tables = {name.lower(): name for name in tables}
+    known_columns = {
+        name: {c["name"].lower(): c["name"] for c in table.get("columns", [])}
+        for name, table in tables.items()
+    }
+
+    ctes = {cte.alias_or_name.lower() for cte in tree.find_all(exp.CTE)}
+    output_aliases = {a.alias.lower() for a in tree.find_all(exp.Alias)}
+    derived = any(True for _ in tree.find_all(exp.CTE, exp.Subquery, exp.Unnest, exp.Lateral))
+    changed = False
+
+    # Tables (in FROM / JOIN order) → (reference used by columns, schema name)
+    scope: List[Tuple[str, str]] = []
+    by_reference: Dict[str, str] = {}
+
+    for table in list(tree.find_all(exp.Table)):
+        if not isinstance(table.this, exp.Identifier) or table.db:
+            continue
+        if table.name.lower() in ctes:
+            continue
+
+        original = table.name
+        exact = _resolve(original, known_tables)
+        if exact is None:
+            continue
+
+        if exact != original:
+            table.set("this", _identifier(exact))
+            changed = True
+
+        reference = table.alias or exact
+        scope.append((reference, exact))
+        by_reference[reference.lower()] = exact
+        by_reference[original.lower()] = exact
+
+    ambiguous_error = "ambiguous" in error.lower()
+
+    for column in list(tree.find_all(exp.Column)):
+        if isinstance(column.this, exp.Star):
+            continue
+
+        name = column.name
+        qualifier = column.table
+
+        if qualifier:
+            table_name = by_reference.get(qualifier.lower())
+            if table_name is None:
+                continue
+            exact = _resolve(name, known_columns[table_name])
+        else:
+            if derived or name.lower() in output_aliases:
+                continue
+            owners = [
+                (reference, table_name) for reference, table_name in scope
+                if name.lower() in known_columns[table_name]
+            ]
+            if ambiguous_error and len(owners) > 1:
+                # Only a shared join key has one meaning: qualify it with the
+                # first (FROM) table. Anything else is a guess → LLM stage.
+                if not _joined_on(tree, name.lower(), {r.lower() for r, _ in owners}):
+                    return None
+                column.set("table", _identifier(owners[0][0]))
+                changed = True
+
+            in_scope: Dict[str, str] = {}
+            for _, table_name in scope:
+                in_scope.update(known_columns[table_name])
+            exact = _resolve(name, in_scope)
+
+        if exact is not None and exact != name:
+            column.set("this", _identifier(exact))
+            changed = True
+
+    return tree.sql(dialect=sqlglot_dialect(db_type)) if changed else None
+
+
+# ============================================================
+# 🧭 PER-QUERY REPAIR SESSION
+# ============================================================
+
+class SQLRepairer:
+    """
+    Proposes repaired SQL for one question, stage by stage. The executor
+    runs each proposal and reports back with `resolve`.
+    """
+
+    def __init__(self, question: str, db_type: str, schema: Dict[str, Any]):
+        self.question = question
+        self.db_type = db_type
+        self.schema = schema
+        self.attempts: List[Dict[str, Any]] = []
+        self._pending = list(STAGES)
+        self._tried: set = set()
+        self._open: Optional[Dict[str, Any]] = None
+
+    async def _candidate(self, stage: str, sql: str, error: str) -> Optional[str]:
+        if stage == "transpile":
+            return await asyncio.to_thread(transpile_repair, sql, self.db_type)
+        if stage == "schema":
+            return await asyncio.to_thread(schema_repair, sql, self.db_type, self.schema, error)
+
+        try:
+            return await arepair_sql_query(
+                self.question, sql, error, self.db_type, self.schema,
+                timeout=SQL_REPAIR_LLM_TIMEOUT_SECONDS,
+            )
+        except asyncio.TimeoutError:
+            logger.warning("⏳ SQL repair LLM call timed out")
+            return None
+
+    async def propose(self, sql: str, error: str) -> Optional[str]:
+        """
+        Next candidate for SQL that failed with `error`, or None when every
+        stage is used up.
+        """
+        self._tried.add(sql.strip())
+
+        while self._pending:
+            stage = self._pending.pop(0)
+            started = monotonic()
+            candidate = await self._candidate(stage, sql, error)
+            elapsed_ms = (monotonic() - started) * 1000
+
+            stats = _STATS[stage]
+            stats["total_ms"] += elapsed_ms
+
+            if not candidate or candidate.strip() in self._tried:
+                stats["no_candidate"] += 1
+                continue
+
+            stats["attempts"] += 1
+            self._tried.add(candidate.strip())
+            self._open = {
+                "stage": stage,
+                "error": error,
+                "sql": candidate,
+                "propose_ms": round(elapsed_ms, 1),
+                "started": monotonic(),
+            }
+            logger.info(f"🩹 SQL repair candidate | stage={stage} | {elapsed_ms:.1f} ms")
+            return candidate
+
+        return None
+
+    def resolve(self, ok: bool) -> None:
+        """Record the outcome of the last proposed candidate."""
+        if self._open is None:
+            return
+
+        attempt, self._open = self._open, None
+        started = attempt.pop("started")
+        attempt["execute_ms"] = round((monotonic() - started) * 1000, 1)
+        attempt["ok"] = ok
+        self.attempts.append(attempt)
+
+        stats = _STATS[attempt["stage"]]
+        stats["total_ms"] += attempt["execute_ms"]
+        if ok:
+            stats["fixed"] += 1
+            logger.info(f"✅ SQL repaired | stage={attempt['stage']}")
+
+
+def sql_repair_stats() -> Dict[str, Any]:
+    return {
+        stage: {
+            **{k: v for k, v in stats.items() if k != "total_ms"},
+            "avg_ms": round(stats["total_ms"] / max(1, stats["attempts"] + stats["no_candidate"]), 1),
+        }
+        for stage, stats in _STATS.items()
+    }
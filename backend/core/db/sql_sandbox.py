@@ -0,0 +1,389 @@
+# backend/core/db/sql_sandbox.py
+
+import multiprocessing
+import os
+import pickle
+import queue
+import signal
+import threading
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy.engine import Engine
+
+from backend.utils.logger import logger
+from backend.utils.config import (
+    SQL_SANDBOX_ENABLED,
+    SQL_SANDBOX_DIALECTS,
+    SQL_SANDBOX_WORKERS,
+    SQL_SANDBOX_MEMORY_MB,
+    SQL_SANDBOX_CPU_SECONDS,
+    SQL_SANDBOX_GRACE_SECONDS,
+    SQL_STATEMENT_TIMEOUT_SECONDS,
+)
+
+try:
+    import resource
+except ImportError:  # Windows: no rlimits → sandbox unavailable
+    resource = None
+
+
+# ============================================================
+# 🧱 PROCESS SANDBOX (rlimited worker pool for generated SQL)
+# ============================================================
+#
+# A runaway SQLite query (cartesian join, huge GROUP_CONCAT) or a driver
+# bug runs inside the API process: it can eat its memory and CPU. With
+# SQL_SANDBOX_ENABLED, queries of SQL_SANDBOX_DIALECTS run in a small pool
+# of worker processes instead:
+#
+#   - memory → RLIMIT_AS = worker baseline + SQL_SANDBOX_MEMORY_MB
+#   - cpu    → RLIMIT_CPU re-armed per query (SIGXCPU kills the worker)
+#   - wall   → SQL_STATEMENT_TIMEOUT_SECONDS + grace, then SIGKILL
+#   - cancel → client disconnect kills the worker running its query
+#
+# A killed worker is replaced on its next use. Workers fork from a
+# forkserver that preloaded the executor, so a replacement costs a fork,
+# not a fresh interpreter. Results come back over a pipe as one message
+# (already bounded by SQL_MAX_ROWS / SQL_MAX_RESULT_BYTES); the waiting
+# happens on a DB thread, never on the event loop.
+
+LIMITS = ("memory", "cpu", "wall", "cancelled", "crash")
+
+_PRELOAD = ["backend.core.db.db_executor"]
+
+# How often the parent re-checks the wall-clock deadline while waiting
+_POLL_SECONDS = 0.05
+
+# Engines a worker keeps open (one per target database URL)
+_WORKER_ENGINES = 4
+
+_STATS: Dict[str, Any] = {
+    "queries": 0,
+    "completed": 0,
+    "errors": 0,
+    "workers_started": 0,
+    "killed": {limit: 0 for limit in LIMITS},
+}
+
+
+class SandboxLimitError(RuntimeError):
+    """Raised when a sandboxed query is stopped for exceeding a resource limit."""
+
+    def __init__(self, limit: str, detail: str = ""):
+        messages = {
+            "memory": f"Query exceeded the {SQL_SANDBOX_MEMORY_MB} MB memory limit",
+            "cpu": f"Query exceeded the {SQL_SANDBOX_CPU_SECONDS} s CPU time limit",
+            "wall": "Query stopped responding and its worker was killed",
+            "cancelled": "Query cancelled",
+            "crash": "Query worker crashed",
+        }
+        message = messages.get(limit, f"Query stopped ({limit})")
+        super().__init__(f"{message} ({detail})" if detail else message)
+        self.limit = limit
+        self.detail = detail
+
+    def __reduce__(self):
+        return (self.__class__, (self.limit, self.detail))
+
+
+def sandbox_available() -> bool:
+    return resource is not None and "forkserver" in multiprocessing.get_all_start_methods()
+
+
+def sandbox_applies(engine: Engine, db_type: str) -> bool:
+    """Whether queries on this engine run in the sandbox."""
+    if not SQL_SANDBOX_ENABLED or db_type not in SQL_SANDBOX_DIALECTS:
+        return False
+    # In-memory SQLite only exists inside this process
+    if engine.url.get_backend_name() == "sqlite" and engine.url.database in (None, "", ":memory:"):
+        return False
+    return sandbox_available()
+
+
+# ============================================================
+# 👷 WORKER PROCESS
+# ============================================================
+
+def _address_space() -> Optional[int]:
+    """Current virtual memory size in bytes (Linux /proc), else None."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+def _limit_memory(memory_mb: int) -> None:
+    baseline = _address_space()
+    if baseline is None:
+        logger.warning("⚠️ SQL sandbox: address space unknown, memory limit not applied")
+        return
+    limit = baseline + memory_mb * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def _limit_cpu(cpu_seconds: Optional[int]) -> None:
+    """Soft RLIMIT_CPU `cpu_seconds` past the CPU time used so far (None → lift)."""
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    if cpu_seconds is None:
+        soft = hard
+    else:
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        soft = int(usage.ru_utime + usage.ru_stime) + 1 + cpu_seconds
+        if hard != resource.RLIM_INFINITY:
+            soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _out_of_memory(error: BaseException) -> bool:
+    if isinstance(error, MemoryError):
+        return True
+    orig = getattr(error, "orig", None)
+    return isinstance(orig, MemoryError) or "out of memory" in str(orig or error).lower()
+
+
+def _send(conn: Any, reply: Tuple) -> None:
+    try:
+        conn.send(reply)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        # Driver exception that cannot cross the pipe: keep its message
+        error = reply[1]
+        conn.send(("error", RuntimeError(f"{type(error).__name__}: {error}")))
+
+
+def _worker_main(conn: Any, memory_mb: int, cpu_seconds: int) -> None:
+    """
+    Serve (url, sql, db_type, options) requests until the pipe closes.
+    Exits after a memory overrun (the heap may be fragmented / half-freed).
+    """
+    # Preloaded in the forkserver: no import cost per worker
+    from backend.core.db.db_executor import _execute_sql
+    from backend.core.db.db_manager import _create_engine
+
+    _limit_memory(memory_mb)
+    engines: "OrderedDict[str, Engine]" = OrderedDict()
+
+    while True:
+        try:
+            url, sql, db_type, options = conn.recv()
+        except (EOFError, OSError):
+            return
+
+        _limit_cpu(cpu_seconds)
+        try:
+            engine = engines.get(url)
+            if engine is None:
+                engine = engines[url] = _create_engine(url)
+                while len(engines) > _WORKER_ENGINES:
+                    engines.popitem(last=False)[1].dispose()
+            engines.move_to_end(url)
+
+            reply: Tuple = ("ok", _execute_sql(engine, sql, db_type, **options))
+        except Exception as e:
+            reply = ("limit", "memory") if _out_of_memory(e) else ("error", e)
+        finally:
+            _limit_cpu(None)
+
+        _send(conn, reply)
+        if reply[0] == "limit":
+            return
+
+
+# ============================================================
+# 🏊 WORKER POOL (parent side, called from DB threads)
+# ============================================================
+
+class _Worker:
+    """One sandbox process + the parent end of its pipe (restarted lazily)."""
+
+    def __init__(self, ctx: Any, index: int):
+        self._ctx = ctx
+        self.index = index
+        self.process: Any = None
+        self.conn: Any = None
+        self.cancelled = False
+
+    def ensure_started(self) -> None:
+        if self.process is not None and self.process.is_alive():
+            return
+        self.stop()
+
+        parent, child = self._ctx.Pipe()
+        self.process = self._ctx.Process(
+            target=_worker_main,
+            args=(child, SQL_SANDBOX_MEMORY_MB, SQL_SANDBOX_CPU_SECONDS),
+            name=f"sql-sandbox-{self.index}",
+            daemon=True,
+        )
+        self.process.start()
+        child.close()
+        self.conn = parent
+        _STATS["workers_started"] += 1
+        logger.info(f"🧱 SQL sandbox worker started | #{self.index} | pid={self.process.pid}")
+
+    def kill(self) -> None:
+        self.cancelled = True
+        if self.process is not None and self.process.is_alive():
+            self.process.kill()
+
+    def stop(self) -> Optional[int]:
+        """Kill + reap the process; returns its exit code (None if there was none)."""
+        exitcode = None
+        if self.process is not None:
+            if self.process.is_alive():
+                self.process.kill()
+            self.process.join(timeout=1)
+            exitcode = self.process.exitcode
+            self.process = None
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+        return exitcode
+
+
+class SandboxPool:
+    def __init__(self, size: int = SQL_SANDBOX_WORKERS):
+        ctx = multiprocessing.get_context("forkserver")
+        ctx.set_forkserver_preload(_PRELOAD)
+        self._workers = [_Worker(ctx, i) for i in range(max(1, size))]
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        for worker in self._workers:
+            self._idle.put(worker)
+
+    def start(self) -> None:
+        """Start every worker now instead of on first use."""
+        for worker in self._workers:
+            worker.ensure_started()
+
+    def shutdown(self) -> None:
+        for worker in self._workers:
+            worker.stop()
+
+    def execute(self, url: str, sql: str, db_type: str, handle: Any = None, **options: Any) -> Dict[str, Any]:
+        """
+        Run `_execute_sql` in a worker. Raises SandboxLimitError when the
+        worker had to be killed, or the query's own exception.
+        """
+        worker = self._idle.get()
+        try:
+            return self._run(worker, url, sql, db_type, handle, options)
+        finally:
+            self._idle.put(worker)
+
+    def _run(self, worker: _Worker, url: str, sql: str, db_type: str,
+             handle: Any, options: Dict[str, Any]) -> Dict[str, Any]:
+        _STATS["queries"] += 1
+        worker.ensure_started()
+        worker.cancelled = False
+
+        wall = SQL_STATEMENT_TIMEOUT_SECONDS + SQL_SANDBOX_GRACE_SECONDS if SQL_STATEMENT_TIMEOUT_SECONDS > 0 else None
+        deadline = monotonic() + wall if wall else None
+
+        if handle is not None:
+            with handle.lock:
+                handle.kill = worker.kill
+                handle.running = True
+
+        try:
+            worker.conn.send((url, sql, db_type, options))
+
+            while not worker.conn.poll(_POLL_SECONDS):
+                if deadline is not None and monotonic() > deadline:
+                    worker.stop()
+                    raise self._killed("wall", f"{wall:g} s")
+
+            try:
+                reply = worker.conn.recv()
+            except (EOFError, OSError):
+                raise self._died(worker)
+        finally:
+            if handle is not None:
+                with handle.lock:
+                    handle.running = False
+                    handle.kill = None
+
+        if reply[0] == "ok":
+            _STATS["completed"] += 1
+            return reply[1]
+
+        if reply[0] == "limit":
+            worker.stop()
+            raise self._killed(reply[1])
+
+        _STATS["errors"] += 1
+        raise reply[1]
+
+    def _died(self, worker: _Worker) -> SandboxLimitError:
+        cancelled = worker.cancelled
+        exitcode = worker.stop()
+
+        if cancelled:
+            return self._killed("cancelled")
+        if exitcode == -signal.SIGXCPU:
+            return self._killed("cpu")
+        if exitcode == -signal.SIGKILL:
+            # Kernel OOM killer (or an operator): treated as a memory overrun
+            return self._killed("memory", "killed by SIGKILL")
+        return self._killed("crash", f"exit code {exitcode}")
+
+    @staticmethod
+    def _killed(limit: str, detail: str = "") -> SandboxLimitError:
+        _STATS["killed"][limit] += 1
+        error = SandboxLimitError(limit, detail)
+        if limit != "cancelled":
+            logger.warning(f"🧱 SQL sandbox worker stopped | {error}")
+        return error
+
+
+# ============================================================
+# 🧠 PUBLIC API
+# ============================================================
+
+_POOL: Optional[SandboxPool] = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_sandbox_pool() -> SandboxPool:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = SandboxPool()
+        return _POOL
+
+
+def start_sandbox() -> None:
+    """Pre-start the workers (app startup) when the sandbox is enabled."""
+    if not SQL_SANDBOX_ENABLED:
+        return
+    if not sandbox_available():
+        logger.warning("⚠️ SQL_SANDBOX_ENABLED but rlimits / forkserver are unavailable — running in-process")
+        return
+    get_sandbox_pool().start()
+    logger.info(f"🧱 SQL sandbox ready | workers={SQL_SANDBOX_WORKERS} | dialects={SQL_SANDBOX_DIALECTS}")
+
+
+def shutdown_sandbox() -> None:
+    global _POOL
+    with _POOL_LOCK:
+        pool, _POOL = _POOL, None
+    if pool is not None:
+        pool.shutdown()
+
+
+def execute_sandboxed(engine: Engine, sql: str, db_type: str, handle: Any = None, **options: Any) -> Dict[str, Any]:
+    """Sync sandboxed counterpart of db_executor._execute_sql (run on a DB thread)."""
+    url = engine.url.render_as_string(hide_password=False)
+    return get_sandbox_pool().execute(url, sql, db_type, handle=handle, **options)
+
+
+def sandbox_stats() -> Dict[str, Any]:
+    return {
+        **{k: v for k, v in _STATS.items() if k != "killed"},
+        "killed": dict(_STATS["killed"]),
+        "enabled": SQL_SANDBOX_ENABLED,
+        "available": sandbox_available(),
+        "workers": SQL_SANDBOX_WORKERS,
+        "dialects": SQL_SANDBOX_DIALECTS,
+    }
@@ -0,0 +1,58 @@
+# backend/core/db/sql_validator.py
+
+import re
+
+
+# ============================================================
+# 🛡️ READ-ONLY SQL VALIDATION (last gate before execution)
+# ============================================================
+#
+# The SQL prompt already forbids writes, but LLM output (and anything
+# served from the NL → SQL cache) is re-checked here before it runs.
+
+class UnsafeSQLError(ValueError):
+    """Raised when generated SQL is not a single read-only query."""
+
+
+FORBIDDEN_KEYWORDS = (
+    "DROP", "DELETE", "TRUNCATE", "ALTER", "INSERT", "UPDATE", "MERGE",
+    "CREATE", "GRANT", "REVOKE", "INTO", "COPY", "CALL", "EXEC", "EXECUTE",
+    "ATTACH", "DETACH", "PRAGMA", "VACUUM",
+)
+
+_FORBIDDEN = re.compile(r"\b(" + "|".join(FORBIDDEN_KEYWORDS) + r")\b", re.IGNORECASE)
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_QUOTED_IDENTIFIER = re.compile(r'"(?:[^"]|"")*"|`[^`]*`')
+_COMMENT = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+_LEADING_KEYWORD = re.compile(r"^\s*\(*\s*(\w+)", re.IGNORECASE)
+
+
+def validate_read_only_sql(sql: str) -> str:
+    """
+    Return the SQL (one trailing ';' stripped) if it is a single
+    read-only SELECT / WITH query, else raise UnsafeSQLError.
+    """
+    if not sql or not sql.strip():
+        raise UnsafeSQLError("Empty SQL")
+
+    cleaned = sql.strip()
+    if cleaned.endswith(";"):
+        cleaned = cleaned[:-1].rstrip()
+
+    # Scan only real SQL tokens: literals / quoted names / comments blanked out
+    scan = _COMMENT.sub(" ", cleaned)
+    scan = _STRING_LITERAL.sub("''", scan)
+    scan = _QUOTED_IDENTIFIER.sub('""', scan)
+
+    if ";" in scan:
+        raise UnsafeSQLError("Multiple statements are not allowed")
+
+    leading = _LEADING_KEYWORD.match(scan)
+    if not leading or leading.group(1).upper() not in ("SELECT", "WITH"):
+        raise UnsafeSQLError("Only SELECT queries are allowed")
+
+    forbidden = _FORBIDDEN.search(scan)
+    if forbidden:
+        raise UnsafeSQLError(f"Forbidden keyword: {forbidden.group(1).upper()}")
+
+    return cleaned
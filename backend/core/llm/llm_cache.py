@@ -0,0 +1,186 @@
+# backend/core/llm/llm_cache.py
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from backend.utils.logger import logger
+from backend.utils.config import (
+    CACHE_DIR,
+    LLM_CACHE_ENABLED,
+    LLM_CACHE_NONDETERMINISTIC,
+    LLM_CACHE_TTL_SECONDS,
+    LLM_CACHE_MAX_ENTRIES,
+)
+
+
+# ============================================================
+# 💾 PERSISTENT EXACT-MATCH LLM RESPONSE CACHE (SQLite)
+# ============================================================
+
+class LLMResponseCache:
+    """
+    Exact-match cache for LLM responses, persisted in a local SQLite file.
+
+    Key   → sha256(provider | model | temperature | fully rendered prompt)
+            (the provider keeps e.g. fake-LLM responses away from Gemini traffic)
+    Value → response text
+
+    Eviction:
+      - TTL: entries older than `ttl_seconds` are ignored and purged
+      - Size: when more than `max_entries` rows exist, the least recently
+              used rows are deleted
+    """
+
+    # Run the (cheap) purge every N writes instead of on every write
+    PURGE_EVERY = 50
+
+    def __init__(self, db_path: Path, ttl_seconds: int, max_entries: int):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._writes = 0
+        self._stats = {"hits": 0, "misses": 0, "writes": 0, "evicted": 0}
+
+    # --------------------------------------------------------
+    # 🔌 Lazy connection (file created on first use)
+    # --------------------------------------------------------
+    def _get_conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key           TEXT PRIMARY KEY,
+                    model         TEXT NOT NULL,
+                    temperature   REAL NOT NULL,
+                    response      TEXT NOT NULL,
+                    created_at    REAL NOT NULL,
+                    last_accessed REAL NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_llm_cache_accessed ON llm_cache(last_accessed)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    # --------------------------------------------------------
+    # 🔑 Keys + eligibility
+    # --------------------------------------------------------
+    @staticmethod
+    def make_key(provider: str, model: str, temperature: float, prompt: str) -> str:
+        raw = f"{provider}\x1f{model}\x1f{float(temperature)}\x1f{prompt}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def is_eligible(temperature: float) -> bool:
+        """
+        Deterministic calls (temperature 0) are cached by default;
+        sampled calls only with LLM_CACHE_NONDETERMINISTIC=true.
+        """
+        if not LLM_CACHE_ENABLED:
+            return False
+        return float(temperature) == 0.0 or LLM_CACHE_NONDETERMINISTIC
+
+    # --------------------------------------------------------
+    # 📥 Read / 📤 Write
+    # --------------------------------------------------------
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._get_conn()
+                row = conn.execute(
+                    "SELECT response, created_at FROM llm_cache WHERE key = ?", (key,)
+                ).fetchone()
+
+                if row is None or now - row[1] > self.ttl_seconds:
+                    self._stats["misses"] += 1
+                    return None
+
+                conn.execute(
+                    "UPDATE llm_cache SET last_accessed = ? WHERE key = ?", (now, key)
+                )
+                conn.commit()
+                self._stats["hits"] += 1
+                return row[0]
+
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ LLM cache read failed: {e}")
+            return None
+
+    def set(self, key: str, model: str, temperature: float, response: str) -> None:
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._get_conn()
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO llm_cache
+                        (key, model, temperature, response, created_at, last_accessed)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    (key, model, float(temperature), response, now, now),
+                )
+                conn.commit()
+                self._stats["writes"] += 1
+
+                self._writes += 1
+                if self._writes % self.PURGE_EVERY == 0:
+                    self._purge(conn, now)
+
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ LLM cache write failed: {e}")
+
+    def _purge(self, conn: sqlite3.Connection, now: float) -> None:
+        """Drop expired rows, then trim least-recently-used rows above max_entries."""
+        expired = conn.execute(
+            "DELETE FROM llm_cache WHERE created_at < ?", (now - self.ttl_seconds,)
+        ).rowcount
+
+        overflow = conn.execute(
+            """
+            DELETE FROM llm_cache WHERE key IN (
+                SELECT key FROM llm_cache
+                ORDER BY last_accessed DESC
+                LIMIT -1 OFFSET ?
+            )
+            """,
+            (self.max_entries,),
+        ).rowcount
+        conn.commit()
+
+        evicted = expired + overflow
+        if evicted:
+            self._stats["evicted"] += evicted
+            logger.info(f"🧹 LLM cache purge | expired={expired} | lru_evicted={overflow}")
+
+    # --------------------------------------------------------
+    # 📈 Observability
+    # --------------------------------------------------------
+    def stats(self) -> Dict[str, Any]:
+        lookups = self._stats["hits"] + self._stats["misses"]
+        return {
+            **self._stats,
+            "enabled": LLM_CACHE_ENABLED,
+            "hit_ratio": round(self._stats["hits"] / lookups, 4) if lookups else 0.0,
+        }
+
+
+# Singleton instance
+llm_cache = LLMResponseCache(
+    db_path=CACHE_DIR / "llm_cache.sqlite3",
+    ttl_seconds=LLM_CACHE_TTL_SECONDS,
+    max_entries=LLM_CACHE_MAX_ENTRIES,
+)
@@ -1,8 +1,10 @@
 # backend/core/llm/llm_engine.py
 
 import os
+import json
+import asyncio
 import langchain
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional
 
 # 🩹 Compatibility patch for LangChain integrations (fix missing attrs)
 for attr, default in {
@@ -13,12 +15,15 @@ for attr, default in {
     if not hasattr(langchain, attr):
         setattr(langchain, attr, default)
 
-from langchain_google_genai import ChatGoogleGenerativeAI
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage
 from langchain_core.prompts import PromptTemplate
 from langchain_core.runnables import RunnableSequence
 
 from backend.utils.logger import logger
-from backend.utils.config import GEMINI_API_KEY
+from backend.utils.config import GEMINI_API_KEY, LLM_TIMEOUT_SECONDS
+from backend.core.llm.llm_registry import llm_registry
+from backend.core.llm.llm_cache import llm_cache
 
 
 # ✅ Ensure Gemini API key is visible to the SDK
@@ -32,19 +37,19 @@ os.environ["GOOGLE_API_KEY"] = GEMINI_API_KEY
 def get_llm(
     model_name: str = "gemini-2.5-flash",
     temperature: float = 0.4,
-) -> ChatGoogleGenerativeAI:
+) -> BaseChatModel:
     """
-    Return a base Gemini chat model instance.
+    Return the shared chat model for (model_name, temperature).
+    Gemini by default; LLM_PROVIDER=fake swaps in the offline stand-in.
+
+    Clients are built once per process by the LLM registry and reused,
+    so their connection pool survives across requests.
 
     This is used by:
       - assistant_node (for tool vs general routing)
       - any other component that needs a "bare" LLM
     """
-    return ChatGoogleGenerativeAI(
-        model=model_name,
-        google_api_key=GEMINI_API_KEY,
-        temperature=temperature,
-    )
+    return llm_registry.get_client(model_name, temperature)
 
 
 # ======================================================
@@ -127,15 +132,142 @@ def _build_chain(
     """
     llm = get_llm(model_name=model_name, temperature=temperature)
     prompt = build_answer_prompt()
-    # PromptTemplate | ChatGoogleGenerativeAI => RunnableSequence
+    # PromptTemplate | chat model => RunnableSequence
     return RunnableSequence(prompt | llm)
 
 
+def get_answer_chain(
+    model_name: str = "gemini-2.5-flash",
+    temperature: float = 0.4,
+) -> RunnableSequence:
+    """
+    Return the prebuilt answer chain for (model_name, temperature).
+    Built once per process via the LLM registry.
+    """
+    return llm_registry.get_chain(
+        ("answer", model_name, float(temperature)),
+        lambda: _build_chain(model_name=model_name, temperature=temperature),
+    )
+
+
+# ======================================================
+# 💾 RESPONSE CACHE HELPERS
+# ======================================================
+
+def _cache_key(
+    chain: RunnableSequence,
+    inputs: Dict,
+    model_name: str,
+    temperature: float,
+) -> Optional[str]:
+    """
+    Return the response-cache key for this call, or None if not eligible.
+    The key covers the provider and the fully rendered prompt
+    (chain.first is the PromptTemplate).
+    """
+    if not llm_cache.is_eligible(temperature):
+        return None
+
+    rendered_prompt = chain.first.format(**inputs)
+    return llm_cache.make_key(llm_registry.provider, model_name, temperature, rendered_prompt)
+
+
+def _store_in_cache(key: Optional[str], model_name: str, temperature: float, result) -> None:
+    if key is None:
+        return
+
+    text = getattr(result, "content", None)
+    if isinstance(text, str) and text:
+        llm_cache.set(key, f"{llm_registry.provider}:{model_name}", temperature, text)
+
+
+# ======================================================
+# 🔁 CHAIN INVOCATION (cache + timeout + cancellation)
+# ======================================================
+
+def invoke_chain(
+    chain: RunnableSequence,
+    inputs: Dict,
+    model_name: str,
+    temperature: float,
+):
+    """
+    Synchronous chain call, served from the response cache when eligible.
+    """
+    key = _cache_key(chain, inputs, model_name, temperature)
+    if key is not None:
+        cached = llm_cache.get(key)
+        if cached is not None:
+            return AIMessage(content=cached)
+
+    result = chain.invoke(inputs)
+    _store_in_cache(key, model_name, temperature, result)
+    return result
+
+
+async def ainvoke_chain(
+    chain: RunnableSequence,
+    inputs: Dict,
+    model_name: str,
+    temperature: float,
+    timeout: Optional[float] = None,
+    on_token: Optional[Callable[[str], None]] = None,
+):
+    """
+    Run a chain on the event loop via `ainvoke`, bounded by `timeout` seconds.
+
+    - Never blocks the uvicorn event loop
+    - Raises asyncio.TimeoutError when the deadline passes
+    - Propagates asyncio.CancelledError (e.g. client disconnected),
+      which aborts the in-flight Gemini request
+    - If `on_token` is given, the chain is run with `astream` and every
+      text chunk is forwarded as it arrives; the merged message is returned
+    - Eligible calls (see LLMResponseCache.is_eligible) are answered from
+      the persistent response cache without contacting the model
+    """
+    timeout = LLM_TIMEOUT_SECONDS if timeout is None else timeout
+
+    key = _cache_key(chain, inputs, model_name, temperature)
+    if key is not None:
+        cached = llm_cache.get(key)
+        if cached is not None:
+            if on_token is not None:
+                on_token(cached)
+            return AIMessage(content=cached)
+
+    if on_token is None:
+        result = await asyncio.wait_for(chain.ainvoke(inputs), timeout=timeout)
+        _store_in_cache(key, model_name, temperature, result)
+        return result
+
+    async def _stream():
+        merged = None
+        async for chunk in chain.astream(inputs):
+            text = getattr(chunk, "content", "")
+            if text:
+                on_token(text)
+            merged = chunk if merged is None else merged + chunk
+        return merged
+
+    result = await asyncio.wait_for(_stream(), timeout=timeout)
+    _store_in_cache(key, model_name, temperature, result)
+    return result
+
+
 # ======================================================
 # 🌐 GENERAL ANSWER (NO DOCUMENT RETRIEVAL)
 #   - Used by finalize_node when assistant_node says "NO_TOOL_REQUIRED"
 # ======================================================
 
+def _general_inputs(query: str, memory_text: Optional[str]) -> Dict:
+    context_text = memory_text or "No prior conversation context is available."
+    return {
+        "mode": "general",
+        "context": context_text,
+        "question": query,
+    }
+
+
 def generate_general_answer(
     query: str,
     memory_text: Optional[str] = None,
@@ -152,17 +284,8 @@ def generate_general_answer(
     try:
         logger.info(f"🤖 [GENERAL] Generating answer for query: '{query}'")
 
-        context_text = memory_text or "No prior conversation context is available."
-
-        chain = _build_chain(model_name=model_name)
-
-        result = chain.invoke(
-            {
-                "mode": "general",
-                "context": context_text,
-                "question": query,
-            }
-        )
+        chain = get_answer_chain(model_name=model_name)
+        result = invoke_chain(chain, _general_inputs(query, memory_text), model_name, 0.4)
 
         return {
             "query": query,
@@ -181,11 +304,66 @@ def generate_general_answer(
         }
 
 
+async def agenerate_general_answer(
+    query: str,
+    memory_text: Optional[str] = None,
+    model_name: str = "gemini-2.5-flash",
+    timeout: Optional[float] = None,
+    on_token: Optional[Callable[[str], None]] = None,
+) -> Dict:
+    """
+    Async variant of generate_general_answer (non-blocking `ainvoke`).
+    Pass `on_token` to receive answer tokens as they stream in.
+    """
+    try:
+        logger.info(f"🤖 [GENERAL] Generating answer (async) for query: '{query}'")
+
+        chain = get_answer_chain(model_name=model_name)
+        result = await ainvoke_chain(
+            chain, _general_inputs(query, memory_text), model_name, 0.4, timeout, on_token
+        )
+
+        return {
+            "query": query,
+            "response": getattr(result, "content", str(result)),
+            "used_chunks": 0,
+            "model": model_name,
+        }
+
+    except Exception as e:
+        logger.exception(f"❌ [GENERAL] Error generating answer: {e!r}")
+        return {
+            "query": query,
+            "response": f"⚠ Error generating response: {e!r}",
+            "used_chunks": 0,
+            "model": model_name,
+        }
+
+
 # ======================================================
 # 📄 RAG ANSWER (DOCUMENT-GROUNDED)
 #   - Used by run_rag_generation() in rag_pipeline.py
 # ======================================================
 
+def _rag_inputs(query: str, context_chunks: List[str]) -> Dict:
+    if context_chunks:
+        # You can tune how many chunks to join here if needed.
+        context_text = "\n\n".join(context_chunks)
+    else:
+        # RAG path but no context: model should be honest about that.
+        context_text = (
+            "No document context was retrieved for this query. "
+            "Answer based on your general knowledge but say that "
+            "no supporting document passage was found."
+        )
+
+    return {
+        "mode": "rag",
+        "context": context_text,
+        "question": query,
+    }
+
+
 def generate_rag_answer(
     query: str,
     context_chunks: List[str],
@@ -204,26 +382,8 @@ def generate_rag_answer(
             f"with {len(context_chunks)} context chunks"
         )
 
-        if context_chunks:
-            # You can tune how many chunks to join here if needed.
-            context_text = "\n\n".join(context_chunks)
-        else:
-            # RAG path but no context: model should be honest about that.
-            context_text = (
-                "No document context was retrieved for this query. "
-                "Answer based on your general knowledge but say that "
-                "no supporting document passage was found."
-            )
-
-        chain = _build_chain(model_name=model_name)
-
-        result = chain.invoke(
-            {
-                "mode": "rag",
-                "context": context_text,
-                "question": query,
-            }
-        )
+        chain = get_answer_chain(model_name=model_name)
+        result = invoke_chain(chain, _rag_inputs(query, context_chunks), model_name, 0.4)
 
         return {
             "query": query,
@@ -240,6 +400,45 @@ def generate_rag_answer(
             "used_chunks": len(context_chunks),
             "model": model_name,
         }
+
+
+async def agenerate_rag_answer(
+    query: str,
+    context_chunks: List[str],
+    model_name: str = "gemini-2.5-flash",
+    timeout: Optional[float] = None,
+    on_token: Optional[Callable[[str], None]] = None,
+) -> Dict:
+    """
+    Async variant of generate_rag_answer (non-blocking `ainvoke`).
+    Pass `on_token` to receive answer tokens as they stream in.
+    """
+    try:
+        logger.info(
+            f"🤖 [RAG] Generating answer (async) for query: '{query}' "
+            f"with {len(context_chunks)} context chunks"
+        )
+
+        chain = get_answer_chain(model_name=model_name)
+        result = await ainvoke_chain(
+            chain, _rag_inputs(query, context_chunks), model_name, 0.4, timeout, on_token
+        )
+
+        return {
+            "query": query,
+            "response": getattr(result, "content", str(result)),
+            "used_chunks": len(context_chunks),
+            "model": model_name,
+        }
+
+    except Exception as e:
+        logger.exception(f"❌ [RAG] Error generating RAG answer: {e!r}")
+        return {
+            "query": query,
+            "response": f"⚠ Error generating response: {e!r}",
+            "used_chunks": len(context_chunks),
+            "model": model_name,
+        }
     
 
 # ======================================================
@@ -247,40 +446,117 @@ def generate_rag_answer(
 #   - Used by run_db_generation() in db_executor.py
 # ======================================================
 
+def _db_inputs(
+    query: str,
+    rows_text: str,
+    sql: str,
+    db_type: str,
+    memory_text: Optional[str],
+    result_note: Optional[str] = None,
+    result_summary: Optional[Dict] = None,
+) -> Dict:
+    context_parts = []
+
+    if memory_text:
+        context_parts.append("Conversation History:\n" + memory_text)
+
+    context_parts.append(f"Database Type: {db_type}")
+    context_parts.append(f"Executed SQL:\n{sql}")
+
+    if result_summary:
+        # Large result: column statistics over ALL rows + a small sample
+        sample = result_summary["sample_rows"]
+        context_parts.append(
+            f"Result Profile ({result_summary['row_count']} rows, statistics cover every row):\n"
+            + json.dumps(result_summary["columns"], ensure_ascii=False, default=str)
+        )
+        context_parts.append(
+            f"Representative Sample Rows ({len(sample)} of {result_summary['row_count']}):\n"
+            + rows_text
+        )
+    else:
+        context_parts.append(f"Query Result Rows:\n{rows_text}")
+
+    if result_note:
+        context_parts.append(f"Result Note: {result_note}")
+
+    return {
+        "mode": "db",
+        "context": "\n\n".join(context_parts),
+        "question": query,
+    }
+
+
 def generate_db_answer(
     query: str,
-    rows: List[Dict],
+    rows_text: str,
     sql: str,
     db_type: str,
     memory_text: Optional[str] = None,
     model_name: str = "gemini-2.5-flash",
+    result_note: Optional[str] = None,
+    result_summary: Optional[Dict] = None,
 ) -> Dict:
     """
     Generate a natural-language explanation of DB query results.
-    Used by run_db_generation().
+    Used by run_db_generation(). `rows_text` is the result already rendered
+    for the prompt (see row_encoder; the summary's sample rows when
+    summarized). `result_note` flags partial results; `result_summary`
+    (large results) adds column profiles over every row.
     """
     try:
-        logger.info(f"🤖 [DB] Query='{query}' | Rows={len(rows)}")
-
-        context_parts = []
-
-        if memory_text:
-            context_parts.append("Conversation History:\n" + memory_text)
+        logger.info(f"🤖 [DB] Query='{query}' | Rows text={len(rows_text)} chars")
+
+        chain = get_answer_chain(model_name=model_name, temperature=0.3)
+        result = invoke_chain(
+            chain,
+            _db_inputs(query, rows_text, sql, db_type, memory_text, result_note, result_summary),
+            model_name,
+            0.3,
+        )
 
-        context_parts.append(f"Database Type: {db_type}")
-        context_parts.append(f"Executed SQL:\n{sql}")
-        context_parts.append(f"Query Result Rows:\n{rows}")
+        return {
+            "query": query,
+            "response": getattr(result, "content", str(result)),
+            "model": model_name,
+        }
 
-        context = "\n\n".join(context_parts)
+    except Exception as e:
+        logger.exception("❌ DB answer failed")
+        return {
+            "query": query,
+            "response": f"Error explaining database results: {e}",
+            "model": model_name,
+        }
 
-        chain = _build_chain(model_name=model_name, temperature=0.3)
 
-        result = chain.invoke(
-            {
-                "mode": "db",
-                "context": context,
-                "question": query,
-            }
+async def agenerate_db_answer(
+    query: str,
+    rows_text: str,
+    sql: str,
+    db_type: str,
+    memory_text: Optional[str] = None,
+    model_name: str = "gemini-2.5-flash",
+    timeout: Optional[float] = None,
+    on_token: Optional[Callable[[str], None]] = None,
+    result_note: Optional[str] = None,
+    result_summary: Optional[Dict] = None,
+) -> Dict:
+    """
+    Async variant of generate_db_answer (non-blocking `ainvoke`).
+    Pass `on_token` to receive answer tokens as they stream in.
+    """
+    try:
+        logger.info(f"🤖 [DB] (async) Query='{query}' | Rows text={len(rows_text)} chars")
+
+        chain = get_answer_chain(model_name=model_name, temperature=0.3)
+        result = await ainvoke_chain(
+            chain,
+            _db_inputs(query, rows_text, sql, db_type, memory_text, result_note, result_summary),
+            model_name,
+            0.3,
+            timeout,
+            on_token,
         )
 
         return {
@@ -293,6 +569,6 @@ def generate_db_answer(
         logger.exception("❌ DB answer failed")
         return {
             "query": query,
-            "response": f"Error explaining database results: {e}",
+            "response": f"Error explaining database results: {e!r}",
             "model": model_name,
         }
\ No newline at end of file
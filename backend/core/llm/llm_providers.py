@@ -0,0 +1,234 @@
+# backend/core/llm/llm_providers.py
+
+import asyncio
+import hashlib
+import re
+import time
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence
+
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForLLMRun,
+    CallbackManagerForLLMRun,
+)
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+from backend.utils.config import (
+    GEMINI_API_KEY,
+    FAKE_LLM_LATENCY_MS,
+    FAKE_LLM_TOKENS_PER_SECOND,
+    FAKE_LLM_ANSWER_TOKENS,
+)
+
+
+# ============================================================
+# 🧪 FAKE LOCAL LLM (deterministic, offline)
+# ============================================================
+
+_DB_INTENT = re.compile(
+    r"\b(how many|count|total|sum|average|avg|top \d+|group(ed)? by|per|"
+    r"list all|show all|records|rows|orders|sales|revenue)\b",
+    re.IGNORECASE,
+)
+_DOC_INTENT = re.compile(
+    r"\b(document|pdf|file|report|according|section|summari[sz]e|policy|uploaded)\b",
+    re.IGNORECASE,
+)
+_SESSION_ID = re.compile(r"^session_id:\s*(\S+)", re.MULTILINE)
+_JSON_FIRST_TABLE = re.compile(r'"tables":\s*\{\s*"([^"]+)"')
+_LINE_FIRST_TABLE = re.compile(r"^\s*([A-Za-z_][\w.]*)\s*\(", re.MULTILINE)
+
+_VOCABULARY = (
+    "the data shows that results are consistent with expected values and "
+    "this answer summarizes key points clearly for the user based on context"
+).split()
+
+
+class FakeChatModel(BaseChatModel):
+    """
+    Local stand-in for Gemini used for load and latency testing.
+
+    Behaviour is a pure function of the prompt:
+      - with tools bound → a rag_tool / db_tool call or "NO_TOOL_REQUIRED"
+        (keyword heuristics on the user question)
+      - SQL prompt       → a COUNT(*) over the first table in the schema
+      - anything else    → a pseudo-random answer seeded by the prompt hash
+
+    Timing model:
+      total latency = latency_ms + answer_tokens / tokens_per_second
+    """
+
+    model_name: str = "fake-llm"
+    temperature: float = 0.0
+    latency_ms: float = FAKE_LLM_LATENCY_MS
+    tokens_per_second: float = FAKE_LLM_TOKENS_PER_SECOND
+    answer_tokens: int = FAKE_LLM_ANSWER_TOKENS
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-local"
+
+    @property
+    def _identifying_params(self) -> Dict[str, Any]:
+        return {"model_name": self.model_name, "temperature": self.temperature}
+
+    def bind_tools(self, tools: Sequence[Any], **kwargs: Any):
+        return self.bind(tools=[convert_to_openai_tool(t) for t in tools], **kwargs)
+
+    # --------------------------------------------------------
+    # 🧠 Deterministic response
+    # --------------------------------------------------------
+    def _respond(self, messages: List[BaseMessage], tools: Optional[List[Dict]]) -> AIMessage:
+        prompt = "\n".join(str(m.content) for m in messages)
+        question = str(messages[-1].content)
+
+        if tools:
+            return self._route(prompt, question, {t["function"]["name"] for t in tools})
+
+        if "Return ONLY SQL" in prompt:
+            return AIMessage(content=self._sql(prompt))
+
+        return AIMessage(content=self._answer(prompt))
+
+    def _route(self, prompt: str, question: str, tool_names: set) -> AIMessage:
+        session_matches = _SESSION_ID.findall(prompt)
+        session_id = session_matches[-1] if session_matches else "unknown"
+        has_docs = "Uploaded documents in this session:" in prompt
+
+        if "db_tool" in tool_names and _DB_INTENT.search(question):
+            tool_name = "db_tool"
+        elif "rag_tool" in tool_names and has_docs and _DOC_INTENT.search(question):
+            tool_name = "rag_tool"
+        else:
+            return AIMessage(content="NO_TOOL_REQUIRED")
+
+        call_id = "call_" + hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:16]
+        return AIMessage(
+            content="",
+            tool_calls=[{
+                "name": tool_name,
+                "args": {"session_id": session_id, "query": question},
+                "id": call_id,
+            }],
+        )
+
+    @staticmethod
+    def _sql(prompt: str) -> str:
+        schema_part = prompt.split("Database Schema", 1)[-1]
+        match = _JSON_FIRST_TABLE.search(schema_part) or _LINE_FIRST_TABLE.search(schema_part)
+        if not match:
+            return "SELECT 1 AS value"
+        return f"SELECT COUNT(*) AS row_count FROM {match.group(1)}"
+
+    def _answer(self, prompt: str) -> str:
+        seed = hashlib.sha256(prompt.encode("utf-8")).digest()
+        words = [
+            _VOCABULARY[seed[i % len(seed)] % len(_VOCABULARY)]
+            for i in range(self.answer_tokens)
+        ]
+        return " ".join(words).capitalize() + "."
+
+    # --------------------------------------------------------
+    # ⏱️ Timing helpers
+    # --------------------------------------------------------
+    def _token_delay(self) -> float:
+        return 1.0 / self.tokens_per_second if self.tokens_per_second > 0 else 0.0
+
+    def _total_delay(self, message: AIMessage) -> float:
+        tokens = len(str(message.content).split()) or 1
+        return self.latency_ms / 1000 + tokens * self._token_delay()
+
+    @staticmethod
+    def _tokens(message: AIMessage) -> List[str]:
+        words = str(message.content).split(" ")
+        return [w + (" " if i < len(words) - 1 else "") for i, w in enumerate(words)]
+
+    # --------------------------------------------------------
+    # 🔁 BaseChatModel API
+    # --------------------------------------------------------
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        message = self._respond(messages, kwargs.get("tools"))
+        time.sleep(self._total_delay(message))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        message = self._respond(messages, kwargs.get("tools"))
+        await asyncio.sleep(self._total_delay(message))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _stream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        message = self._respond(messages, kwargs.get("tools"))
+        time.sleep(self.latency_ms / 1000)
+        for token in self._tokens(message):
+            time.sleep(self._token_delay())
+            yield ChatGenerationChunk(message=AIMessageChunk(content=token))
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        message = self._respond(messages, kwargs.get("tools"))
+        await asyncio.sleep(self.latency_ms / 1000)
+        for token in self._tokens(message):
+            await asyncio.sleep(self._token_delay())
+            yield ChatGenerationChunk(message=AIMessageChunk(content=token))
+
+
+# ============================================================
+# 🏭 PROVIDER FACTORY
+# ============================================================
+
+def build_chat_model(
+    provider: str,
+    model_name: str,
+    temperature: float,
+    callbacks: Optional[List[Any]] = None,
+) -> BaseChatModel:
+    """
+    Build a chat model for the configured provider.
+
+    Providers:
+      - "gemini" → ChatGoogleGenerativeAI (default)
+      - "fake"   → FakeChatModel (offline, deterministic)
+    """
+    if provider == "gemini":
+        from langchain_google_genai import ChatGoogleGenerativeAI
+
+        return ChatGoogleGenerativeAI(
+            model=model_name,
+            google_api_key=GEMINI_API_KEY,
+            temperature=temperature,
+            callbacks=callbacks,
+        )
+
+    if provider == "fake":
+        return FakeChatModel(
+            model_name=model_name,
+            temperature=temperature,
+            callbacks=callbacks,
+        )
+
+    raise ValueError(f"Unsupported LLM provider: {provider}")
@@ -0,0 +1,210 @@
+# backend/core/llm/llm_registry.py
+
+import time
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Sequence, Tuple
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.runnables import Runnable
+
+from backend.utils.logger import logger
+from backend.utils.config import LLM_PROVIDER
+from backend.core.llm.llm_providers import build_chat_model
+
+
+# ============================================================
+# ⏱️ TIMING CALLBACK (construction + first-token latency)
+# ============================================================
+
+class _LLMTimingCallback(BaseCallbackHandler):
+    """
+    Records time-to-first-token for every call made through a client.
+
+    - Streaming calls → first `on_llm_new_token`
+    - Non-streaming calls → `on_llm_end` (whole response is the first token)
+    """
+
+    run_inline = True
+
+    def __init__(self, stats: Dict[str, Any]):
+        self._stats = stats
+        self._starts: Dict[UUID, float] = {}
+
+    def on_chat_model_start(self, serialized, messages, *, run_id: UUID, **kwargs) -> None:
+        self._starts[run_id] = time.perf_counter()
+
+    def on_llm_new_token(self, token: str, *, run_id: UUID, **kwargs) -> None:
+        self._record_first_token(run_id)
+
+    def on_llm_end(self, response, *, run_id: UUID, **kwargs) -> None:
+        self._record_first_token(run_id)
+
+    def on_llm_error(self, error, *, run_id: UUID, **kwargs) -> None:
+        self._starts.pop(run_id, None)
+
+    def _record_first_token(self, run_id: UUID) -> None:
+        started = self._starts.pop(run_id, None)
+        if started is None:
+            return  # first token already recorded for this run
+
+        elapsed_ms = round((time.perf_counter() - started) * 1000, 2)
+        stats = self._stats
+
+        stats["calls"] += 1
+        stats["last_first_token_ms"] = elapsed_ms
+        stats["total_first_token_ms"] += elapsed_ms
+
+        if stats["cold_first_token_ms"] is None:
+            stats["cold_first_token_ms"] = elapsed_ms
+            logger.info(f"⏱️ LLM first token | client={stats['key']} | {elapsed_ms} ms")
+
+
+# ============================================================
+# 🏭 PROCESS-WIDE LLM CLIENT REGISTRY
+# ============================================================
+
+class LLMRegistry:
+    """
+    Builds every LLM client, tool binding and prompt chain ONCE per process.
+    Clients come from the configured provider (LLM_PROVIDER).
+
+    Reusing the same client keeps its underlying HTTP/gRPC channel (and TLS
+    session) alive, so requests no longer pay construction + handshake cost.
+
+    Keys:
+      - clients → (model_name, temperature)
+      - bound   → (model_name, temperature, tool names)
+      - chains  → any hashable key chosen by the caller
+    """
+
+    def __init__(self, provider: str = LLM_PROVIDER):
+        self.provider = provider
+        self._lock = threading.Lock()
+        self._clients: Dict[Tuple[str, float], Any] = {}
+        self._bound: Dict[Tuple[str, float, Tuple[str, ...]], Runnable] = {}
+        self._chains: Dict[Hashable, Runnable] = {}
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+    # --------------------------------------------------------
+    # 🔧 Clients
+    # --------------------------------------------------------
+    def get_client(self, model_name: str, temperature: float):
+        key = (model_name, float(temperature))
+
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = self._construct_client(*key)
+                self._clients[key] = client
+
+        return client
+
+    def _construct_client(self, model_name: str, temperature: float):
+        stats_key = f"{self.provider}:{model_name}@{temperature}"
+        stats = {
+            "key": stats_key,
+            "construction_ms": None,
+            "calls": 0,
+            "cold_first_token_ms": None,
+            "last_first_token_ms": None,
+            "total_first_token_ms": 0.0,
+        }
+
+        started = time.perf_counter()
+        client = build_chat_model(
+            self.provider,
+            model_name,
+            temperature,
+            callbacks=[_LLMTimingCallback(stats)],
+        )
+        stats["construction_ms"] = round((time.perf_counter() - started) * 1000, 2)
+
+        self._stats[stats_key] = stats
+        logger.info(
+            f"🏭 LLM client built | client={stats_key} | {stats['construction_ms']} ms"
+        )
+        return client
+
+    # --------------------------------------------------------
+    # 🧰 Tool bindings
+    # --------------------------------------------------------
+    def get_bound_client(self, model_name: str, temperature: float, tools: Sequence[Any]) -> Runnable:
+        tool_names = tuple(sorted(getattr(t, "name", str(t)) for t in tools))
+        key = (model_name, float(temperature), tool_names)
+
+        bound = self._bound.get(key)
+        if bound is not None:
+            return bound
+
+        client = self.get_client(model_name, temperature)
+        with self._lock:
+            bound = self._bound.get(key)
+            if bound is None:
+                bound = client.bind_tools(list(tools))
+                self._bound[key] = bound
+                logger.info(f"🧰 Tools bound once | model={model_name} | tools={list(tool_names)}")
+
+        return bound
+
+    # --------------------------------------------------------
+    # 🧵 Prebuilt chains
+    # --------------------------------------------------------
+    def get_chain(self, key: Hashable, builder: Callable[[], Runnable]) -> Runnable:
+        chain = self._chains.get(key)
+        if chain is not None:
+            return chain
+
+        # Build outside the lock: builders call get_client() themselves
+        built = builder()
+        with self._lock:
+            chain = self._chains.setdefault(key, built)
+
+        return chain
+
+    # --------------------------------------------------------
+    # 🔥 Startup warm-up + observability
+    # --------------------------------------------------------
+    def warm_up(self, builders: List[Callable[[], Any]]) -> None:
+        """
+        Eagerly build clients/bindings/chains at app startup so the first
+        user request does not pay construction cost.
+        """
+        started = time.perf_counter()
+        for build in builders:
+            build()
+        elapsed_ms = round((time.perf_counter() - started) * 1000, 2)
+        logger.info(
+            f"✅ LLM registry warm | clients={len(self._clients)} | "
+            f"bindings={len(self._bound)} | chains={len(self._chains)} | {elapsed_ms} ms"
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        clients = []
+        for stats in self._stats.values():
+            calls = stats["calls"]
+            clients.append({
+                "client": stats["key"],
+                "construction_ms": stats["construction_ms"],
+                "calls": calls,
+                "cold_first_token_ms": stats["cold_first_token_ms"],
+                "last_first_token_ms": stats["last_first_token_ms"],
+                "avg_first_token_ms": (
+                    round(stats["total_first_token_ms"] / calls, 2) if calls else None
+                ),
+            })
+
+        return {
+            "provider": self.provider,
+            "clients": clients,
+            "tool_bindings": len(self._bound),
+            "chains": len(self._chains),
+        }
+
+
+# Singleton instance
+llm_registry = LLMRegistry()
@@ -1,12 +1,13 @@
 # backend/core/rag/rag_pipeline.py
 
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, List, Optional
 from backend.utils.logger import logger
 
 # Import core RAG components
 from backend.core.rag.retriever import retrieve_top_k_chunks
 from backend.core.rag.citation_handler import prepare_context_and_citations, format_citations_for_display
-from backend.core.llm.llm_engine import generate_rag_answer
+from backend.core.llm.llm_engine import agenerate_rag_answer
+from backend.core.agent.speculation import claim_speculative_result
 
 # Memory
 from backend.core.memory.session_memory import add_to_session_memory, get_session_memory
@@ -15,7 +16,12 @@ from backend.core.memory.session_memory import add_to_session_memory, get_sessio
 # =======================================================================
 # 1️⃣ RETRIEVAL-ONLY FUNCTION (⚡ Used by rag_tool inside LangGraph)
 # =======================================================================
-async def run_rag_retrieval(session_id: str, query: str, top_k: int = 5) -> Dict[str, Any]:
+async def run_rag_retrieval(
+    session_id: str,
+    query: str,
+    top_k: int = 5,
+    request_id: Optional[str] = None,
+) -> Dict[str, Any]:
     """
     Retrieve semantically relevant document chunks for a given query.
     This function is used ONLY by the rag_tool, and it MUST NOT generate
@@ -34,7 +40,10 @@ async def run_rag_retrieval(session_id: str, query: str, top_k: int = 5) -> Dict
     add_to_session_memory(session_id, "user", query)
 
     # Step 1: Retrieve chunks from Qdrant
-    retrieved = retrieve_top_k_chunks(session_id, query, top_k)
+    #         (reuse speculative retrieval this request started during routing, if any)
+    retrieved = await claim_speculative_result("rag", request_id, session_id, query, top_k)
+    if retrieved is None:
+        retrieved = retrieve_top_k_chunks(session_id, query, top_k)
 
     # Step 2: Process raw results into:
     #   - context_chunks → for LLM
@@ -57,7 +66,13 @@ async def run_rag_retrieval(session_id: str, query: str, top_k: int = 5) -> Dict
 # =======================================================================
 # 2️⃣ LLM GENERATION FUNCTION (⚡ Used after rag_tool is called)
 # =======================================================================
-async def run_rag_generation(session_id: str, query: str, chunks: List[str], citations: List[Dict]) -> Dict[str, Any]:
+async def run_rag_generation(
+    session_id: str,
+    query: str,
+    chunks: List[str],
+    citations: List[Dict],
+    on_token: Optional[Callable[[str], None]] = None,
+) -> Dict[str, Any]:
     """
     Generate the final answer for a RAG query *after* retrieval is done.
     This is used by assistant_node only when the LLM decides to call rag_tool.
@@ -68,6 +83,8 @@ async def run_rag_generation(session_id: str, query: str, chunks: List[str], cit
         - Generate final LLM answer
         - Save LLM answer to memory
         - Format citations for frontend display
+
+    `on_token` (optional) receives answer tokens as they are generated.
     """
 
     logger.info(f"🤖 RAG Generation Start | Session={session_id}")
@@ -96,8 +113,8 @@ async def run_rag_generation(session_id: str, query: str, chunks: List[str], cit
     # Add retrieved document chunks
     master_context.extend(chunks)
 
-    # Produce the final contextual LLM answer
-    llm_result = generate_rag_answer(query, master_context)
+    # Produce the final contextual LLM answer (async, non-blocking)
+    llm_result = await agenerate_rag_answer(query, master_context, on_token=on_token)
 
     # Save the assistant's reply to session memory
     add_to_session_memory(session_id, "assistant", llm_result["response"])
@@ -4,6 +4,7 @@ from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, HTMLResponse, PlainTextResponse
 from contextlib import asynccontextmanager
+import asyncio
 import os
 
 # ✅ Routers
@@ -14,11 +15,18 @@ from backend.api.routes.reset_session import router as reset_router
 from backend.api.routes.db_connect import router as db_connect_router
 from backend.api.routes.db_schema import router as db_schema_router
 from backend.api.routes.query import router as query_router
+from backend.api.routes.metrics import router as metrics_router
 
 # ✅ Core
 from backend.core.doc_processing_unit.model_manager import get_embedding_model
 from backend.core.doc_processing_unit.qdrant_manager import client as qdrant_client
 from backend.core.rag.resource_store import resource_store
+from backend.core.llm.llm_registry import llm_registry
+from backend.core.llm.llm_engine import get_answer_chain
+from backend.core.db.db_query_generator import get_sql_chain
+from backend.core.db.db_manager import run_db_maintenance, aclear_all_db_connections
+from backend.core.db.sql_sandbox import start_sandbox, shutdown_sandbox
+from backend.core.agent.nodes.assistant_node import get_router_llm
 from backend.utils.logger import logger
 
 UPLOAD_DIR = "backend/data/uploads"
@@ -40,11 +48,29 @@ async def lifespan(app: FastAPI):
     resource_store.embedding_model = app.state.embedding_model
     resource_store.qdrant_client = app.state.qdrant_client
 
+    # ✅ Build LLM clients, tool bindings and prompt chains once (reused per request)
+    llm_registry.warm_up([
+        get_router_llm,                               # assistant_node routing
+        get_answer_chain,                             # general + RAG answers
+        lambda: get_answer_chain(temperature=0.3),    # DB answers
+        get_sql_chain,                                # NL → SQL
+    ])
+    app.state.llm_registry = llm_registry
+
+    # ✅ DB engine governance: idle eviction + pool health checks
+    app.state.db_maintenance_task = asyncio.create_task(run_db_maintenance())
+
+    # ✅ Rlimited worker processes for generated SQL (SQL_SANDBOX_ENABLED)
+    await asyncio.to_thread(start_sandbox)
     logger.info("✅ Startup complete — model loaded and Qdrant connected.")
     yield
 
     # ✅ On shutdown
     logger.info("🧹 Shutting down — cleaning resources...")
+    app.state.db_maintenance_task.cancel()
+    await aclear_all_db_connections()
+    shutdown_sandbox()
+
     try:
         if app.state.qdrant_client is not None:
             app.state.qdrant_client.close()
@@ -126,6 +152,7 @@ app.include_router(reset_router, prefix="/api", tags=["Reset Session"])
 app.include_router(db_connect_router, prefix="/api", tags=["Database Connection"])
 app.include_router(db_schema_router, prefix="/api", tags=["Database Schema"])
 app.include_router(query_router, prefix="/api", tags=["Query"])
+app.include_router(metrics_router, prefix="/api", tags=["Metrics"])
 
 # ============================================================
 # 💓 Health Check
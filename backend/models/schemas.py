@@ -67,6 +67,9 @@ class QueryRequest(BaseModel):
     query: str = Field(
         ..., description="User query (general, RAG, or DB)"
     )
+    bypass_cache: bool = Field(
+        False, description="Re-run DB queries instead of using cached results"
+    )
 
 
 # =====================================================
@@ -2,11 +2,18 @@
 
 import os
 from pathlib import Path
+from typing import List, Optional
 from dotenv import load_dotenv
 
 # Load .env file
 load_dotenv()
 
+
+def _env_bool(name: str, default: bool = False) -> bool:
+    """Read a boolean flag from the environment ("1", "true", "yes", "on")."""
+    return os.getenv(name, str(default)).strip().lower() in ("1", "true", "yes", "on")
+
+
 # ==============================
 # 📂 Paths
 # ==============================
@@ -15,9 +22,10 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 DATA_DIR = BASE_DIR / "data"
 UPLOAD_DIR = DATA_DIR / "uploads"
 PROCESSED_DIR = DATA_DIR / "processed"
+CACHE_DIR = DATA_DIR / "cache"
 
 # Create folders if not exist
-for folder in [DATA_DIR, UPLOAD_DIR, PROCESSED_DIR]:
+for folder in [DATA_DIR, UPLOAD_DIR, PROCESSED_DIR, CACHE_DIR]:
     folder.mkdir(parents=True, exist_ok=True)
 
 # ==============================
@@ -33,6 +41,152 @@ EMBEDDING_MODEL: str = os.getenv("EMBEDDING_MODEL", "BAAI/bge-small-en-v1.5")
 GROQ_API_KEY: str = os.getenv("GROQ_API_KEY", "")
 GEMINI_API_KEY: str = os.getenv("GEMINI_API_KEY", "")
 
+# ==============================
+# 🤖 LLM Config
+# ==============================
+# "gemini" (default) or "fake" (offline, deterministic — load/latency testing)
+LLM_PROVIDER: str = os.getenv("LLM_PROVIDER", "gemini").strip().lower()
+
+# Fake provider timing model: latency + answer_tokens / tokens_per_second
+FAKE_LLM_LATENCY_MS: float = float(os.getenv("FAKE_LLM_LATENCY_MS", 300))
+FAKE_LLM_TOKENS_PER_SECOND: float = float(os.getenv("FAKE_LLM_TOKENS_PER_SECOND", 80))
+FAKE_LLM_ANSWER_TOKENS: int = int(os.getenv("FAKE_LLM_ANSWER_TOKENS", 60))
+
+# Per-call deadline for async LLM generation (seconds)
+LLM_TIMEOUT_SECONDS: float = float(os.getenv("LLM_TIMEOUT_SECONDS", 60))
+
+# Persistent exact-match response cache (SQLite)
+LLM_CACHE_ENABLED: bool = _env_bool("LLM_CACHE_ENABLED", True)
+# Temperature-0 calls are always eligible; this opts sampled calls in too
+LLM_CACHE_NONDETERMINISTIC: bool = _env_bool("LLM_CACHE_NONDETERMINISTIC", False)
+LLM_CACHE_TTL_SECONDS: int = int(os.getenv("LLM_CACHE_TTL_SECONDS", 7 * 24 * 3600))
+LLM_CACHE_MAX_ENTRIES: int = int(os.getenv("LLM_CACHE_MAX_ENTRIES", 20000))
+
+# ==============================
+# 🏎️ Agent Speculation (opt-in)
+# ==============================
+# Start vector retrieval in parallel with the routing LLM call
+SPECULATIVE_TOOL_EXECUTION: bool = _env_bool("SPECULATIVE_TOOL_EXECUTION", False)
+# Also pre-load the DB schema in parallel (only when a DB is connected)
+SPECULATIVE_SCHEMA_LOADING: bool = _env_bool("SPECULATIVE_SCHEMA_LOADING", False)
+
+# ==============================
+# 🗄️ NL → SQL Config
+# ==============================
+# Schema text in the SQL prompt: "compact" (table(col TYPE ...) lines) or "json" (legacy)
+SQL_SCHEMA_FORMAT: str = os.getenv("SQL_SCHEMA_FORMAT", "compact").strip().lower()
+# Approximate token budget for the rendered schema (0 = unlimited)
+SQL_SCHEMA_TOKEN_BUDGET: int = int(os.getenv("SQL_SCHEMA_TOKEN_BUDGET", 6000))
+
+# Relevance-pruned schema: only the top-K tables (+ FK neighbours) reach the SQL prompt
+SQL_SCHEMA_SELECTION: bool = _env_bool("SQL_SCHEMA_SELECTION", True)
+SQL_SCHEMA_SELECT_MIN_TABLES: int = int(os.getenv("SQL_SCHEMA_SELECT_MIN_TABLES", 25))
+SQL_SCHEMA_TOP_K_TABLES: int = int(os.getenv("SQL_SCHEMA_TOP_K_TABLES", 10))
+SQL_SCHEMA_MAX_TABLES: int = int(os.getenv("SQL_SCHEMA_MAX_TABLES", 25))
+
+# Per-session schema cache: hard TTL + how often the cheap fingerprint is re-checked
+SCHEMA_CACHE_TTL_SECONDS: int = int(os.getenv("SCHEMA_CACHE_TTL_SECONDS", 3600))
+SCHEMA_FINGERPRINT_INTERVAL_SECONDS: float = float(os.getenv("SCHEMA_FINGERPRINT_INTERVAL_SECONDS", 30))
+# Threads for per-table reflection on dialects without a bulk reflection query
+SCHEMA_REFLECTION_WORKERS: int = int(os.getenv("SCHEMA_REFLECTION_WORKERS", 4))
+
+# Persistent NL → SQL cache: (schema fingerprint, db_type, normalized question) → SQL payload
+SQL_CACHE_ENABLED: bool = _env_bool("SQL_CACHE_ENABLED", True)
+SQL_CACHE_TTL_SECONDS: int = int(os.getenv("SQL_CACHE_TTL_SECONDS", 30 * 24 * 3600))
+SQL_CACHE_MAX_ENTRIES: int = int(os.getenv("SQL_CACHE_MAX_ENTRIES", 5000))
+# Nearest-neighbour reuse needs cosine similarity ≥ this (and identical numbers)
+SQL_CACHE_SIMILARITY_THRESHOLD: float = float(os.getenv("SQL_CACHE_SIMILARITY_THRESHOLD", 0.95))
+
+# In-memory DB result cache: (engine URL fingerprint, SQL) → rows
+RESULT_CACHE_ENABLED: bool = _env_bool("RESULT_CACHE_ENABLED", True)
+# Default TTL (a session can override it at /db/connect; 0 disables caching)
+RESULT_CACHE_TTL_SECONDS: int = int(os.getenv("RESULT_CACHE_TTL_SECONDS", 300))
+# Results larger than this are never cached; total cache size is capped too
+RESULT_CACHE_MAX_ENTRY_BYTES: int = int(os.getenv("RESULT_CACHE_MAX_ENTRY_BYTES", 2 * 1024 * 1024))
+RESULT_CACHE_MAX_TOTAL_BYTES: int = int(os.getenv("RESULT_CACHE_MAX_TOTAL_BYTES", 64 * 1024 * 1024))
+
+# Bounded fetch: stop reading a result at this many rows / serialized bytes
+SQL_MAX_ROWS: int = int(os.getenv("SQL_MAX_ROWS", 1000))
+SQL_MAX_RESULT_BYTES: int = int(os.getenv("SQL_MAX_RESULT_BYTES", 2 * 1024 * 1024))
+SQL_FETCH_BATCH_SIZE: int = int(os.getenv("SQL_FETCH_BATCH_SIZE", 500))
+# Run an extra COUNT(*) for truncated results (exact, but can be expensive)
+SQL_COUNT_TRUNCATED_RESULTS: bool = _env_bool("SQL_COUNT_TRUNCATED_RESULTS", False)
+# Server-enforced execution deadline per generated query (0 = no limit)
+SQL_STATEMENT_TIMEOUT_SECONDS: float = float(os.getenv("SQL_STATEMENT_TIMEOUT_SECONDS", 30))
+
+# EXPLAIN cost guard: "off", "reject" (over budget → not executed) or "limit"
+# (over budget → retry with SQL_COST_GUARD_LIMIT_ROWS, reject if still over)
+SQL_COST_GUARD_MODE: str = os.getenv("SQL_COST_GUARD_MODE", "limit").strip().lower()
+# Planner cost budget (Postgres / MySQL cost units, estimated on the LIMIT-ed query)
+SQL_COST_GUARD_MAX_COST: float = float(os.getenv("SQL_COST_GUARD_MAX_COST", 1_000_000))
+SQL_COST_GUARD_LIMIT_ROWS: int = int(os.getenv("SQL_COST_GUARD_LIMIT_ROWS", 100))
+# Plan estimates + actual outcomes, one JSON line per executed / rejected query
+# (opt-in; rotated to "<path>.1" past SQL_PLAN_LOG_MAX_BYTES, 0 = no cap)
+SQL_PLAN_LOG_ENABLED: bool = _env_bool("SQL_PLAN_LOG_ENABLED", False)
+SQL_PLAN_LOG_PATH: Path = Path(os.getenv("SQL_PLAN_LOG_PATH", str(DATA_DIR / "logs" / "sql_plans.jsonl")))
+SQL_PLAN_LOG_MAX_BYTES: int = int(os.getenv("SQL_PLAN_LOG_MAX_BYTES", 10 * 1024 * 1024))
+# User questions can carry personal data: only logged when explicitly enabled
+SQL_PLAN_LOG_QUESTIONS: bool = _env_bool("SQL_PLAN_LOG_QUESTIONS", False)
+
+# Failed SQL recovery: local repairs (dialect transpile, schema identifiers)
+# first, then at most one bounded LLM repair call per query
+SQL_REPAIR_ENABLED: bool = _env_bool("SQL_REPAIR_ENABLED", True)
+SQL_REPAIR_LLM_TIMEOUT_SECONDS: float = float(os.getenv("SQL_REPAIR_LLM_TIMEOUT_SECONDS", 20))
+
+# Process sandbox: queries of these dialects run in a pool of worker processes
+# under memory / CPU rlimits; a worker that overruns is killed and replaced
+SQL_SANDBOX_ENABLED: bool = _env_bool("SQL_SANDBOX_ENABLED", False)
+SQL_SANDBOX_DIALECTS: List[str] = [
+    d.strip().lower() for d in os.getenv("SQL_SANDBOX_DIALECTS", "sqlite").split(",") if d.strip()
+]
+SQL_SANDBOX_WORKERS: int = int(os.getenv("SQL_SANDBOX_WORKERS", 2))
+# Address space a worker may add on top of its (preloaded) baseline
+SQL_SANDBOX_MEMORY_MB: int = int(os.getenv("SQL_SANDBOX_MEMORY_MB", 512))
+# CPU seconds per query (RLIMIT_CPU, re-armed before every query)
+SQL_SANDBOX_CPU_SECONDS: int = int(os.getenv("SQL_SANDBOX_CPU_SECONDS", 30))
+# Wall-clock slack past SQL_STATEMENT_TIMEOUT_SECONDS before a stuck worker is killed
+SQL_SANDBOX_GRACE_SECONDS: float = float(os.getenv("SQL_SANDBOX_GRACE_SECONDS", 5))
+
+# db_tool payload layout: "rows" (list of dicts) or "columnar" (columns + value arrays)
+SQL_RESULT_FORMAT: str = os.getenv("SQL_RESULT_FORMAT", "rows").strip().lower()
+
+# Engine manager: at most this many live engines (LRU beyond), idle ones are disposed
+DB_MAX_ENGINES: int = int(os.getenv("DB_MAX_ENGINES", 200))
+DB_ENGINE_IDLE_TTL_SECONDS: int = int(os.getenv("DB_ENGINE_IDLE_TTL_SECONDS", 900))
+# Background health check of idle pools (replaces a ping on every checkout)
+DB_HEALTH_CHECK_INTERVAL_SECONDS: int = int(os.getenv("DB_HEALTH_CHECK_INTERVAL_SECONDS", 60))
+DB_POOL_PRE_PING: bool = _env_bool("DB_POOL_PRE_PING", False)
+# Optional overrides of the per-dialect pool settings in db_types (unset = dialect default)
+DB_POOL_SIZE: Optional[int] = int(os.getenv("DB_POOL_SIZE")) if os.getenv("DB_POOL_SIZE") else None
+DB_MAX_OVERFLOW: Optional[int] = int(os.getenv("DB_MAX_OVERFLOW")) if os.getenv("DB_MAX_OVERFLOW") else None
+DB_POOL_RECYCLE_SECONDS: Optional[int] = (
+    int(os.getenv("DB_POOL_RECYCLE_SECONDS")) if os.getenv("DB_POOL_RECYCLE_SECONDS") else None
+)
+
+# Async execution: SQLAlchemy asyncio engines when the driver is installed,
+# else a bounded thread pool; concurrent queries are capped per target database
+DB_ASYNC_EXECUTION: bool = _env_bool("DB_ASYNC_EXECUTION", True)
+DB_EXECUTOR_THREADS: int = int(os.getenv("DB_EXECUTOR_THREADS", 8))
+DB_MAX_CONCURRENT_QUERIES_PER_TARGET: int = int(os.getenv("DB_MAX_CONCURRENT_QUERIES_PER_TARGET", 8))
+
+# Results above this many rows reach the answer LLM as column profiles + a sample
+DB_SUMMARY_ROW_THRESHOLD: int = int(os.getenv("DB_SUMMARY_ROW_THRESHOLD", 50))
+DB_SUMMARY_SAMPLE_ROWS: int = int(os.getenv("DB_SUMMARY_SAMPLE_ROWS", 10))
+DB_SUMMARY_TOP_K: int = int(os.getenv("DB_SUMMARY_TOP_K", 5))
+
+# Trivial results (empty, scalar, one row, short two-column lists) are answered
+# from templates instead of an answer LLM call
+DB_TEMPLATE_ANSWERS: bool = _env_bool("DB_TEMPLATE_ANSWERS", True)
+DB_TEMPLATE_MAX_COLUMNS: int = int(os.getenv("DB_TEMPLATE_MAX_COLUMNS", 6))
+DB_TEMPLATE_MAX_LIST_ROWS: int = int(os.getenv("DB_TEMPLATE_MAX_LIST_ROWS", 10))
+
+# Result rows in the answer prompt: "tsv" / "markdown" (one header line) or "repr" (legacy)
+DB_PROMPT_ROW_FORMAT: str = os.getenv("DB_PROMPT_ROW_FORMAT", "tsv").strip().lower()
+# Cells longer than this are cut (0 = no limit)
+DB_PROMPT_MAX_CELL_CHARS: int = int(os.getenv("DB_PROMPT_MAX_CELL_CHARS", 120))
+# Approximate token budget for the rendered rows (0 = unlimited)
+DB_PROMPT_TOKEN_BUDGET: int = int(os.getenv("DB_PROMPT_TOKEN_BUDGET", 3000))
+
 # ==============================
 # ⚙️ Chunking Config
 # ==============================
@@ -0,0 +1,58 @@
+# test/test_answer_templates_manual.py
+
+"""
+Template answers for trivial DB results: which shapes skip the answer
+LLM, what the rendered answers look like, and which results still need
+an explanation.
+"""
+
+from backend.core.db.answer_templates import render_template_answer, template_answer_stats
+
+SQL = "SELECT ..."
+
+TEMPLATED = {
+    "empty": [],
+    "scalar": [{"COUNT(*)": 1000}],
+    "record": [{"name": "user_7", "country": "India", "total_spent": 1234.5, "active": True}],
+    "pairs": [{"country": "India", "orders": 512}, {"country": "USA", "orders": 488}],
+}
+
+for shape, rows in TEMPLATED.items():
+    answer = render_template_answer({"sql": SQL, "rows": rows}, rows)
+    assert answer is not None, shape
+    print(f"\n🧾 {shape}:\n{answer}")
+
+# Keys, ids and years are labels: no thousands separators; measures keep them
+by_year = [{"year": 2023, "orders": 1500}, {"year": 2024, "orders": 2750}]
+answer = render_template_answer({"sql": SQL}, by_year)
+print(f"\n🗓️ pairs (year, count):\n{answer}")
+assert "**2024**: 2,750" in answer and "2,024" not in answer
+
+order = [{"id": 1001, "customerId": 20045, "order_year": 2024, "amount": 12500}]
+answer = render_template_answer({"sql": SQL}, order)
+print(f"\n🆔 record with ids:\n{answer}")
+assert "**Id**: 1001" in answer and "**Customer id**: 20045" in answer
+assert "**Order year**: 2024" in answer and "**Amount**: 12,500" in answer
+
+assert "**1001**" in render_template_answer({"sql": SQL}, [{"customer_id": 1001}])
+assert "**1,001**" in render_template_answer({"sql": SQL}, [{"COUNT(*)": 1001}])
+
+many_columns = [{f"c{i}": i for i in range(10)}]
+long_list = [{"k": i, "v": i * 2} for i in range(50)]
+wide_list = [{"a": 1, "b": 2, "c": 3}, {"a": 4, "b": 5, "c": 6}]
+LLM = {
+    "many columns": ({"sql": SQL}, many_columns),
+    "long list": ({"sql": SQL}, long_list),
+    "3-column list": ({"sql": SQL}, wide_list),
+    "truncated": ({"sql": SQL, "truncated": True}, [{"n": 1}]),
+    "error": ({"sql": SQL, "error": {"type": "timeout"}}, []),
+    "blocked": ({"sql": None}, []),
+}
+
+print("\n🤖 Still explained by the LLM:")
+for label, (payload, rows) in LLM.items():
+    assert render_template_answer(payload, rows) is None, label
+    print(f"   {label}")
+
+print(f"\n📈 Stats: {template_answer_stats()}")
+print("\n✅ Template answer test completed")
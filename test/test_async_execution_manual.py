@@ -0,0 +1,134 @@
+# test/test_async_execution_manual.py
+
+"""
+Event-loop responsiveness while slow SQL runs (SQLite fixture).
+
+A heartbeat task ticks every 10 ms; its worst delay shows how long the
+loop was frozen. Compares the old inline call with the async-engine path
+(aiosqlite) and the bounded thread-pool fallback, and checks the
+per-target concurrency cap.
+"""
+
+import asyncio
+import shutil
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from backend.core.db import db_executor, db_manager
+from backend.core.db.db_manager import (
+    aclear_all_db_connections,
+    connect_db,
+    disconnect_db,
+    get_db_engine,
+)
+from backend.core.db.db_executor import _execute_sql, execute_sql_nonblocking
+
+SESSION_ID = "async_execution_test_session"
+
+# ~1 s of pure SQLite CPU work
+SLOW_SQL = """
+WITH RECURSIVE n(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM n WHERE x < 3000000)
+SELECT COUNT(*) AS c FROM n
+"""
+
+
+async def heartbeat(stop: asyncio.Event, lags: list):
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(0.01)
+        lags.append((time.perf_counter() - started - 0.01) * 1000)
+
+
+async def measure(label: str, run):
+    stop, lags = asyncio.Event(), []
+    ticker = asyncio.create_task(heartbeat(stop, lags))
+    await asyncio.sleep(0.02)
+
+    started = time.perf_counter()
+    await run()
+    elapsed = (time.perf_counter() - started) * 1000
+
+    stop.set()
+    await ticker
+    print(f"{label:<14} query={elapsed:7.1f} ms   worst loop stall={max(lags):7.1f} ms")
+    return max(lags)
+
+
+async def main(url: str):
+    connect_db(SESSION_ID, url)
+    engine = get_db_engine(SESSION_ID)
+
+    async def inline():
+        _execute_sql(engine, SLOW_SQL, "sqlite")
+
+    async def nonblocking():
+        await execute_sql_nonblocking(SESSION_ID, engine, SLOW_SQL, "sqlite")
+
+    blocked = await measure("inline (old)", inline)
+
+    threaded = await measure("thread pool", nonblocking)
+    assert db_manager.get_async_db_engine(SESSION_ID) is None
+
+    # Re-attach so the aiosqlite engine is built (if installed)
+    disconnect_db(SESSION_ID)
+    db_manager.DB_ASYNC_EXECUTION = True
+    connect_db(SESSION_ID, url)
+    engine = get_db_engine(SESSION_ID)
+
+    async_engine = db_manager.get_async_db_engine(SESSION_ID)
+    if async_engine is not None:
+        await measure("async engine", nonblocking)
+    else:
+        print("async engine   skipped (aiosqlite / greenlet not installed)")
+
+    assert threaded < blocked / 4, "thread offload should keep the loop responsive"
+
+    # Async driver that cannot connect → same query on the sync engine, async disabled
+    if async_engine is not None:
+        def broken_connect(self):
+            raise TypeError("connect() got an unexpected keyword argument 'sslmode'")
+
+        original_connect = AsyncEngine.connect
+        AsyncEngine.connect = broken_connect
+        try:
+            result = await execute_sql_nonblocking(SESSION_ID, engine, "SELECT 1 AS ok", "sqlite")
+        finally:
+            AsyncEngine.connect = original_connect
+        assert result["rows"] == [{"ok": 1}]
+        assert db_manager.get_async_db_engine(SESSION_ID) is None
+        print("async connect failure → served by the sync engine, async twin disabled")
+
+    # Per-target cap: 6 concurrent queries, cap of 2 → three waves
+    db_executor._TARGET_SEMAPHORES.clear()
+    db_executor.DB_MAX_CONCURRENT_QUERIES_PER_TARGET = 2
+    started = time.perf_counter()
+    await asyncio.gather(*(nonblocking() for _ in range(6)))
+    print(f"6 queries, cap=2 → {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    disconnect_db(SESSION_ID)
+    await aclear_all_db_connections()  # waits for the async engine disposal
+
+
+# libpq-only URL options never reach asyncpg
+pg_url = make_url("postgresql://u:p@db:5432/app?sslmode=require&connect_timeout=10&application_name=qv")
+async_url = db_manager._async_url(pg_url, "postgresql", "asyncpg")
+print(f"async URL query: {dict(pg_url.query)} → {dict(async_url.query)}")
+assert dict(async_url.query) == {"ssl": "require"} and async_url.drivername == "postgresql+asyncpg"
+
+with tempfile.TemporaryDirectory() as tmp:
+    db_path = Path(tmp) / "fixture.db"
+    sqlite3.connect(db_path).close()
+
+    # Thread-pool path first, then the async engine
+    db_manager.DB_ASYNC_EXECUTION = False
+    try:
+        asyncio.run(main(f"sqlite:///{db_path}"))
+    finally:
+        shutil.rmtree(db_manager._get_db_session_dir(SESSION_ID), ignore_errors=True)
+
+print("\n✅ Async execution test completed")
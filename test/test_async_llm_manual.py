@@ -0,0 +1,95 @@
+# test/test_async_llm_manual.py
+
+"""
+Async LLM path (offline fake LLM): concurrent answers overlap instead of
+queueing, the event loop keeps ticking meanwhile, the timeout is
+enforced, and a client disconnect cancels the in-flight call.
+"""
+
+import os
+
+# Must be set BEFORE backend modules are imported
+os.environ["LLM_PROVIDER"] = "fake"
+os.environ["FAKE_LLM_LATENCY_MS"] = "300"
+os.environ.setdefault("FAKE_LLM_TOKENS_PER_SECOND", "1000")
+os.environ["LLM_CACHE_ENABLED"] = "false"
+
+import asyncio
+import time
+
+from fastapi import HTTPException
+
+from backend.api.routes import query as query_route
+from backend.core.llm.llm_engine import _general_inputs, agenerate_general_answer, ainvoke_chain, get_answer_chain
+
+MODEL = "gemini-2.5-flash"
+CONCURRENCY = 10
+
+
+async def _ticker(lags: list, stop: asyncio.Event) -> None:
+    """Largest event-loop delay past a 10 ms sleep."""
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(0.01)
+        lags.append(time.perf_counter() - started - 0.01)
+
+
+class _DisconnectingRequest:
+    """Starlette Request stand-in: the client goes away after `after` seconds."""
+
+    def __init__(self, after: float):
+        self.deadline = time.perf_counter() + after
+
+    async def is_disconnected(self) -> bool:
+        return time.perf_counter() > self.deadline
+
+
+async def main():
+    lags: list = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(_ticker(lags, stop))
+
+    # 1️⃣ Concurrent answers overlap (≈ one call's latency, not N×)
+    started = time.perf_counter()
+    answers = await asyncio.gather(*[
+        agenerate_general_answer(f"Question {i}?", model_name=MODEL) for i in range(CONCURRENCY)
+    ])
+    elapsed = time.perf_counter() - started
+    print(f"\n⚡ {CONCURRENCY} concurrent answers in {elapsed * 1000:.0f} ms")
+    assert all(not a["response"].startswith("⚠") for a in answers)
+    assert elapsed < 0.3 * CONCURRENCY / 3
+
+    # 2️⃣ Timeout → asyncio.TimeoutError from ainvoke_chain, error answer from the wrapper
+    chain = get_answer_chain(model_name=MODEL)
+    started = time.perf_counter()
+    try:
+        await ainvoke_chain(chain, _general_inputs("slow?", None), MODEL, 0.4, timeout=0.05)
+        raise AssertionError("timeout not enforced")
+    except asyncio.TimeoutError:
+        print(f"⏱️ timed out after {(time.perf_counter() - started) * 1000:.0f} ms")
+
+    answer = await agenerate_general_answer("slow?", model_name=MODEL, timeout=0.05)
+    assert answer["response"].startswith("⚠ Error generating response")
+
+    # 3️⃣ Client disconnect cancels the in-flight call
+    call = ainvoke_chain(chain, _general_inputs("abandoned?", None), MODEL, 0.4, timeout=30)
+    query_route.DISCONNECT_POLL_INTERVAL = 0.02
+    started = time.perf_counter()
+    try:
+        await query_route._run_until_disconnect(_DisconnectingRequest(after=0.05), call)
+        raise AssertionError("disconnect not detected")
+    except HTTPException as e:
+        assert e.status_code == 499
+    stopped_ms = (time.perf_counter() - started) * 1000
+    print(f"🔌 disconnect → 499 after {stopped_ms:.0f} ms (call would take ≥ 300 ms)")
+    assert stopped_ms < 250
+
+    stop.set()
+    await ticker
+    print(f"🫀 event loop max lag: {max(lags) * 1000:.1f} ms over {len(lags)} ticks")
+    assert max(lags) < 0.1
+
+
+asyncio.run(main())
+
+print("\n✅ Async LLM test completed")
@@ -0,0 +1,134 @@
+# test/test_cost_guard_manual.py
+
+"""
+EXPLAIN cost guard: plan parsing per dialect (captured Postgres / MySQL
+EXPLAIN JSON), ok / auto-limit / reject decisions, and the record-only
+SQLite path end to end, including the JSONL plan log.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+_tmp = tempfile.TemporaryDirectory()
+
+# Must be set before backend.utils.config is imported
+os.environ["SQL_PLAN_LOG_ENABLED"] = "true"
+os.environ["SQL_PLAN_LOG_PATH"] = str(Path(_tmp.name) / "sql_plans.jsonl")
+os.environ["SQL_PLAN_LOG_MAX_BYTES"] = "4096"
+os.environ["SQL_PLAN_LOG_QUESTIONS"] = "false"
+os.environ["SQL_COST_GUARD_MAX_COST"] = "50000"
+
+import json
+import sqlite3
+
+from backend.core.db import cost_guard
+from backend.core.db.cost_guard import (
+    QueryTooExpensiveError,
+    _parse_mysql,
+    _parse_postgresql,
+    cost_guard_stats,
+    guard_plan,
+    record_plan,
+)
+from backend.core.db.db_executor import _execute_sql, _with_row_limit
+from sqlalchemy import create_engine
+
+# 1️⃣ Parsers (captured EXPLAIN output)
+PG_PLAN = json.dumps([{"Plan": {
+    "Node Type": "Limit", "Total Cost": 1234.5, "Plan Rows": 1001,
+    "Plans": [{"Node Type": "Hash Join", "Plan Rows": 250000, "Plans": [
+        {"Node Type": "Seq Scan", "Relation Name": "orders", "Plan Rows": 250000},
+        {"Node Type": "Index Scan", "Relation Name": "users", "Plan Rows": 1},
+    ]}],
+}}])
+pg = _parse_postgresql([(PG_PLAN,)])
+print(f"🐘 Postgres: {pg}")
+assert pg["cost"] == 1234.5 and pg["rows"] == 250000 and pg["full_scans"] == 1
+
+MYSQL_PLAN = {"query_block": {
+    "cost_info": {"query_cost": "98765.40"},
+    "nested_loop": [
+        {"table": {"table_name": "orders", "access_type": "ALL", "rows_produced_per_join": 400000}},
+        {"table": {"table_name": "users", "access_type": "eq_ref", "rows_produced_per_join": 400000}},
+    ],
+}}
+my = _parse_mysql([(json.dumps(MYSQL_PLAN),)])
+print(f"🐬 MySQL: {my}")
+assert my["cost"] == 98765.4 and my["full_scans"] == 1
+
+# 2️⃣ Decisions (cost depends on the injected LIMIT, as on a real planner)
+def fake_estimate(conn, sql, db_type):
+    limit = int(sql.rsplit("LIMIT", 1)[1].split()[0])
+    return {"cost": limit * COST_PER_ROW, "rows": limit, "full_scans": 1, "plan": []}
+
+real_estimate = cost_guard.estimate_plan
+cost_guard.estimate_plan = fake_estimate
+try:
+    COST_PER_ROW = 10
+    ok = guard_plan(None, "SELECT * FROM t", "postgresql", 1000, _with_row_limit)
+    assert ok["decision"] == "ok" and ok["max_rows"] == 1000
+
+    COST_PER_ROW = 200  # 1001 rows → 200k (over), 101 rows → 20k (fits)
+    limited = guard_plan(None, "SELECT * FROM t", "postgresql", 1000, _with_row_limit)
+    print(f"✂️ Auto-limited: {limited['estimate']['unlimited_cost']:,.0f} → {limited['estimate']['cost']:,.0f}")
+    assert limited["decision"] == "limited" and limited["max_rows"] == 100
+
+    COST_PER_ROW = 1000  # still over budget with 101 rows
+    try:
+        guard_plan(None, "SELECT * FROM t", "postgresql", 1000, _with_row_limit)
+        raise AssertionError("query should be rejected")
+    except QueryTooExpensiveError as e:
+        print(f"🚫 Rejected: {e}")
+
+    cost_guard.SQL_COST_GUARD_MODE = "reject"
+    COST_PER_ROW = 200
+    try:
+        guard_plan(None, "SELECT * FROM t", "postgresql", 1000, _with_row_limit)
+        raise AssertionError("reject mode must not auto-limit")
+    except QueryTooExpensiveError:
+        pass
+finally:
+    cost_guard.estimate_plan = real_estimate
+    cost_guard.SQL_COST_GUARD_MODE = "limit"
+
+# 3️⃣ SQLite: plan recorded, never blocks
+db_path = Path(_tmp.name) / "fixture.db"
+conn = sqlite3.connect(db_path)
+conn.execute("CREATE TABLE orders (id INTEGER PRIMARY KEY, region TEXT, amount REAL)")
+conn.execute("CREATE INDEX idx_region ON orders(region)")
+conn.executemany("INSERT INTO orders (region, amount) VALUES (?, ?)", [("north", 1.0), ("south", 2.0)] * 50)
+conn.commit()
+conn.close()
+
+engine = create_engine(f"sqlite:///{db_path}")
+scan = _execute_sql(engine, "SELECT * FROM orders", "sqlite")
+indexed = _execute_sql(engine, "SELECT id FROM orders WHERE region = 'north'", "sqlite")
+engine.dispose()
+
+print(f"🪶 SQLite full scan: {scan['plan_estimate']}")
+print(f"🪶 SQLite indexed  : {indexed['plan_estimate']}")
+assert scan["plan_estimate"]["full_scans"] == 1 and scan["plan_estimate"]["decision"] == "ok"
+assert indexed["plan_estimate"]["full_scans"] == 0
+assert scan["row_count"] == 100
+
+# 4️⃣ Plan log
+log_path = Path(os.environ["SQL_PLAN_LOG_PATH"])
+record_plan({"question": "all orders?", "sql": "SELECT * FROM orders", "estimate": scan["plan_estimate"], "row_count": 100})
+last = json.loads(log_path.read_text().splitlines()[-1])
+assert last["row_count"] == 100 and "question" not in last
+
+# Size cap → rotated to <path>.1, never grows past the cap
+for _ in range(50):
+    record_plan({"sql": "SELECT * FROM orders", "estimate": scan["plan_estimate"], "row_count": 100})
+rotated = log_path.with_name(log_path.name + ".1")
+print(f"\n📝 Plan log: {log_path.stat().st_size} bytes | rotated: {rotated.stat().st_size} bytes")
+assert rotated.exists() and log_path.stat().st_size <= 4096
+assert cost_guard_stats()["rotated"] >= 1
+
+print("\n📈 Cost guard stats:")
+for key, value in cost_guard_stats().items():
+    print(f"   {key}: {value}")
+
+_tmp.cleanup()
+print("\n✅ Cost guard test completed")
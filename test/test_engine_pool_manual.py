@@ -0,0 +1,101 @@
+# test/test_engine_pool_manual.py
+
+"""
+Engine governance on SQLite fixtures: shared engines per target, LRU cap,
+idle eviction, lazy rehydration from db_config.json, background health
+checks, reference-counted disconnect and pool stats.
+"""
+
+import os
+
+# Must be set before backend.utils.config is imported
+os.environ["DB_MAX_ENGINES"] = "3"
+
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+from backend.core.db import db_manager
+from backend.core.db.db_manager import (
+    connect_db,
+    disconnect_db,
+    get_db_engine,
+    evict_idle_engines,
+    check_engine_health,
+    db_pool_stats,
+)
+from backend.core.db.schema_cache import get_cached_schema, schema_cache_stats
+
+SESSIONS = [f"engine_pool_test_{i}" for i in range(5)]
+
+with tempfile.TemporaryDirectory() as tmp:
+    urls = []
+    for i in range(4):
+        db_path = Path(tmp) / f"fixture_{i}.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)")
+        conn.commit()
+        conn.close()
+        urls.append(f"sqlite:///{db_path}")
+
+    # Same file, spelled differently → same normalized fingerprint
+    alias_url = f"sqlite:///{Path(tmp) / '.' / 'fixture_0.db'}"
+
+    try:
+        # 1️⃣ Shared engine: two sessions, one target
+        connect_db(SESSIONS[0], urls[0])
+        connect_db(SESSIONS[1], alias_url)
+        assert get_db_engine(SESSIONS[0]) is get_db_engine(SESSIONS[1])
+        print(f"🔗 Shared engines: {db_pool_stats()['shared_engines']} | max refs: {db_pool_stats()['max_refs']}")
+
+        # 2️⃣ LRU cap: 4 targets, only 3 live engines (fixture_0 used least recently)
+        for session_id, url in zip(SESSIONS[2:], urls[1:]):
+            connect_db(session_id, url)
+
+        print(f"🧠 Live engines: {len(db_manager._ENGINES)} | sessions: {len(db_manager._DB_CONNECTIONS)}")
+        assert len(db_manager._ENGINES) == 3
+        assert SESSIONS[0] not in db_manager._DB_CONNECTIONS, "LRU target should be evicted"
+
+        # 3️⃣ Lazy rehydrate of an evicted session (config still on disk)
+        schema = get_cached_schema(SESSIONS[0])
+        assert "users" in schema["tables"]
+        assert SESSIONS[0] in db_manager._DB_CONNECTIONS
+
+        # 4️⃣ Idle eviction, then rehydrate without schema re-inspection
+        reloads = schema_cache_stats()["reloads"]
+        time.sleep(0.05)
+        evicted = evict_idle_engines(idle_ttl_seconds=0)
+        print(f"💤 Idle engines evicted: {evicted}")
+        assert not db_manager._ENGINES and not db_manager._DB_CONNECTIONS
+
+        get_cached_schema(SESSIONS[0])
+        assert schema_cache_stats()["reloads"] == reloads, "schema cache should survive eviction"
+
+        # 5️⃣ Health check of idle pools
+        time.sleep(0.05)
+        failures = check_engine_health(interval_seconds=0)
+        print(f"🩺 Health check failures: {failures}")
+        assert failures == 0
+
+        # 6️⃣ Disconnect releases a reference; last one disposes the engine
+        get_db_engine(SESSIONS[1])
+        disconnect_db(SESSIONS[0])
+        assert len(db_manager._ENGINES) == 1, "engine still referenced by the other session"
+        disconnect_db(SESSIONS[1])
+        assert not db_manager._ENGINES
+
+        print("\n📈 Pool stats:")
+        for key, value in db_pool_stats().items():
+            print(f"   {key}: {value}")
+
+    finally:
+        for session_id in SESSIONS:
+            disconnect_db(session_id)
+            config_dir = db_manager._get_db_session_dir(session_id)
+            for file in config_dir.glob("*"):
+                file.unlink()
+            if config_dir.exists():
+                config_dir.rmdir()
+
+print("\n✅ Engine pool governance test completed")
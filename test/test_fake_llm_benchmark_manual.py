@@ -0,0 +1,131 @@
+# test/test_fake_llm_benchmark_manual.py
+
+"""
+End-to-end latency benchmark of agentic_rag_graph on the OFFLINE fake LLM.
+
+No Gemini quota, no network: the fake provider answers deterministically
+with a fixed latency + token rate, so everything above that modeled time
+is OUR overhead (graph, tools, SQL, memory, serialization).
+
+Covers the general and DB paths (DB uses a temporary SQLite fixture).
+The RAG path needs Qdrant + the embedding model and is not included.
+"""
+
+import os
+
+# Must be set BEFORE backend modules are imported
+os.environ["LLM_PROVIDER"] = "fake"
+os.environ.setdefault("FAKE_LLM_LATENCY_MS", "200")
+os.environ.setdefault("FAKE_LLM_TOKENS_PER_SECOND", "200")
+os.environ.setdefault("FAKE_LLM_ANSWER_TOKENS", "40")
+os.environ.setdefault("LLM_CACHE_ENABLED", "false")
+os.environ.setdefault("SQL_CACHE_ENABLED", "false")
+os.environ.setdefault("RESULT_CACHE_ENABLED", "false")
+
+import asyncio
+import shutil
+import sqlite3
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from langchain_core.messages import HumanMessage
+
+from backend.core.agent.graph_builder import agentic_rag_graph
+from backend.core.db import db_manager
+from backend.core.db.db_manager import aclear_all_db_connections, connect_db, disconnect_db
+from backend.utils.config import DB_TEMPLATE_ANSWERS
+
+CONCURRENCY = 20
+ROUNDS = 3
+
+LATENCY_MS = float(os.environ["FAKE_LLM_LATENCY_MS"])
+TOKENS_PER_SECOND = float(os.environ["FAKE_LLM_TOKENS_PER_SECOND"])
+ANSWER_TOKENS = int(os.environ["FAKE_LLM_ANSWER_TOKENS"])
+
+
+def _create_fixture_db(path: Path) -> None:
+    conn = sqlite3.connect(path)
+    conn.executescript(
+        """
+        CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, country TEXT);
+        CREATE TABLE orders (
+            id INTEGER PRIMARY KEY,
+            user_id INTEGER REFERENCES users(id),
+            product TEXT,
+            amount REAL
+        );
+        """
+    )
+    conn.executemany(
+        "INSERT INTO users (name, country) VALUES (?, ?)",
+        [(f"user_{i}", "India" if i % 2 else "USA") for i in range(100)],
+    )
+    conn.executemany(
+        "INSERT INTO orders (user_id, product, amount) VALUES (?, ?, ?)",
+        [(i % 100 + 1, f"product_{i % 7}", i * 1.5) for i in range(1000)],
+    )
+    conn.commit()
+    conn.close()
+
+
+async def _run_one(session_id: str, query: str) -> float:
+    started = time.perf_counter()
+    state = await agentic_rag_graph.ainvoke({
+        "session_id": session_id,
+        "docs": [],
+        "messages": [HumanMessage(content=query)],
+    })
+    assert state["final_output"]["response"]
+    return (time.perf_counter() - started) * 1000
+
+
+def _report(label: str, latencies, modeled_ms: float) -> None:
+    latencies = sorted(latencies)
+    p50 = statistics.median(latencies)
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(
+        f"{label:<8} n={len(latencies):<4} p50={p50:8.1f} ms  p95={p95:8.1f} ms  "
+        f"modeled LLM={modeled_ms:7.1f} ms  overhead p50={p50 - modeled_ms:7.1f} ms"
+    )
+
+
+async def main():
+    per_answer_ms = LATENCY_MS + ANSWER_TOKENS * 1000 / TOKENS_PER_SECOND
+    router_ms = LATENCY_MS + 1000 / TOKENS_PER_SECOND
+    sql_ms = LATENCY_MS + 6 * 1000 / TOKENS_PER_SECOND
+    # COUNT(*) is a scalar result: answered from a template when enabled
+    db_answer_ms = 0.0 if DB_TEMPLATE_ANSWERS else per_answer_ms
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "fixture.db"
+        _create_fixture_db(db_path)
+
+        sessions = [f"bench_session_{i}" for i in range(CONCURRENCY)]
+        for session_id in sessions:
+            connect_db(session_id, f"sqlite:///{db_path}")
+
+        try:
+            general, db = [], []
+            for _ in range(ROUNDS):
+                general += await asyncio.gather(*[
+                    _run_one(s, "What is machine learning?") for s in sessions
+                ])
+                db += await asyncio.gather(*[
+                    _run_one(s, "How many orders are there?") for s in sessions
+                ])
+
+            print(f"\n📊 Fake-LLM benchmark | concurrency={CONCURRENCY} | rounds={ROUNDS}")
+            _report("general", general, router_ms + per_answer_ms)
+            _report("db", db, router_ms + sql_ms + db_answer_ms)
+
+        finally:
+            for session_id in sessions:
+                disconnect_db(session_id)
+                shutil.rmtree(db_manager._get_db_session_dir(session_id), ignore_errors=True)
+            await aclear_all_db_connections()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
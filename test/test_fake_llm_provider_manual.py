@@ -0,0 +1,94 @@
+# test/test_fake_llm_provider_manual.py
+
+"""
+Offline fake LLM provider: responses are a pure function of the prompt
+(routing, SQL, answers), streamed tokens add up to the full answer, and
+latency follows latency_ms + tokens / tokens_per_second.
+"""
+
+import asyncio
+import time
+
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from backend.core.agent.tools.db_tool import db_tool
+from backend.core.agent.tools.rag_tool import rag_tool
+from backend.core.llm.llm_providers import FakeChatModel, build_chat_model
+
+LATENCY_MS = 100
+TOKENS_PER_SECOND = 200
+ANSWER_TOKENS = 20
+
+model = build_chat_model("fake", "gemini-2.5-flash", 0.0)
+assert isinstance(model, FakeChatModel)
+model = model.model_copy(update={
+    "latency_ms": LATENCY_MS,
+    "tokens_per_second": TOKENS_PER_SECOND,
+    "answer_tokens": ANSWER_TOKENS,
+})
+
+# ------------------------------------------------------------
+# 1️⃣ Deterministic answers
+# ------------------------------------------------------------
+prompt = [HumanMessage(content="Explain vector databases")]
+started = time.perf_counter()
+first = model.invoke(prompt)
+elapsed_ms = (time.perf_counter() - started) * 1000
+second = model.invoke(prompt)
+other = model.invoke([HumanMessage(content="Explain embeddings")])
+
+expected_ms = LATENCY_MS + ANSWER_TOKENS * 1000 / TOKENS_PER_SECOND
+print(f"\n🧪 answer: {first.content[:60]}…")
+print(f"⏱️ {elapsed_ms:.0f} ms (model: {expected_ms:.0f} ms)")
+assert first.content == second.content != other.content
+assert len(first.content.split()) == ANSWER_TOKENS
+assert expected_ms * 0.9 <= elapsed_ms <= expected_ms * 1.5
+
+# ------------------------------------------------------------
+# 2️⃣ Streaming = same text, token by token
+# ------------------------------------------------------------
+chunks = [chunk.content for chunk in model.stream(prompt)]
+assert "".join(chunks) == first.content and len(chunks) == ANSWER_TOKENS
+
+
+async def astream_text():
+    return "".join([chunk.content async for chunk in model.astream(prompt)])
+
+assert asyncio.run(astream_text()) == first.content
+print(f"📡 streamed {len(chunks)} tokens, same text sync + async")
+
+# ------------------------------------------------------------
+# 3️⃣ Routing with tools bound
+# ------------------------------------------------------------
+router = model.bind_tools([rag_tool, db_tool])
+system = SystemMessage(content="session_id: s-42\nUploaded documents in this session: handbook.pdf")
+
+for question, expected in [
+    ("How many orders were placed last month?", "db_tool"),
+    ("Summarize the leave policy in the document", "rag_tool"),
+    ("Tell me a joke", None),
+]:
+    reply = router.invoke([system, HumanMessage(content=question)])
+    chosen = reply.tool_calls[0]["name"] if reply.tool_calls else None
+    print(f"🧭 {question!r} → {chosen or reply.content}")
+    assert chosen == expected
+    if chosen:
+        assert reply.tool_calls[0]["args"] == {"session_id": "s-42", "query": question}
+
+# ------------------------------------------------------------
+# 4️⃣ SQL prompts → COUNT(*) over the first schema table
+# ------------------------------------------------------------
+sql = model.invoke([HumanMessage(content='Database Schema:\n{"tables": {"orders": {}}}\nReturn ONLY SQL')])
+print(f"🗄️ {sql.content}")
+assert sql.content == "SELECT COUNT(*) AS row_count FROM orders"
+
+# ------------------------------------------------------------
+# 5️⃣ Unknown provider
+# ------------------------------------------------------------
+try:
+    build_chat_model("nope", "x", 0.0)
+    raise AssertionError("unknown provider accepted")
+except ValueError as e:
+    print(f"🚫 {e}")
+
+print("\n✅ Fake LLM provider test completed")
@@ -0,0 +1,112 @@
+# test/test_llm_cache_manual.py
+
+"""
+LLM response cache (offline fake LLM): miss then hit through ainvoke_chain
+(sync + async + streaming), TTL expiry, LRU trimming, sampled calls kept
+out, and keys separated by provider so fake responses never answer for
+Gemini. Uses a throwaway cache file, never the app's llm_cache.sqlite3.
+"""
+
+import os
+
+# Must be set BEFORE backend modules are imported
+os.environ["LLM_PROVIDER"] = "fake"
+os.environ.setdefault("FAKE_LLM_LATENCY_MS", "50")
+os.environ["LLM_CACHE_ENABLED"] = "true"
+os.environ["LLM_CACHE_NONDETERMINISTIC"] = "false"
+
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from backend.core.llm import llm_engine
+from backend.core.llm.llm_cache import LLMResponseCache
+from backend.core.llm.llm_engine import _cache_key, _general_inputs, ainvoke_chain, get_answer_chain, invoke_chain
+from backend.core.llm.llm_registry import llm_registry
+
+MODEL = "gemini-2.5-flash"
+
+
+async def main(cache: LLMResponseCache):
+    chain = get_answer_chain(model_name=MODEL, temperature=0.0)
+    inputs = _general_inputs("What is a vector database?", None)
+
+    # 1️⃣ Miss → model call, then hit → no model call
+    started = time.perf_counter()
+    first = await ainvoke_chain(chain, inputs, MODEL, 0.0)
+    miss_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    second = await ainvoke_chain(chain, inputs, MODEL, 0.0)
+    hit_ms = (time.perf_counter() - started) * 1000
+
+    print(f"\n💾 miss {miss_ms:.1f} ms → hit {hit_ms:.1f} ms | {cache.stats()}")
+    assert second.content == first.content
+    assert cache.stats()["misses"] == 1 and cache.stats()["hits"] == 1 and cache.stats()["writes"] == 1
+    assert hit_ms < miss_ms
+
+    # Sync path + streaming path read the same entry
+    assert invoke_chain(chain, inputs, MODEL, 0.0).content == first.content
+    tokens = []
+    streamed = await ainvoke_chain(chain, inputs, MODEL, 0.0, on_token=tokens.append)
+    assert streamed.content == first.content and tokens == [first.content]
+    assert cache.stats()["hits"] == 3
+
+    # A different prompt is a different key
+    await ainvoke_chain(chain, _general_inputs("What is an embedding?", None), MODEL, 0.0)
+    assert cache.stats()["writes"] == 2
+
+    # 2️⃣ Sampled calls (temperature > 0) are not cached by default
+    warm = get_answer_chain(model_name=MODEL, temperature=0.4)
+    assert _cache_key(warm, inputs, MODEL, 0.4) is None
+    writes = cache.stats()["writes"]
+    await ainvoke_chain(warm, inputs, MODEL, 0.4)
+    assert cache.stats()["writes"] == writes
+    print("✅ temperature 0.4 bypasses the cache")
+
+    # 3️⃣ Provider is part of the key: fake entries never answer for Gemini
+    fake_key = _cache_key(chain, inputs, MODEL, 0.0)
+    llm_registry.provider = "gemini"
+    try:
+        gemini_key = _cache_key(chain, inputs, MODEL, 0.0)
+    finally:
+        llm_registry.provider = "fake"
+    print(f"🔑 fake={fake_key[:12]}… | gemini={gemini_key[:12]}…")
+    assert fake_key != gemini_key
+    assert cache.get(fake_key) is not None and cache.get(gemini_key) is None
+
+
+def check_expiry_and_lru(tmp: Path):
+    # 4️⃣ TTL: expired entries are misses
+    cache = LLMResponseCache(tmp / "ttl.sqlite3", ttl_seconds=1, max_entries=100)
+    key = cache.make_key("fake", MODEL, 0.0, "prompt")
+    cache.set(key, f"fake:{MODEL}", 0.0, "cached answer")
+    assert cache.get(key) == "cached answer"
+    time.sleep(1.2)
+    assert cache.get(key) is None
+    print(f"\n⏳ expired after TTL | {cache.stats()}")
+
+    # 5️⃣ LRU: the purge keeps the most recently used max_entries rows
+    cache = LLMResponseCache(tmp / "lru.sqlite3", ttl_seconds=3600, max_entries=3)
+    cache.PURGE_EVERY = 5
+    keys = [cache.make_key("fake", MODEL, 0.0, f"prompt {i}") for i in range(5)]
+    for i, key in enumerate(keys[:4]):
+        cache.set(key, f"fake:{MODEL}", 0.0, f"answer {i}")
+        time.sleep(0.01)
+    cache.get(keys[0])  # recently used → survives
+    cache.set(keys[4], f"fake:{MODEL}", 0.0, "answer 4")  # 5th write → purge
+
+    kept = [i for i, key in enumerate(keys) if cache.get(key) is not None]
+    print(f"🧹 LRU kept {kept} | {cache.stats()}")
+    assert kept == [0, 3, 4] and cache.stats()["evicted"] == 2
+
+
+with tempfile.TemporaryDirectory() as tmp:
+    cache = LLMResponseCache(Path(tmp) / "llm_cache.sqlite3", ttl_seconds=3600, max_entries=100)
+    llm_engine.llm_cache = cache
+
+    asyncio.run(main(cache))
+    check_expiry_and_lru(Path(tmp))
+
+print("\n✅ LLM cache test completed")
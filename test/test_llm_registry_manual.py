@@ -0,0 +1,78 @@
+# test/test_llm_registry_manual.py
+
+"""
+LLM registry (offline fake provider): clients, tool bindings and chains
+are built once per key and reused, also under concurrent first use, and
+warm_up() builds them ahead of the first request.
+"""
+
+import os
+
+# Must be set before backend.utils.config is imported
+os.environ.setdefault("FAKE_LLM_LATENCY_MS", "5")
+os.environ.setdefault("FAKE_LLM_TOKENS_PER_SECOND", "2000")
+
+from concurrent.futures import ThreadPoolExecutor
+
+from langchain_core.messages import HumanMessage
+
+from backend.core.agent.tools.db_tool import db_tool
+from backend.core.agent.tools.rag_tool import rag_tool
+from backend.core.llm.llm_registry import LLMRegistry
+
+MODEL = "gemini-2.5-flash"
+
+registry = LLMRegistry(provider="fake")
+
+# ------------------------------------------------------------
+# 1️⃣ Clients: one per (model, temperature)
+# ------------------------------------------------------------
+with ThreadPoolExecutor(max_workers=8) as pool:
+    clients = list(pool.map(lambda _: registry.get_client(MODEL, 0.4), range(32)))
+
+assert all(c is clients[0] for c in clients), "concurrent first use built more than one client"
+assert registry.get_client(MODEL, 0) is not clients[0], "other temperature → other client"
+assert registry.get_client(MODEL, 0.0) is registry.get_client(MODEL, 0)
+print(f"\n🏭 clients built: {len(registry.stats()['clients'])}")
+assert len(registry.stats()["clients"]) == 2
+
+# ------------------------------------------------------------
+# 2️⃣ Tool bindings: tool order does not matter
+# ------------------------------------------------------------
+bound = registry.get_bound_client(MODEL, 0.0, [rag_tool, db_tool])
+assert registry.get_bound_client(MODEL, 0.0, [db_tool, rag_tool]) is bound
+assert registry.get_bound_client(MODEL, 0.0, [db_tool]) is not bound
+assert registry.stats()["tool_bindings"] == 2
+
+# ------------------------------------------------------------
+# 3️⃣ Chains: builder runs until one is stored, then never again
+# ------------------------------------------------------------
+builds = []
+
+
+def build_chain():
+    builds.append(1)
+    return registry.get_client(MODEL, 0.0)
+
+
+chain = registry.get_chain(("answer", MODEL, 0.0), build_chain)
+assert registry.get_chain(("answer", MODEL, 0.0), build_chain) is chain
+assert len(builds) == 1 and registry.stats()["chains"] == 1
+
+# ------------------------------------------------------------
+# 4️⃣ Warm-up + per-client call stats
+# ------------------------------------------------------------
+warm = LLMRegistry(provider="fake")
+warm.warm_up([lambda: warm.get_client(MODEL, 0.0), lambda: warm.get_bound_client(MODEL, 0.0, [rag_tool])])
+stats = warm.stats()
+assert len(stats["clients"]) == 1 and stats["tool_bindings"] == 1
+
+client = warm.get_client(MODEL, 0.0)
+for _ in range(2):
+    client.invoke([HumanMessage(content="hello")])
+
+client_stats = warm.stats()["clients"][0]
+print(f"🔥 warm registry: {client_stats}")
+assert client_stats["calls"] == 2 and client_stats["construction_ms"] is not None
+
+print("\n✅ LLM registry test completed")
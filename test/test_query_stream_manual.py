@@ -0,0 +1,141 @@
+# test/test_query_stream_manual.py
+
+"""
+/api/query/stream (offline fake LLM, SQLite fixture): SSE events arrive
+in order — routing → [sql] → token* → final — the tokens add up to the
+final answer, and a client disconnect mid-answer cancels the graph
+(the rest of the answer is never generated or saved).
+"""
+
+import os
+
+# Must be set BEFORE backend modules are imported
+os.environ["LLM_PROVIDER"] = "fake"
+os.environ["FAKE_LLM_LATENCY_MS"] = "20"
+os.environ["FAKE_LLM_TOKENS_PER_SECOND"] = "100"
+os.environ["LLM_CACHE_ENABLED"] = "false"
+os.environ.setdefault("SQL_CACHE_ENABLED", "false")
+os.environ.setdefault("RESULT_CACHE_ENABLED", "false")
+
+import asyncio
+import json
+import shutil
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+from fastapi import FastAPI
+
+from backend.api.routes import query as query_route
+from backend.core.agent.speculation import speculation_stats
+from backend.core.db import db_manager
+from backend.core.db.db_manager import aclear_all_db_connections, connect_db, disconnect_db
+from backend.core.memory.session_memory import get_session_memory
+
+SESSION_ID = "query_stream_test_session"
+
+app = FastAPI()
+app.include_router(query_route.router, prefix="/api")
+
+
+def parse_sse(body: str):
+    events = []
+    for frame in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in frame.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+async def stream(client: httpx.AsyncClient, session_id: str, query: str):
+    response = await client.post("/api/query/stream", json={"session_id": session_id, "query": query})
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"].startswith("text/event-stream")
+    return parse_sse(response.text)
+
+
+def check_order(events, expected_prefix):
+    names = [name for name, _ in events]
+    tokens = [data["content"] for name, data in events if name == "token"]
+    print(f"   {names[:len(expected_prefix)]} + {len(tokens)} × token + {names[-1:]}")
+
+    assert names[:len(expected_prefix)] == expected_prefix, names
+    assert names[-1] == "final" and "error" not in names
+    assert names[len(expected_prefix):-1] == ["token"] * len(tokens) and tokens
+    assert "".join(tokens) == events[-1][1]["response"]
+
+
+async def main(url: str):
+    connect_db(SESSION_ID, url)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        # 1️⃣ General answer: routing → token* → final
+        print("\n💬 general")
+        events = await stream(client, SESSION_ID, "Tell me a joke")
+        check_order(events, ["routing"])
+        assert events[0][1] == {"decision": "NO_TOOL_REQUIRED"}
+
+        # 2️⃣ DB answer: routing → sql → token* → final
+        print("🗄️ db")
+        events = await stream(client, SESSION_ID, "How many orders are there?")
+        check_order(events, ["routing", "sql"])
+        assert events[0][1] == {"decision": "db_tool"}
+        assert events[1][1]["sql"].startswith("SELECT COUNT(*)") and events[1][1]["error"] is None
+        assert events[-1][1]["citations"][0]["type"] == "database"
+
+        # 3️⃣ Empty query rejected before streaming starts
+        response = await client.post("/api/query/stream", json={"session_id": SESSION_ID, "query": "  "})
+        assert response.status_code == 400
+
+    # 4️⃣ Client disconnect after the first token: the graph is cancelled
+    session_id = f"{SESSION_ID}_disconnect"
+    state = query_route._build_initial_state(session_id, "Tell me a story about databases")
+    first_token = asyncio.Event()
+    frames = []
+
+    async def consume():
+        async for frame in query_route._stream_query_events(state):
+            frames.append(frame)
+            if frame.startswith("event: token"):
+                first_token.set()
+
+    # Starlette cancels the response task when the client goes away
+    task = asyncio.create_task(consume())
+    await asyncio.wait_for(first_token.wait(), timeout=5)
+    started = time.perf_counter()
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+    print(f"\n🔌 disconnected after {len(frames)} frames | cancelled in {(time.perf_counter() - started) * 1000:.0f} ms")
+
+    # Full answer would take ≈ 60 tokens / 100 per s: wait past it
+    await asyncio.sleep(1)
+    roles = [m["role"] for m in get_session_memory(session_id)]
+    print(f"   session memory roles: {roles}")
+    assert "assistant" not in roles, "answer was still generated + saved after disconnect"
+    assert not any(f.startswith("event: final") for f in frames)
+    assert speculation_stats()["pending"] == 0
+
+    disconnect_db(SESSION_ID)
+    await aclear_all_db_connections()
+
+
+with tempfile.TemporaryDirectory() as tmp:
+    db_path = Path(tmp) / "fixture.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE orders (id INTEGER PRIMARY KEY, amount REAL)")
+    conn.executemany("INSERT INTO orders (amount) VALUES (?)", [(i * 1.5,) for i in range(12)])
+    conn.commit()
+    conn.close()
+
+    try:
+        asyncio.run(main(f"sqlite:///{db_path}"))
+    finally:
+        for sid in (SESSION_ID, f"{SESSION_ID}_disconnect"):
+            shutil.rmtree(db_manager._get_db_session_dir(sid), ignore_errors=True)
+
+print("\n✅ Query stream test completed")
@@ -0,0 +1,95 @@
+# test/test_result_cache_manual.py
+
+"""
+DB result cache: per-session TTL (default, shorter, disabled), keys per
+database target, oversized results skipped, and LRU eviction under the
+total byte budget. Uses its own QueryResultCache, not the app singleton.
+"""
+
+import os
+
+# Must be set before backend.utils.config is imported
+os.environ["RESULT_CACHE_ENABLED"] = "true"
+
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine
+
+from backend.core.db.result_cache import QueryResultCache
+
+
+def result(n: int, width: int = 10) -> dict:
+    return {"rows": [{"id": i, "label": "x" * width} for i in range(n)], "row_count": n, "truncated": False}
+
+
+def size(value: dict) -> int:
+    return len(json.dumps(value, separators=(",", ":")).encode("utf-8"))
+
+
+with tempfile.TemporaryDirectory() as tmp:
+    engine_a = create_engine(f"sqlite:///{Path(tmp) / 'a.db'}")
+    engine_b = create_engine(f"sqlite:///{Path(tmp) / 'b.db'}")
+    entry_bytes = size(result(10))
+
+    # ------------------------------------------------------------
+    # 1️⃣ TTL
+    # ------------------------------------------------------------
+    cache = QueryResultCache(default_ttl_seconds=2, max_entry_bytes=10_000, max_total_bytes=100_000)
+    sql = "SELECT id, label FROM t"
+
+    assert cache.get("s1", engine_a, sql) is None
+    cache.set("s1", engine_a, sql, result(10))
+    assert cache.get("s1", engine_a, f"  {sql}\n") == result(10), "surrounding whitespace is ignored"
+    assert cache.get("s2", engine_a, sql) is not None, "sessions on the same DB share results"
+    assert cache.get("s1", engine_b, sql) is None, "another DB never sees it"
+
+    cache.set_session_ttl("s_off", 0)
+    assert cache.get("s_off", engine_a, sql) is None, "TTL 0 disables the cache for that session"
+
+    time.sleep(1.2)
+    cache.set_session_ttl("s_strict", 1)
+    assert cache.get("s_strict", engine_a, sql) is None, "older than the session's own TTL"
+    assert cache.get("s1", engine_a, sql) is not None, "still fresh under the default TTL"
+
+    time.sleep(1)
+    assert cache.get("s1", engine_a, sql) is None, "expired under the default TTL"
+    print(f"⏳ TTL checks passed | {cache.stats()}")
+
+    # ------------------------------------------------------------
+    # 2️⃣ Byte budget: oversized entries skipped, LRU evicted
+    # ------------------------------------------------------------
+    cache = QueryResultCache(
+        default_ttl_seconds=60,
+        max_entry_bytes=entry_bytes * 2,
+        max_total_bytes=entry_bytes * 3,
+    )
+
+    cache.set("s1", engine_a, "SELECT big", result(100))
+    assert cache.stats()["too_large"] == 1 and cache.stats()["entries"] == 0
+
+    for i in range(3):
+        cache.set("s1", engine_a, f"SELECT {i}", result(10))
+    assert cache.stats()["entries"] == 3 and cache.stats()["bytes_cached"] == entry_bytes * 3
+
+    # Touch the oldest: "SELECT 1" becomes least recently used
+    assert cache.get("s1", engine_a, "SELECT 0") is not None
+    cache.set("s1", engine_a, "SELECT 3", result(10))
+
+    assert cache.get("s1", engine_a, "SELECT 1") is None, "LRU entry evicted"
+    assert all(cache.get("s1", engine_a, f"SELECT {i}") is not None for i in (0, 2, 3))
+    assert cache.stats()["evicted"] == 1
+    assert cache.stats()["bytes_cached"] <= entry_bytes * 3
+
+    # Re-setting a key replaces its bytes instead of double counting
+    cache.set("s1", engine_a, "SELECT 3", result(10))
+    assert cache.stats()["entries"] == 3 and cache.stats()["bytes_cached"] == entry_bytes * 3
+
+    print(f"📦 Byte budget checks passed | {cache.stats()}")
+
+    engine_a.dispose()
+    engine_b.dispose()
+
+print("\n✅ Result cache test completed")
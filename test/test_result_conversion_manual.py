@@ -0,0 +1,89 @@
+# test/test_result_conversion_manual.py
+
+"""
+Per-value make_json_safe vs column-typed conversion on a 100k-cell result
+(SQLite fixture), plus payload size of "rows" vs "columnar" output.
+"""
+
+import json
+import shutil
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+from uuid import uuid4
+
+from sqlalchemy import text
+
+from backend.core.db import db_manager
+from backend.core.db.db_manager import connect_db, disconnect_db, get_db_engine
+from backend.core.db.db_executor import _execute_sql, make_json_safe, rows_from_payload
+
+SESSION_ID = "result_conversion_test_session"
+ROWS = 20_000  # x 5 columns = 100k cells
+
+
+def timed(fn, *args, **kwargs):
+    started = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, (time.perf_counter() - started) * 1000
+
+
+def legacy_fetch(engine, sql):
+    """The previous per-row, per-value conversion."""
+    with engine.connect() as conn:
+        return [make_json_safe(dict(row._mapping)) for row in conn.execute(text(sql))]
+
+
+with tempfile.TemporaryDirectory() as tmp:
+    db_path = Path(tmp) / "fixture.db"
+    conn = sqlite3.connect(db_path, detect_types=sqlite3.PARSE_DECLTYPES)
+    conn.execute(
+        "CREATE TABLE events (id INTEGER PRIMARY KEY, ref TEXT, amount NUMERIC, "
+        "happened_at TIMESTAMP, label TEXT)"
+    )
+    start = datetime(2024, 1, 1)
+    conn.executemany(
+        "INSERT INTO events (ref, amount, happened_at, label) VALUES (?, ?, ?, ?)",
+        [
+            (str(uuid4()), str(Decimal(i) / 7), (start + timedelta(minutes=i)).isoformat(" "), f"label_{i % 50}")
+            for i in range(ROWS)
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+    connect_db(SESSION_ID, f"sqlite:///{db_path}")
+
+    try:
+        engine = get_db_engine(SESSION_ID)
+        sql = "SELECT id, ref, CAST(amount AS REAL) AS amount, happened_at, label FROM events"
+
+        legacy, legacy_ms = timed(legacy_fetch, engine, sql)
+        rows_payload, rows_ms = timed(
+            _execute_sql, engine, sql, "sqlite", max_rows=ROWS, max_bytes=10**9, result_format="rows"
+        )
+        columnar_payload, columnar_ms = timed(
+            _execute_sql, engine, sql, "sqlite", max_rows=ROWS, max_bytes=10**9, result_format="columnar"
+        )
+
+        assert rows_payload["rows"] == legacy
+        assert rows_from_payload(columnar_payload) == legacy
+
+        rows_bytes = len(json.dumps(rows_payload))
+        columnar_bytes = len(json.dumps(columnar_payload))
+
+        print(f"\n📊 {ROWS} rows x 5 columns")
+        print(f"🐢 legacy make_json_safe per value : {legacy_ms:8.1f} ms")
+        print(f"⚡ column converters → rows        : {rows_ms:8.1f} ms")
+        print(f"⚡ column converters → columnar    : {columnar_ms:8.1f} ms")
+        print(f"📦 payload rows={rows_bytes} bytes | columnar={columnar_bytes} bytes "
+              f"({100 * (1 - columnar_bytes / rows_bytes):.1f}% smaller)")
+
+    finally:
+        disconnect_db(SESSION_ID)
+        shutil.rmtree(db_manager._get_db_session_dir(SESSION_ID), ignore_errors=True)
+
+print("\n✅ Result conversion test completed")
@@ -0,0 +1,63 @@
+# test/test_result_summarizer_manual.py
+
+"""
+Prompt size of a 1,000-row result sent raw vs as column profiles + sample.
+Set GEMINI_API_KEY to also compare the two answers side by side.
+"""
+
+import asyncio
+import os
+import random
+from datetime import date, timedelta
+
+from backend.core.db.result_summarizer import summarize_rows
+from backend.core.db.row_encoder import encode_rows
+from backend.core.db.schema_renderer import estimate_tokens
+from backend.core.llm.llm_engine import _db_inputs, agenerate_db_answer
+
+QUERY = "How did order revenue develop across regions this year?"
+SQL = "SELECT order_id, region, status, amount, order_date FROM orders ORDER BY order_date"
+
+random.seed(7)
+start = date(2024, 1, 1)
+rows = [
+    {
+        "order_id": i,
+        "region": random.choice(["north", "south", "east", "west"]),
+        "status": random.choice(["paid", "paid", "paid", "refunded", None]),
+        "amount": round(random.uniform(5, 500), 2),
+        "order_date": (start + timedelta(days=i % 365)).isoformat(),
+    }
+    for i in range(1, 1001)
+]
+
+summary = summarize_rows(rows)
+assert summary is not None, "1,000 rows should be summarized"
+assert summarize_rows(rows[:10]) is None, "small results pass through unchanged"
+
+rows_text = encode_rows(rows)
+sample_text = encode_rows(summary["sample_rows"])
+
+raw_context = _db_inputs(QUERY, rows_text, SQL, "sqlite", None)["context"]
+summary_context = _db_inputs(QUERY, sample_text, SQL, "sqlite", None, None, summary)["context"]
+
+raw_tokens = estimate_tokens(raw_context)
+summary_tokens = estimate_tokens(summary_context)
+
+print("\n📊 Column profiles:")
+for name, profile in summary["columns"].items():
+    print(f"   {name}: {profile}")
+
+print("\n🧾 Prompt context size")
+print(f"   raw rows   : ~{raw_tokens} tokens")
+print(f"   summarized : ~{summary_tokens} tokens ({len(summary['sample_rows'])} sample rows)")
+print(f"   savings    : {100 * (1 - summary_tokens / raw_tokens):.1f}%")
+
+if os.getenv("GEMINI_API_KEY"):
+    async def compare():
+        raw = await agenerate_db_answer(QUERY, rows_text, SQL, "sqlite")
+        summarized = await agenerate_db_answer(QUERY, sample_text, SQL, "sqlite", result_summary=summary)
+        print("\n🤖 Answer from raw rows:\n", raw["response"])
+        print("\n🤖 Answer from summary:\n", summarized["response"])
+
+    asyncio.run(compare())
@@ -0,0 +1,85 @@
+# test/test_row_encoder_manual.py
+
+"""
+Measure prompt-size savings of the compact row encoder vs the legacy
+repr rendering on fixture DB results (typed values as drivers return
+them: Decimal, datetime, NULLs, long text).
+"""
+
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+from backend.core.db.row_encoder import encode_rows
+from backend.core.db.schema_renderer import estimate_tokens
+
+FIXTURES = {
+    "orders (6 cols × 50)": [
+        {
+            "order_id": i,
+            "customer_name": f"customer_{i % 17}",
+            "country": "India" if i % 3 else "USA",
+            "amount": Decimal(f"{25 + i * 1.25:.2f}"),
+            "placed_at": datetime(2024, 1 + i % 12, 1 + i % 28, 10, 30),
+            "status": None if i % 7 == 0 else "paid",
+        }
+        for i in range(50)
+    ],
+    "monthly revenue (3 cols × 12)": [
+        {"month": date(2024, m, 1), "orders": 100 + m * 7, "revenue": Decimal(f"{10_000 + m * 812.5:.2f}")}
+        for m in range(1, 13)
+    ],
+    "wide customers (12 cols × 20)": [
+        {
+            "id": i, "first_name": f"first_{i}", "last_name": f"last_{i}", "email": f"user{i}@example.com",
+            "phone": f"+91-98{i:08d}", "city": "Pune", "state": "Maharashtra", "country": "India",
+            "signup_date": date(2023, 1 + i % 12, 1), "is_active": i % 2 == 0,
+            "lifetime_value": Decimal(f"{i * 123.45:.2f}"), "segment": None,
+        }
+        for i in range(20)
+    ],
+}
+
+# ------------------------------------------------------------
+# 1️⃣ Prompt size: repr vs tsv vs markdown
+# ------------------------------------------------------------
+report = {}
+for label, rows in FIXTURES.items():
+    legacy = estimate_tokens(encode_rows(rows, fmt="repr"))
+    print(f"\n📏 {label}")
+    print(f"   repr     → ≈{legacy:>6} tokens")
+    report[label] = {"repr": legacy}
+
+    for fmt in ("tsv", "markdown"):
+        tokens = estimate_tokens(encode_rows(rows, fmt=fmt, token_budget=0))
+        report[label][fmt] = tokens
+        print(f"   {fmt:<8} → ≈{tokens:>6} tokens | saving {100 * (1 - tokens / legacy):.1f}%")
+        assert tokens < legacy, (label, fmt)
+
+print("\n🧾 TSV sample:")
+print("\n".join(encode_rows(FIXTURES["orders (6 cols × 50)"], fmt="tsv").splitlines()[:4]))
+print("\n🧾 Markdown sample:")
+print("\n".join(encode_rows(FIXTURES["orders (6 cols × 50)"], fmt="markdown").splitlines()[:4]))
+
+# ------------------------------------------------------------
+# 2️⃣ Cell truncation + separators inside values
+# ------------------------------------------------------------
+messy = [{"id": 1, "notes": "line one\nline two\twith tab | and pipe " + "x" * 300}]
+tsv = encode_rows(messy, fmt="tsv", max_cell_chars=40)
+markdown = encode_rows(messy, fmt="markdown", max_cell_chars=40)
+print(f"\n✂️ Truncated cell (tsv): {tsv.splitlines()[1]!r}")
+assert len(tsv.splitlines()) == 2 and tsv.splitlines()[1].count("\t") == 1
+assert len(tsv.splitlines()[1].split("\t")[1]) == 40
+assert "\\|" in markdown and len(markdown.splitlines()) == 3
+
+# ------------------------------------------------------------
+# 3️⃣ Token budget
+# ------------------------------------------------------------
+budgeted = encode_rows(FIXTURES["orders (6 cols × 50)"], fmt="tsv", token_budget=200)
+print(f"\n✂️ Budget 200 tokens → ≈{estimate_tokens(budgeted)} tokens")
+print(f"   {budgeted.splitlines()[-1]}")
+assert estimate_tokens(budgeted) <= 200 + 20
+assert budgeted.splitlines()[-1].startswith("... ")
+
+print("\n" + json.dumps(report, ensure_ascii=False))
+print("\n✅ Row encoder test completed")
@@ -0,0 +1,60 @@
+# test/test_row_limit_manual.py
+
+"""
+Bounded fetch row limit (sqlglot AST): a LIMIT is added when missing,
+an existing larger one is lowered, a smaller one is kept — including when
+a comment follows it — and a commented-LIMIT query runs on SQLite.
+"""
+
+import sqlite3
+import tempfile
+from pathlib import Path
+
+from sqlalchemy import create_engine
+
+from backend.core.db.db_executor import _execute_sql, _with_row_limit
+
+CASES = [
+    # (db_type, sql, expected)
+    ("sqlite", "SELECT id FROM t", "SELECT id FROM t\nLIMIT 11 OFFSET 0"),
+    ("sqlite", "SELECT id FROM t -- all ids", "SELECT id FROM t -- all ids\nLIMIT 11 OFFSET 0"),
+    ("sqlite", "SELECT id FROM t LIMIT 5 -- top five", "SELECT id FROM t LIMIT 5 -- top five"),
+    ("sqlite", "SELECT id FROM t LIMIT 500", "SELECT id FROM t LIMIT 11"),
+    ("sqlite", "SELECT id FROM t LIMIT 500 OFFSET 20", "SELECT id FROM t LIMIT 11 OFFSET 20"),
+    ("mysql", "SELECT id FROM t LIMIT 20, 5", "SELECT id FROM t LIMIT 20, 5"),
+    ("postgresql", "SELECT id FROM t ORDER BY id FETCH FIRST 50 ROWS ONLY",
+     "SELECT id FROM t ORDER BY id FETCH FIRST 11 ROWS ONLY"),
+    ("postgresql", "SELECT a FROM t UNION SELECT b FROM u", "SELECT a FROM t UNION SELECT b FROM u\nLIMIT 11 OFFSET 0"),
+    # Limit only inside a subquery → the outer query still gets one
+    ("postgresql", "SELECT * FROM (SELECT id FROM t LIMIT 3) AS s", "SELECT * FROM (SELECT id FROM t LIMIT 3) AS s\nLIMIT 11 OFFSET 0"),
+]
+
+# ------------------------------------------------------------
+# 1️⃣ Rewrites
+# ------------------------------------------------------------
+for db_type, sql, expected in CASES:
+    bounded = _with_row_limit(sql, db_type, 11)
+    print(f"🔧 [{db_type}] {sql!r}\n   → {bounded!r}")
+    assert bounded == expected, bounded
+
+# ------------------------------------------------------------
+# 2️⃣ Commented LIMIT executes (no second LIMIT appended)
+# ------------------------------------------------------------
+with tempfile.TemporaryDirectory() as tmp:
+    db_path = Path(tmp) / "fixture.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY)")
+    conn.executemany("INSERT INTO t (id) VALUES (?)", [(i,) for i in range(100)])
+    conn.commit()
+    conn.close()
+
+    engine = create_engine(f"sqlite:///{db_path}")
+    result = _execute_sql(engine, "SELECT id FROM t ORDER BY id LIMIT 5 -- top five", "sqlite", max_rows=10)
+    print(f"\n✅ rows={[r['id'] for r in result['rows']]} | truncated={result['truncated']}")
+    assert result["row_count"] == 5 and not result["truncated"]
+
+    result = _execute_sql(engine, "SELECT id FROM t ORDER BY id LIMIT 50", "sqlite", max_rows=10)
+    assert result["row_count"] == 10 and result["truncated"]
+    engine.dispose()
+
+print("\n✅ Row limit test completed")
@@ -0,0 +1,83 @@
+# test/test_schema_cache_manual.py
+
+"""
+Cold vs warm schema lookup + fingerprint-based invalidation
+on a SQLite fixture (PRAGMA schema_version).
+"""
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+# Re-check the fingerprint on every lookup for this test
+os.environ.setdefault("SCHEMA_FINGERPRINT_INTERVAL_SECONDS", "0")
+
+from backend.core.db import db_manager
+from backend.core.db.db_manager import connect_db, disconnect_db
+from backend.core.db.schema_inspector import inspect_schema
+from backend.core.db.schema_cache import (
+    get_cached_schema,
+    invalidate_schema_cache,
+    schema_cache_stats,
+)
+
+SESSION_ID = "schema_cache_test_session"
+TABLES = 50
+
+
+def timed(fn, *args):
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, (time.perf_counter() - started) * 1000
+
+
+with tempfile.TemporaryDirectory() as tmp:
+    db_path = Path(tmp) / "fixture.db"
+
+    conn = sqlite3.connect(db_path)
+    for i in range(TABLES):
+        conn.execute(f"CREATE TABLE t_{i} (id INTEGER PRIMARY KEY, name TEXT, value REAL)")
+    conn.commit()
+
+    print("\n🔗 Connecting to fixture DB...")
+    connect_db(SESSION_ID, f"sqlite:///{db_path}")
+
+    try:
+        # ----------------------------------------------------
+        # 1️⃣ Cold vs warm
+        # ----------------------------------------------------
+        _, direct_ms = timed(inspect_schema, SESSION_ID)
+        _, cold_ms = timed(get_cached_schema, SESSION_ID)
+        schema, warm_ms = timed(get_cached_schema, SESSION_ID)
+
+        print(f"\n⏱️ inspect_schema (uncached) : {direct_ms:8.2f} ms")
+        print(f"⏱️ cache cold               : {cold_ms:8.2f} ms")
+        print(f"⏱️ cache warm (fingerprint) : {warm_ms:8.2f} ms")
+        assert len(schema["tables"]) == TABLES
+
+        # ----------------------------------------------------
+        # 2️⃣ Schema change → fingerprint mismatch → reload
+        # ----------------------------------------------------
+        conn.execute("ALTER TABLE t_0 ADD COLUMN created_at TIMESTAMP")
+        conn.commit()
+
+        schema = get_cached_schema(SESSION_ID)
+        columns = [c["name"] for c in schema["tables"]["t_0"]["columns"]]
+        print(f"\n🔄 After ALTER TABLE, t_0 columns: {columns}")
+        assert "created_at" in columns
+
+        # ----------------------------------------------------
+        # 3️⃣ Explicit invalidation
+        # ----------------------------------------------------
+        invalidate_schema_cache(SESSION_ID)
+        print(f"\n📈 Stats: {schema_cache_stats()}")
+
+    finally:
+        conn.close()
+        disconnect_db(SESSION_ID)
+        shutil.rmtree(db_manager._get_db_session_dir(SESSION_ID), ignore_errors=True)
+
+print("\n✅ Schema cache test completed")
@@ -0,0 +1,159 @@
+# test/test_schema_reflection_manual.py
+
+"""
+Bulk dialect reflection vs per-table Inspector:
+same schema dict, far fewer round-trips.
+
+Uses a SQLite fixture by default; set REFLECTION_DB_URL to compare
+against a Postgres / MySQL database instead.
+"""
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+from dotenv import load_dotenv
+from sqlalchemy.dialects import mysql
+from sqlalchemy.dialects import postgresql as pg
+
+from backend.core.db import db_manager
+from backend.core.db.db_manager import connect_db, disconnect_db, get_db_engine, get_db_type
+from backend.core.db.db_types import DB_DIALECTS
+from backend.core.db.schema_inspector import _canonical_type, _reflect_bulk, _reflect_parallel
+
+load_dotenv()
+
+SESSION_ID = "schema_reflection_test_session"
+TABLES = 200
+
+
+def create_fixture_db(path: Path) -> None:
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE customers (id INTEGER PRIMARY KEY, name VARCHAR(120) NOT NULL)")
+    for i in range(TABLES):
+        conn.execute(
+            f"CREATE TABLE fact_{i} ("
+            f"id INTEGER PRIMARY KEY, customer_id INTEGER REFERENCES customers(id), "
+            f"amount NUMERIC(10, 2), label VARCHAR(80) NOT NULL, recorded_at TIMESTAMP)"
+        )
+    conn.execute(
+        "CREATE TABLE pairs (a INTEGER, b INTEGER, owner INTEGER REFERENCES customers, "
+        "PRIMARY KEY (a, b))"
+    )
+    conn.commit()
+    conn.close()
+
+
+def normalize(schema):
+    """Types compared case/space-insensitively (e.g. NUMERIC(10,2) vs NUMERIC(10, 2))."""
+    for table in schema["tables"].values():
+        for col in table["columns"]:
+            col["type"] = col["type"].upper().replace(" ", "")
+    return schema
+
+
+# upper(format_type(...)) as the Postgres bulk query returns it → Inspector type
+PG_TYPES = [
+    ("CHARACTER VARYING(255)", pg.VARCHAR(255)),
+    ("CHARACTER VARYING", pg.VARCHAR()),
+    ("CHARACTER(3)", pg.CHAR(3)),
+    ("TIMESTAMP WITHOUT TIME ZONE", pg.TIMESTAMP()),
+    ("TIMESTAMP(3) WITH TIME ZONE", pg.TIMESTAMP(timezone=True, precision=3)),
+    ("TIME WITHOUT TIME ZONE", pg.TIME()),
+    ("NUMERIC(10,2)", pg.NUMERIC(10, 2)),
+    ("NUMERIC", pg.NUMERIC()),
+    ("DOUBLE PRECISION", pg.DOUBLE_PRECISION()),
+    ("BIT VARYING(5)", pg.BIT(5, varying=True)),
+    ("INTERVAL DAY TO SECOND", pg.INTERVAL(fields="day to second")),
+    ("INTEGER[]", pg.ARRAY(pg.INTEGER())),
+    ("INTEGER", pg.INTEGER()),
+    ("BOOLEAN", pg.BOOLEAN()),
+    ("JSONB", pg.JSONB()),
+    ("UUID", pg.UUID()),
+]
+
+
+# UPPER(column_type) as the MySQL bulk query returns it → Inspector type
+MYSQL_TYPES = [
+    ("INT", mysql.INTEGER()),
+    ("INT(11)", mysql.INTEGER(display_width=11)),
+    ("INT UNSIGNED", mysql.INTEGER(unsigned=True)),
+    ("BIGINT(20) UNSIGNED ZEROFILL", mysql.BIGINT(display_width=20, unsigned=True, zerofill=True)),
+    ("TINYINT(1)", mysql.TINYINT(display_width=1)),
+    ("DECIMAL(10,2)", mysql.DECIMAL(10, 2)),
+    ("DECIMAL(10,0) UNSIGNED", mysql.DECIMAL(10, 0, unsigned=True)),
+    ("DOUBLE(8,2)", mysql.DOUBLE(8, 2)),
+    ("FLOAT", mysql.FLOAT()),
+    ("VARCHAR(50)", mysql.VARCHAR(50)),
+    ("CHAR(3)", mysql.CHAR(3)),
+    ("DATETIME(3)", mysql.DATETIME(fsp=3)),
+    ("TIMESTAMP", mysql.TIMESTAMP()),
+    ("YEAR(4)", mysql.YEAR(4)),
+    ("ENUM('PAID','REFUNDED')", mysql.ENUM("paid", "refunded")),
+    ("BIT(1)", mysql.BIT(1)),
+    ("JSON", mysql.JSON()),
+]
+
+
+def check_types(dialect, types):
+    aliases = DB_DIALECTS[dialect]["reflection_type_aliases"]
+    for catalog, sa_type in types:
+        canonical = _canonical_type(catalog, aliases)
+        print(f"🔤 {catalog:<30} → {canonical}")
+        assert canonical == str(sa_type), (catalog, canonical, str(sa_type))
+
+
+def timed(fn, *args):
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, (time.perf_counter() - started) * 1000
+
+
+check_types("postgresql", PG_TYPES)
+check_types("mysql", MYSQL_TYPES)
+
+with tempfile.TemporaryDirectory() as tmp:
+    db_url = os.getenv("REFLECTION_DB_URL")
+    if not db_url:
+        db_path = Path(tmp) / "fixture.db"
+        create_fixture_db(db_path)
+        db_url = f"sqlite:///{db_path}"
+
+    connect_db(SESSION_ID, db_url)
+
+    try:
+        engine = get_db_engine(SESSION_ID)
+        db_type = get_db_type(SESSION_ID)
+
+        bulk, bulk_ms = timed(
+            _reflect_bulk, engine, DB_DIALECTS[db_type]["reflection_sql"],
+            DB_DIALECTS[db_type].get("reflection_type_aliases", ()),
+        )
+        per_table, per_table_ms = timed(_reflect_parallel, engine)
+
+        print(f"\n🗄️ {db_type} | tables={len(per_table['tables'])}")
+        print(f"⚡ bulk reflection      : {bulk_ms:9.2f} ms")
+        print(f"🐢 per-table Inspector : {per_table_ms:9.2f} ms")
+
+        bulk, per_table = normalize(bulk), normalize(per_table)
+        mismatched = [
+            name for name in per_table["tables"]
+            if bulk["tables"].get(name) != per_table["tables"][name]
+        ]
+
+        if mismatched:
+            name = mismatched[0]
+            print(f"\n❌ {len(mismatched)} tables differ, e.g. {name}:")
+            print("   bulk     :", bulk["tables"].get(name))
+            print("   inspector:", per_table["tables"][name])
+        else:
+            print("\n✅ Bulk reflection matches Inspector output")
+
+        assert set(bulk["tables"]) == set(per_table["tables"])
+
+    finally:
+        disconnect_db(SESSION_ID)
+        shutil.rmtree(db_manager._get_db_session_dir(SESSION_ID), ignore_errors=True)
@@ -0,0 +1,169 @@
+# test/test_schema_renderer_manual.py
+
+"""
+Measure prompt-size savings of the compact schema renderer vs legacy JSON
+on a SQLite fixture warehouse (120 tables).
+
+If GEMINI_API_KEY is set, also compares SQL accuracy of both formats:
+each generated query is executed and its result compared to a gold query.
+"""
+
+import os
+import json
+import shutil
+import sqlite3
+import tempfile
+from pathlib import Path
+
+from dotenv import load_dotenv
+from sqlalchemy import text
+
+from backend.core.db import db_manager
+from backend.core.db.db_manager import connect_db, disconnect_db, get_db_engine
+from backend.core.db.schema_inspector import inspect_schema
+from backend.core.db.schema_renderer import render_schema, estimate_tokens
+
+# ------------------------------------------------------------
+# 🔑 Load environment variables
+# ------------------------------------------------------------
+load_dotenv()
+
+SESSION_ID = "schema_renderer_test_session"
+FILLER_TABLES = 115
+
+# (question, gold SQL)
+QUESTIONS = [
+    ("How many customers are there?", "SELECT COUNT(*) FROM customers"),
+    ("How many orders were placed by customers from India?",
+     "SELECT COUNT(*) FROM orders o JOIN customers c ON o.customer_id = c.id WHERE c.country = 'India'"),
+    ("What is the total amount of all payments?", "SELECT SUM(amount) FROM payments"),
+    ("How many distinct products were ordered?", "SELECT COUNT(DISTINCT product_id) FROM order_items"),
+]
+
+
+# ------------------------------------------------------------
+# 🧱 Fixture warehouse
+# ------------------------------------------------------------
+def create_fixture_db(path: Path) -> None:
+    conn = sqlite3.connect(path)
+    conn.executescript(
+        """
+        CREATE TABLE customers (id INTEGER PRIMARY KEY, name VARCHAR(120) NOT NULL, country VARCHAR(60), created_at TIMESTAMP);
+        CREATE TABLE products (id INTEGER PRIMARY KEY, title VARCHAR(200), price NUMERIC(10, 2), category VARCHAR(60));
+        CREATE TABLE orders (id INTEGER PRIMARY KEY, customer_id INTEGER NOT NULL REFERENCES customers(id), placed_at TIMESTAMP, status VARCHAR(20));
+        CREATE TABLE order_items (id INTEGER PRIMARY KEY, order_id INTEGER REFERENCES orders(id), product_id INTEGER REFERENCES products(id), quantity INTEGER);
+        CREATE TABLE payments (id INTEGER PRIMARY KEY, order_id INTEGER REFERENCES orders(id), amount NUMERIC(10, 2), paid_at TIMESTAMP);
+        """
+    )
+    for i in range(FILLER_TABLES):
+        conn.execute(
+            f"CREATE TABLE warehouse_fact_{i} ("
+            f"id INTEGER PRIMARY KEY, customer_id INTEGER REFERENCES customers(id), "
+            f"metric_value NUMERIC(12, 4), metric_label VARCHAR(80), recorded_at TIMESTAMP, "
+            f"is_active BOOLEAN, notes TEXT)"
+        )
+
+    conn.executemany(
+        "INSERT INTO customers (name, country) VALUES (?, ?)",
+        [(f"customer_{i}", "India" if i % 3 == 0 else "USA") for i in range(60)],
+    )
+    conn.executemany(
+        "INSERT INTO products (title, price, category) VALUES (?, ?, ?)",
+        [(f"product_{i}", 10 + i, "general") for i in range(20)],
+    )
+    conn.executemany(
+        "INSERT INTO orders (customer_id, status) VALUES (?, ?)",
+        [(i % 60 + 1, "paid") for i in range(300)],
+    )
+    conn.executemany(
+        "INSERT INTO order_items (order_id, product_id, quantity) VALUES (?, ?, ?)",
+        [(i % 300 + 1, i % 17 + 1, 1 + i % 4) for i in range(900)],
+    )
+    conn.executemany(
+        "INSERT INTO payments (order_id, amount) VALUES (?, ?)",
+        [(i + 1, 25.5 + i) for i in range(300)],
+    )
+    conn.commit()
+    conn.close()
+
+
+def run_sql(sql: str):
+    with get_db_engine(SESSION_ID).connect() as conn:
+        return [tuple(row) for row in conn.execute(text(sql)).fetchall()]
+
+
+def measure_accuracy(schema, fmt: str) -> int:
+    # Imported lazily: only needed when an API key is available
+    from backend.core.db import db_query_generator
+
+    correct = 0
+    for question, gold_sql in QUESTIONS:
+        inputs = db_query_generator._build_sql_inputs("sqlite", question, schema)
+        inputs["schema"] = render_schema(schema, fmt=fmt)
+        result = db_query_generator.get_sql_chain().invoke(inputs)
+        sql = result.content.strip()
+
+        try:
+            ok = run_sql(sql) == run_sql(gold_sql)
+        except Exception as e:
+            print(f"   ❌ {fmt} | {question} | {e}")
+            ok = False
+
+        correct += ok
+        print(f"   {'✅' if ok else '❌'} {fmt} | {question} | {sql}")
+
+    return correct
+
+
+# ------------------------------------------------------------
+# 1️⃣ Build fixture + inspect
+# ------------------------------------------------------------
+with tempfile.TemporaryDirectory() as tmp:
+    db_path = Path(tmp) / "warehouse.db"
+    create_fixture_db(db_path)
+
+    print("\n🔗 Connecting to fixture warehouse...")
+    connect_db(SESSION_ID, f"sqlite:///{db_path}")
+
+    try:
+        schema = inspect_schema(SESSION_ID)
+
+        # ----------------------------------------------------
+        # 2️⃣ Prompt size: JSON vs compact
+        # ----------------------------------------------------
+        as_json = render_schema(schema, fmt="json")
+        as_compact = render_schema(schema, fmt="compact", token_budget=0)
+
+        print(f"\n📏 Tables: {len(schema['tables'])}")
+        print(f"   json    → {len(as_json):>7} chars | ≈{estimate_tokens(as_json):>6} tokens")
+        print(f"   compact → {len(as_compact):>7} chars | ≈{estimate_tokens(as_compact):>6} tokens")
+        print(f"   saving  → {100 * (1 - len(as_compact) / len(as_json)):.1f}%")
+
+        print("\n🧾 Compact sample:")
+        print("\n".join(as_compact.splitlines()[:7]))
+
+        # ----------------------------------------------------
+        # 3️⃣ Budget enforcement
+        # ----------------------------------------------------
+        budgeted = render_schema(schema, fmt="compact", token_budget=1500)
+        print(f"\n✂️ Budget 1500 tokens → ≈{estimate_tokens(budgeted)} tokens")
+        print(budgeted.splitlines()[-1][:160] + " ...")
+
+        # ----------------------------------------------------
+        # 4️⃣ SQL accuracy (needs Gemini)
+        # ----------------------------------------------------
+        if os.getenv("GEMINI_API_KEY"):
+            print("\n🎯 SQL accuracy (result-set match vs gold SQL):")
+            for fmt in ("json", "compact"):
+                correct = measure_accuracy(schema, fmt)
+                print(f"   {fmt}: {correct}/{len(QUESTIONS)}")
+        else:
+            print("\n⚠️ GEMINI_API_KEY not set — skipping SQL accuracy comparison")
+
+        print("\n" + json.dumps({"json_chars": len(as_json), "compact_chars": len(as_compact)}))
+
+    finally:
+        disconnect_db(SESSION_ID)
+        shutil.rmtree(db_manager._get_db_session_dir(SESSION_ID), ignore_errors=True)
+
+print("\n✅ Schema renderer test completed")
@@ -0,0 +1,86 @@
+# test/test_schema_selector_manual.py
+
+"""
+Relevance-pruned schema selection on a synthetic 300-table schema.
+
+Uses the shared embedding model when sentence-transformers is installed,
+otherwise the lexical fallback.
+"""
+
+import time
+
+from backend.core.rag.resource_store import resource_store
+from backend.core.db.schema_renderer import render_schema, estimate_tokens
+from backend.core.db.schema_selector import select_relevant_schema, schema_selection_stats
+
+DOMAINS = ["inventory", "shipment", "invoice", "employee", "campaign", "ticket", "ledger", "vendor"]
+
+# (question, tables that MUST be selected)
+QUESTIONS = [
+    ("How many orders did customers from India place?", {"orders", "customers"}),
+    ("Total payment amount per order status", {"payments", "orders"}),
+    ("Which products were sold the most?", {"order_items", "products"}),
+]
+
+
+def build_schema():
+    def col(name, type_="INTEGER"):
+        return {"name": name, "type": type_, "nullable": True}
+
+    tables = {
+        "customers": {"columns": [col("id"), col("name", "TEXT"), col("country", "TEXT")],
+                      "primary_key": ["id"], "foreign_keys": []},
+        "products": {"columns": [col("id"), col("title", "TEXT"), col("price", "NUMERIC")],
+                     "primary_key": ["id"], "foreign_keys": []},
+        "orders": {"columns": [col("id"), col("customer_id"), col("status", "TEXT")],
+                   "primary_key": ["id"],
+                   "foreign_keys": [{"column": "customer_id", "ref_table": "customers", "ref_column": "id"}]},
+        "order_items": {"columns": [col("id"), col("order_id"), col("product_id"), col("quantity")],
+                        "primary_key": ["id"],
+                        "foreign_keys": [
+                            {"column": "order_id", "ref_table": "orders", "ref_column": "id"},
+                            {"column": "product_id", "ref_table": "products", "ref_column": "id"},
+                        ]},
+        "payments": {"columns": [col("id"), col("order_id"), col("amount", "NUMERIC")],
+                     "primary_key": ["id"],
+                     "foreign_keys": [{"column": "order_id", "ref_table": "orders", "ref_column": "id"}]},
+    }
+
+    for i in range(295):
+        domain = DOMAINS[i % len(DOMAINS)]
+        tables[f"{domain}_detail_{i}"] = {
+            "columns": [col("id"), col(f"{domain}_code", "TEXT"), col("updated_at", "TIMESTAMP")],
+            "primary_key": ["id"],
+            "foreign_keys": [],
+        }
+
+    return {"tables": tables}
+
+
+# Use the real embedding model when available
+try:
+    from backend.core.doc_processing_unit.model_manager import get_embedding_model
+    resource_store.embedding_model = get_embedding_model()
+except ImportError:
+    print("⚠️ sentence-transformers not installed — using lexical fallback")
+
+schema = build_schema()
+full_tokens = estimate_tokens(render_schema(schema, token_budget=0))
+
+hits = 0
+for question, required in QUESTIONS:
+    started = time.perf_counter()
+    sub_schema = select_relevant_schema(schema, question)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    selected = set(sub_schema["tables"])
+    ok = required <= selected
+    hits += ok
+
+    print(f"\n{'✅' if ok else '❌'} {question}")
+    print(f"   tables {len(schema['tables'])} → {len(selected)} | {elapsed_ms:.1f} ms")
+    print(f"   prompt ≈{full_tokens} → ≈{estimate_tokens(render_schema(sub_schema, token_budget=0))} tokens")
+    print(f"   selected: {sorted(selected)[:12]}")
+
+print(f"\n🎯 Recall of required tables: {hits}/{len(QUESTIONS)}")
+print(f"📈 Stats: {schema_selection_stats()}")
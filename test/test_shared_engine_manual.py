@@ -0,0 +1,100 @@
+# test/test_shared_engine_manual.py
+
+"""
+Shared engine lifetime on SQLite fixtures: sessions on the same target
+share one engine, it keeps serving the remaining sessions while others
+disconnect, and it is disposed exactly once — after the LAST release.
+Concurrent connects to one target still end up on a single engine.
+"""
+
+import shutil
+import sqlite3
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from sqlalchemy import event, text
+
+from backend.core.db import db_manager
+from backend.core.db.db_manager import connect_db, db_pool_stats, disconnect_db, get_db_engine
+
+SESSIONS = [f"shared_engine_test_{i}" for i in range(8)]
+
+
+def track_disposal(engine):
+    disposed = []
+    event.listen(engine, "engine_disposed", lambda _: disposed.append(1))
+    return disposed
+
+
+def users(session_id):
+    with get_db_engine(session_id).connect() as conn:
+        return conn.execute(text("SELECT COUNT(*) FROM users")).scalar()
+
+
+with tempfile.TemporaryDirectory() as tmp:
+    db_path = Path(tmp) / "fixture.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)")
+    conn.executemany("INSERT INTO users (name) VALUES (?)", [(f"user_{i}",) for i in range(3)])
+    conn.commit()
+    conn.close()
+
+    # Same file, three spellings → one fingerprint
+    spellings = [
+        f"sqlite:///{db_path}",
+        f"sqlite:///{Path(tmp) / '.' / 'fixture.db'}",
+        f"sqlite:///{Path(tmp) / 'sub' / '..' / 'fixture.db'}",
+    ]
+
+    try:
+        # 1️⃣ Three sessions, one engine
+        for session_id, url in zip(SESSIONS, spellings):
+            connect_db(session_id, url)
+
+        engine = get_db_engine(SESSIONS[0])
+        disposed = track_disposal(engine)
+        assert all(get_db_engine(s) is engine for s in SESSIONS[:3])
+        print(f"🔗 refs={db_pool_stats()['max_refs']} | engines={len(db_manager._ENGINES)}")
+
+        # 2️⃣ Releases before the last keep the engine alive and usable
+        disconnect_db(SESSIONS[0])
+        disconnect_db(SESSIONS[0])  # repeated disconnect must not drop a second ref
+        assert not disposed and users(SESSIONS[1]) == 3
+
+        disconnect_db(SESSIONS[1])
+        assert not disposed and users(SESSIONS[2]) == 3
+        print("✅ engine survives while a session still holds it")
+
+        # 3️⃣ Last release disposes it, once
+        disconnect_db(SESSIONS[2])
+        assert disposed == [1] and not db_manager._ENGINES
+        print("🧹 disposed once, after the last release")
+
+        # 4️⃣ Concurrent connects to one target → one engine, duplicates discarded
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            list(pool.map(lambda s: connect_db(s, spellings[0]), SESSIONS[3:]))
+
+        engines = {id(get_db_engine(s)) for s in SESSIONS[3:]}
+        print(f"🏁 concurrent connects → engines={len(engines)} | refs={db_pool_stats()['max_refs']}")
+        assert len(engines) == 1 and len(db_manager._ENGINES) == 1
+
+        shared = get_db_engine(SESSIONS[3])
+        disposed = track_disposal(shared)
+        for session_id in SESSIONS[3:-1]:
+            disconnect_db(session_id)
+            assert not disposed
+        assert users(SESSIONS[-1]) == 3
+        disconnect_db(SESSIONS[-1])
+        assert disposed == [1]
+
+        print("\n📈 Pool stats:")
+        for key, value in db_pool_stats().items():
+            print(f"   {key}: {value}")
+
+    finally:
+        for session_id in SESSIONS:
+            disconnect_db(session_id)
+            shutil.rmtree(db_manager._get_db_session_dir(session_id), ignore_errors=True)
+
+print("\n✅ Shared engine test completed")
@@ -0,0 +1,77 @@
+# test/test_speculation_manual.py
+
+"""
+Speculative retrieval is scoped per request: two overlapping requests of
+one session keep their own work, a request only claims what it started,
+and release_speculation() cancels whatever was left unclaimed.
+
+Retrieval is replaced by a slow fake (no Qdrant / embeddings needed).
+"""
+
+import asyncio
+import time
+
+from backend.core.agent import speculation
+from backend.core.agent.speculation import (
+    SPECULATIVE_TOP_K,
+    claim_speculative_result,
+    release_speculation,
+    resolve_speculation,
+    speculation_stats,
+    start_speculation,
+)
+
+SESSION_ID = "speculation_test_session"
+DOCS = ["handbook.pdf"]
+
+calls = []
+
+
+def fake_retrieve(session_id, query, top_k):
+    calls.append(query)
+    time.sleep(0.2)
+    return [{"text": f"chunk for {query}", "session_id": session_id}]
+
+
+async def main():
+    speculation.retrieve_top_k_chunks = fake_retrieve
+
+    # 1️⃣ Overlapping requests, same session: neither replaces the other
+    start_speculation("req-a", SESSION_ID, "What is the leave policy?", DOCS)
+    start_speculation("req-b", SESSION_ID, "What is the travel policy?", DOCS)
+    assert speculation_stats()["pending"] == 2
+
+    resolve_speculation("req-a", "rag_tool")
+    resolve_speculation("req-b", "rag_tool")
+
+    a = await claim_speculative_result("rag", "req-a", SESSION_ID, "What is the leave policy?", SPECULATIVE_TOP_K)
+    b = await claim_speculative_result("rag", "req-b", SESSION_ID, "What is the travel policy?", SPECULATIVE_TOP_K)
+    print(f"\n🏎️ req-a → {a[0]['text']!r}\n🏎️ req-b → {b[0]['text']!r}")
+    assert a[0]["text"].endswith("leave policy?") and b[0]["text"].endswith("travel policy?")
+
+    # 2️⃣ Another request (or none) cannot claim it
+    start_speculation("req-c", SESSION_ID, "What is the leave policy?", DOCS)
+    assert await claim_speculative_result("rag", "req-d", SESSION_ID, "What is the leave policy?", SPECULATIVE_TOP_K) is None
+    assert await claim_speculative_result("rag", None, SESSION_ID, "What is the leave policy?", SPECULATIVE_TOP_K) is None
+    assert speculation_stats()["pending"] == 1
+    print("✅ unrelated request claims nothing")
+
+    # 3️⃣ Request ends without claiming → task cancelled, entry gone
+    task = speculation._PENDING[("rag", "req-c")][-1]
+    release_speculation("req-c")
+    await asyncio.sleep(0)
+    assert task.cancelled() and speculation_stats()["pending"] == 0
+    print("🧹 unclaimed speculation cancelled on release")
+
+    # Releasing twice (or a request that never speculated) is a no-op
+    release_speculation("req-c")
+    release_speculation("req-never")
+
+    stats = speculation_stats()
+    print(f"\n📈 Stats: {stats}")
+    assert stats["used"] == 2 and stats["wasted"] == 1
+
+
+asyncio.run(main())
+
+print("\n✅ Speculation test completed")
@@ -0,0 +1,95 @@
+# test/test_sql_analyzer_manual.py
+
+"""
+Local SQL analysis (sqlglot): table extraction vs the old FROM / JOIN
+regex, read-only enforcement, schema checks, canonical cache keys and
+how fast invalid SQL is rejected without touching a database.
+"""
+
+import re
+import time
+
+from backend.core.db.sql_analyzer import InvalidSQLError, analyze_sql, extract_tables
+from backend.core.db.sql_validator import UnsafeSQLError
+
+SCHEMA = {"tables": {
+    "orders": {"columns": [{"name": n} for n in ("id", "user_id", "amount", "region", "order_date")]},
+    "users": {"columns": [{"name": n} for n in ("id", "name", "created_at")]},
+}}
+
+
+def regex_tables(sql: str):
+    # Previous implementation (db_query_generator._extract_tables_from_sql)
+    return sorted(set(re.findall(r"(?:FROM|JOIN)\s+([a-zA-Z_][a-zA-Z0-9_]*)", sql, re.IGNORECASE)))
+
+
+# 1️⃣ Table extraction
+EXTRACTION = [
+    "WITH top AS (SELECT user_id, SUM(amount) AS s FROM orders GROUP BY user_id) "
+    "SELECT u.name, t.s FROM top t JOIN users u ON u.id = t.user_id",
+    'SELECT "u"."name" FROM "public"."users" AS "u"',
+    "SELECT name FROM users WHERE id IN (SELECT user_id FROM (SELECT * FROM orders) o)",
+    "SELECT EXTRACT(YEAR FROM order_date) AS y FROM orders",
+]
+print("🔍 Table extraction (regex → AST)")
+for sql in EXTRACTION:
+    print(f"   {regex_tables(sql)} → {extract_tables(sql, 'postgresql')}")
+
+assert extract_tables(EXTRACTION[0], "postgresql") == ["orders", "users"]
+assert extract_tables(EXTRACTION[1], "postgresql") == ["public.users"]
+assert extract_tables(EXTRACTION[3], "postgresql") == ["orders"]
+
+# 2️⃣ Safety + schema checks
+REJECTED = [
+    ("WITH d AS (DELETE FROM orders RETURNING id) SELECT id FROM d", UnsafeSQLError),
+    ("SELECT id FROM orders; SELECT id FROM users", UnsafeSQLError),
+    ("PRAGMA table_info(orders)", UnsafeSQLError),
+    ("SELECT id FROM customers", InvalidSQLError),
+    ("SELECT o.total FROM orders o", InvalidSQLError),
+    ("SELECT nmae FROM users", InvalidSQLError),
+    ("SELECT id FROM orders WHERE (amount > 5", InvalidSQLError),
+]
+print("\n🛡️ Rejected before execution")
+for sql, expected in REJECTED:
+    try:
+        analyze_sql(sql, "postgresql", SCHEMA)
+        raise AssertionError(f"should be rejected: {sql}")
+    except (UnsafeSQLError, InvalidSQLError) as e:
+        assert isinstance(e, expected), (sql, e)
+        print(f"   {type(e).__name__:<16} {e}")
+
+ACCEPTED = [
+    "SELECT region, COUNT(*) AS n FROM orders GROUP BY region ORDER BY n DESC",
+    "SELECT x FROM generate_series(1, 3) AS g(x)",
+    "SELECT table_name FROM information_schema.tables",
+]
+for sql in ACCEPTED:
+    analyze_sql(sql, "postgresql", SCHEMA)
+
+# 3️⃣ Canonical cache key
+a = analyze_sql("select region ,count(*)  from orders\n group by region;", "sqlite", SCHEMA)
+b = analyze_sql("SELECT region, COUNT(*) FROM orders GROUP BY region", "sqlite", SCHEMA)
+print(f"\n🔑 Cache key: {a['normalized']}")
+assert a["normalized"] == b["normalized"]
+
+# 4️⃣ Rejection latency (first parse vs repeated SQL)
+bad = "SELECT o.total, u.name FROM orders o JOIN users u ON u.id = o.user_id WHERE o.region = 'north'"
+started = time.perf_counter()
+try:
+    analyze_sql(bad, "postgresql", SCHEMA)
+except InvalidSQLError:
+    pass
+first = (time.perf_counter() - started) * 1e6
+
+runs = 1000
+started = time.perf_counter()
+for _ in range(runs):
+    try:
+        analyze_sql(bad, "postgresql", SCHEMA)
+    except InvalidSQLError:
+        pass
+repeat = (time.perf_counter() - started) * 1e6 / runs
+
+print(f"\n⚡ Rejection latency: first={first:.0f} µs | repeated={repeat:.0f} µs")
+
+print("\n✅ SQL analyzer test completed")
@@ -0,0 +1,127 @@
+# test/test_sql_cache_manual.py
+
+"""
+NL → SQL cache lifecycle on a SQLite fixture (offline fake LLM):
+only SQL that executed is cached, a cached entry whose SQL fails is
+deleted, and semantic neighbours need the same content tokens.
+
+Uses a throwaway cache file, never the app's sql_cache.sqlite3.
+"""
+
+import os
+
+# Must be set BEFORE backend modules are imported
+os.environ["LLM_PROVIDER"] = "fake"
+os.environ.setdefault("FAKE_LLM_LATENCY_MS", "5")
+os.environ["LLM_CACHE_ENABLED"] = "false"
+os.environ["SQL_CACHE_ENABLED"] = "true"
+os.environ["SQL_REPAIR_ENABLED"] = "false"
+os.environ.setdefault("RESULT_CACHE_ENABLED", "false")
+
+import asyncio
+import sqlite3
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from backend.core.db import db_executor, db_manager, db_query_generator
+from backend.core.db.db_manager import aclear_all_db_connections, connect_db, disconnect_db
+from backend.core.db.db_executor import run_db_execution
+from backend.core.db.schema_cache import get_cached_schema
+from backend.core.db.schema_renderer import schema_version
+from backend.core.db.sql_cache import NLSQLCache
+from backend.core.rag.resource_store import resource_store
+
+SESSION_ID = "sql_cache_test_session"
+
+
+class _SameVectorModel:
+    """Every question embeds to the same vector: only the token check can tell them apart."""
+
+    def encode(self, text, normalize_embeddings=True):
+        return np.ones(8, dtype=np.float32) / np.sqrt(8)
+
+
+async def main(url: str, cache: NLSQLCache):
+    connect_db(SESSION_ID, url)
+    fingerprint = schema_version(get_cached_schema(SESSION_ID))
+
+    # 1️⃣ Fresh SQL that runs → cached
+    payload = await run_db_execution(SESSION_ID, "How many users are there?")
+    assert "error" not in payload
+    assert cache.stats()["writes"] == 1
+    print(f"\n✅ executed + cached: {payload['sql']}")
+
+    # 2️⃣ Same question → exact hit, no rewrite
+    payload = await run_db_execution(SESSION_ID, "how many users are there")
+    assert cache.stats()["exact_hits"] == 1 and cache.stats()["writes"] == 1
+    print("✅ exact hit reused, not rewritten")
+
+    # 3️⃣ Cached SQL that fails → deleted, not served again
+    question = "Which users are from Mars?"
+    cache.set(fingerprint, "sqlite", question, {
+        "sql": "SELECT name FROM users WHERE planet = 'Mars'",
+        "db_type": "sqlite", "tables_used": ["users"], "confidence": "high",
+    })
+    payload = await run_db_execution(SESSION_ID, question)
+    print(f"🗑️ failing cached SQL → {payload['error']['type']} | invalidated={cache.stats()['invalidated']}")
+    assert payload["error"]["type"] == "invalid_sql"
+    assert cache.stats()["invalidated"] == 1
+    assert cache.get(fingerprint, "sqlite", question) is None
+
+    # 4️⃣ Fresh SQL that fails → never cached
+    async def broken_generate(session_id, user_question, schema):
+        return {"sql": "SELECT nope FROM users", "db_type": "sqlite", "tables_used": [], "confidence": "high"}
+
+    original = db_executor.agenerate_sql_query
+    db_executor.agenerate_sql_query = broken_generate
+    writes = cache.stats()["writes"]
+    payload = await run_db_execution(SESSION_ID, "Broken question")
+    db_executor.agenerate_sql_query = original
+    assert "error" in payload and cache.stats()["writes"] == writes
+    print("✅ failed fresh SQL not cached")
+
+    # 5️⃣ Semantic neighbours: identical embeddings, different content tokens
+    resource_store.embedding_model = _SameVectorModel()
+    cache.set(fingerprint, "sqlite", "orders shipped in March", {
+        "sql": "SELECT 1", "db_type": "sqlite", "tables_used": [], "confidence": "high",
+    })
+    for other, expected in [
+        ("orders cancelled in March", False),
+        ("top 5 orders shipped in March", False),
+        ("Show me the orders shipped in March?", True),
+    ]:
+        hit = cache.get(fingerprint, "sqlite", other) is not None
+        print(f"   {'💾 hit ' if hit else '❌ miss'} | {other}")
+        assert hit == expected, other
+    resource_store.embedding_model = None
+
+    disconnect_db(SESSION_ID)
+    await aclear_all_db_connections()
+
+
+with tempfile.TemporaryDirectory() as tmp:
+    db_path = Path(tmp) / "fixture.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, country TEXT)")
+    conn.executemany("INSERT INTO users (name, country) VALUES (?, ?)", [(f"user_{i}", "India") for i in range(5)])
+    conn.commit()
+    conn.close()
+
+    cache = NLSQLCache(Path(tmp) / "sql_cache.sqlite3", ttl_seconds=3600, max_entries=100, similarity_threshold=0.95)
+    db_executor.sql_cache = cache
+    db_query_generator.sql_cache = cache
+
+    try:
+        asyncio.run(main(f"sqlite:///{db_path}", cache))
+    finally:
+        config_dir = db_manager._get_db_session_dir(SESSION_ID)
+        for file in config_dir.glob("*"):
+            file.unlink()
+        if config_dir.exists():
+            config_dir.rmdir()
+
+    print(f"\n📈 Stats: {cache.stats()}")
+
+print("\n✅ SQL cache test completed")
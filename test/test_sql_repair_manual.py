@@ -0,0 +1,145 @@
+# test/test_sql_repair_manual.py
+
+"""
+Failed SQL recovery on a SQLite fixture (offline fake LLM).
+
+SQL generation is replaced by canned broken queries; each case shows
+which repair stage fixed it (transpile → schema → one LLM call) and
+how long each attempt took.
+"""
+
+import os
+
+# Must be set BEFORE backend modules are imported
+os.environ["LLM_PROVIDER"] = "fake"
+os.environ.setdefault("FAKE_LLM_LATENCY_MS", "50")
+os.environ.setdefault("LLM_CACHE_ENABLED", "false")
+os.environ.setdefault("SQL_CACHE_ENABLED", "false")
+os.environ.setdefault("RESULT_CACHE_ENABLED", "false")
+
+import asyncio
+import sqlite3
+import tempfile
+from pathlib import Path
+
+from backend.core.db import db_executor, db_manager
+from backend.core.db.db_manager import aclear_all_db_connections, connect_db, disconnect_db
+from backend.core.db.db_executor import run_db_execution
+from backend.core.db.sql_repair import schema_repair, sql_repair_stats
+
+SESSION_ID = "sql_repair_test_session"
+
+CASES = [
+    # (label, broken SQL, stage expected to fix it; None → ran as generated)
+    ("valid", "SELECT name FROM users WHERE country = 'India'", None),
+    ("postgres ILIKE", "SELECT name FROM users WHERE name ILIKE 'USER_1%'", "transpile"),
+    ("ambiguous join key",
+     "SELECT user_id, city, amount FROM orders JOIN addresses ON addresses.user_id = orders.user_id", "schema"),
+    # id / country exist in both tables but are not the join key: no guessing
+    ("ambiguous non-key", "SELECT id, product FROM orders JOIN users ON users.id = orders.user_id", "llm"),
+    ("ambiguous non-key 2", "SELECT name, country FROM users JOIN addresses ON addresses.user_id = users.id", "llm"),
+    ("column typo", "SELECT nmae, country FROM users", "schema"),
+    ("unknown function", "SELECT MEDIAN(amount) AS median_amount FROM orders", "llm"),
+]
+
+
+def _create_fixture_db(path: Path) -> None:
+    conn = sqlite3.connect(path)
+    conn.executescript(
+        """
+        CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, country TEXT);
+        CREATE TABLE orders (id INTEGER PRIMARY KEY, user_id INTEGER REFERENCES users(id),
+                             product TEXT, amount REAL);
+        CREATE TABLE addresses (user_id INTEGER PRIMARY KEY REFERENCES users(id),
+                                city TEXT, country TEXT);
+        """
+    )
+    conn.executemany(
+        "INSERT INTO users (name, country) VALUES (?, ?)",
+        [(f"user_{i}", "India" if i % 2 else "USA") for i in range(20)],
+    )
+    conn.executemany(
+        "INSERT INTO orders (user_id, product, amount) VALUES (?, ?, ?)",
+        [(i % 20 + 1, f"product_{i % 3}", i * 1.5) for i in range(50)],
+    )
+    conn.executemany(
+        "INSERT INTO addresses (user_id, city, country) VALUES (?, ?, ?)",
+        [(i, f"city_{i % 4}", "India" if i % 2 else "USA") for i in range(1, 21)],
+    )
+    conn.commit()
+    conn.close()
+
+
+def check_ambiguous_join_keys():
+    schema = {"tables": {
+        "users": {"columns": [{"name": "id"}, {"name": "name"}, {"name": "country"}]},
+        "orders": {"columns": [{"name": "id"}, {"name": "user_id"}, {"name": "amount"}]},
+        "addresses": {"columns": [{"name": "user_id"}, {"name": "city"}, {"name": "country"}]},
+    }}
+    error = "ambiguous column name: user_id"
+
+    fixed = schema_repair(
+        "SELECT user_id FROM orders o JOIN addresses a ON (a.user_id = o.user_id AND a.city <> '')",
+        "sqlite", schema, error,
+    )
+    print(f"\n🔑 join key → {fixed}")
+    assert fixed is not None and "o.user_id" in fixed
+
+    for sql in [
+        # Not equated in the join (or not at all)
+        "SELECT country FROM users JOIN addresses ON addresses.user_id = users.id",
+        "SELECT user_id FROM orders, addresses",
+        # RIGHT join: the FROM side may be NULL where the other is not
+        "SELECT user_id FROM orders RIGHT JOIN addresses ON addresses.user_id = orders.user_id",
+        # OR: not an equi-join
+        "SELECT user_id FROM orders JOIN addresses ON addresses.user_id = orders.user_id OR addresses.city = ''",
+    ]:
+        assert schema_repair(sql, "sqlite", schema, error) is None, sql
+    print("🚫 non-key ambiguous columns left to the LLM stage")
+
+
+async def main(url: str):
+    check_ambiguous_join_keys()
+    connect_db(SESSION_ID, url)
+
+    for label, broken_sql, expected in CASES:
+        async def fake_generate(session_id, user_question, schema, sql=broken_sql):
+            return {"sql": sql, "db_type": "sqlite", "tables_used": [], "confidence": "high"}
+
+        db_executor.agenerate_sql_query = fake_generate
+        payload = await run_db_execution(SESSION_ID, label)
+
+        repairs = payload.get("repairs", [])
+        fixed_by = next((r["stage"] for r in repairs if r["ok"]), None)
+        print(f"\n🧪 {label}: {broken_sql}")
+        for r in repairs:
+            print(
+                f"   {r['stage']:<9} ok={r['ok']!s:<5} propose={r['propose_ms']:6.1f} ms "
+                f"execute={r['execute_ms']:6.1f} ms | {r['sql']}"
+            )
+        print(f"   → rows={payload['row_count']} error={payload.get('error')}")
+
+        assert "error" not in payload, payload.get("error")
+        assert fixed_by == expected, (label, fixed_by, expected)
+
+    disconnect_db(SESSION_ID)
+    await aclear_all_db_connections()
+
+
+with tempfile.TemporaryDirectory() as tmp:
+    db_path = Path(tmp) / "fixture.db"
+    _create_fixture_db(db_path)
+    try:
+        asyncio.run(main(f"sqlite:///{db_path}"))
+    finally:
+        config_dir = db_manager._get_db_session_dir(SESSION_ID)
+        for file in config_dir.glob("*"):
+            file.unlink()
+        if config_dir.exists():
+            config_dir.rmdir()
+
+print("\n📈 Repair stats:")
+for stage, stats in sql_repair_stats().items():
+    print(f"   {stage}: {stats}")
+
+print("\n✅ SQL repair test completed")
@@ -0,0 +1,168 @@
+# test/test_sql_sandbox_manual.py
+
+"""
+Process sandbox on a SQLite fixture: normal queries and query errors
+round-trip through a worker, a CPU hog and a memory hog kill their worker
+(replaced on next use), a cancelled query kills its worker, and the event
+loop keeps ticking throughout. The API process's memory stays flat.
+
+Linux / macOS only (rlimits + forkserver).
+"""
+
+import os
+
+# Must be set BEFORE backend modules are imported
+os.environ["SQL_SANDBOX_ENABLED"] = "true"
+os.environ.setdefault("SQL_SANDBOX_WORKERS", "2")
+os.environ.setdefault("SQL_SANDBOX_CPU_SECONDS", "2")
+os.environ.setdefault("SQL_SANDBOX_MEMORY_MB", "256")
+os.environ.setdefault("SQL_STATEMENT_TIMEOUT_SECONDS", "60")
+os.environ["LLM_PROVIDER"] = "fake"
+os.environ.setdefault("SQL_CACHE_ENABLED", "false")
+os.environ.setdefault("RESULT_CACHE_ENABLED", "false")
+
+import asyncio
+import resource
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy.exc import DBAPIError
+
+from backend.core.db import db_executor, db_manager
+from backend.core.db.db_manager import aclear_all_db_connections, connect_db, disconnect_db, get_db_engine
+from backend.core.db.db_executor import execute_sql_nonblocking, run_db_execution
+from backend.core.db.sql_sandbox import SandboxLimitError, sandbox_stats, shutdown_sandbox, start_sandbox
+
+SESSION_ID = "sql_sandbox_test_session"
+
+CPU_HOG = """
+WITH RECURSIVE n(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM n WHERE x < 5000000000)
+SELECT COUNT(*) AS c FROM n
+"""
+
+# ~600 MB string, well past the 256 MB budget
+MEMORY_HOG = """
+WITH RECURSIVE n(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM n WHERE x < 600)
+SELECT length(group_concat(randomblob(1000000))) AS size FROM n
+"""
+
+
+def _max_rss_mb() -> float:
+    # ru_maxrss: KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def _ticker(lags: list, stop: asyncio.Event) -> None:
+    """Largest event-loop delay past a 10 ms sleep."""
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(0.01)
+        lags.append(time.perf_counter() - started - 0.01)
+
+
+async def _expect_limit(engine, sql: str, limit: str) -> None:
+    started = time.perf_counter()
+    try:
+        await execute_sql_nonblocking(SESSION_ID, engine, sql, "sqlite")
+        raise AssertionError(f"{limit} limit not enforced")
+    except SandboxLimitError as e:
+        assert e.limit == limit, (e.limit, limit)
+        print(f"   🧱 {e} | after {(time.perf_counter() - started) * 1000:.0f} ms")
+
+
+async def main(url: str):
+    started = time.perf_counter()
+    await asyncio.to_thread(start_sandbox)
+    print(f"\n🚀 Sandbox started in {(time.perf_counter() - started) * 1000:.0f} ms")
+
+    db_manager.DB_ASYNC_EXECUTION = False
+    connect_db(SESSION_ID, url)
+    engine = get_db_engine(SESSION_ID)
+
+    lags: list = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(_ticker(lags, stop))
+    rss_before = _max_rss_mb()
+
+    # 1️⃣ Normal query + query error cross the pipe intact
+    started = time.perf_counter()
+    result = await execute_sql_nonblocking(SESSION_ID, engine, "SELECT name FROM users LIMIT 3", "sqlite")
+    print(f"\n✅ rows={result['rows']} | {(time.perf_counter() - started) * 1000:.1f} ms")
+    assert result["row_count"] == 3
+
+    try:
+        await execute_sql_nonblocking(SESSION_ID, engine, "SELECT nmae FROM users", "sqlite")
+        raise AssertionError("bad column accepted")
+    except DBAPIError as e:
+        print(f"✅ DB error preserved: {type(e).__name__}: {e.orig}")
+
+    # 2️⃣ Resource overruns kill the worker, not the API process
+    print("\n💥 Overruns:")
+    await _expect_limit(engine, CPU_HOG, "cpu")
+    await _expect_limit(engine, MEMORY_HOG, "memory")
+
+    # 3️⃣ Replaced workers serve the next query
+    result = await execute_sql_nonblocking(SESSION_ID, engine, "SELECT COUNT(*) AS c FROM users", "sqlite")
+    assert result["rows"] == [{"c": 20}]
+
+    # 4️⃣ Client disconnect kills the worker running its query
+    task = asyncio.create_task(execute_sql_nonblocking(SESSION_ID, engine, CPU_HOG, "sqlite"))
+    await asyncio.sleep(0.3)
+    started = time.perf_counter()
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+    semaphore = db_executor._TARGET_SEMAPHORES[db_manager.url_fingerprint(engine.url)]
+    while semaphore._value < db_executor.DB_MAX_CONCURRENT_QUERIES_PER_TARGET:
+        assert time.perf_counter() - started < 2, "cancelled query is still running"
+        await asyncio.sleep(0.01)
+    print(f"   🛑 cancelled query's worker killed within {(time.perf_counter() - started) * 1000:.0f} ms")
+
+    # 5️⃣ Tool payload for a killed query
+    async def fake_generate(session_id, user_question, schema):
+        return {"sql": CPU_HOG, "db_type": "sqlite", "tables_used": [], "confidence": "high"}
+
+    db_executor.agenerate_sql_query = fake_generate
+    payload = await run_db_execution(SESSION_ID, "count to five billion")
+    print(f"\n🧾 Tool error: {payload['error']}")
+    assert payload["error"]["type"] == "resource_limit" and payload["error"]["limit"] == "cpu"
+
+    stop.set()
+    await ticker
+
+    rss_after = _max_rss_mb()
+    print(f"\n⏱️ Event loop max lag: {max(lags) * 1000:.1f} ms over {len(lags)} ticks")
+    print(f"🧠 API process max RSS: {rss_before:.0f} MB → {rss_after:.0f} MB")
+    assert max(lags) < 0.25
+    assert rss_after - rss_before < 100
+
+    disconnect_db(SESSION_ID)
+    await aclear_all_db_connections()
+    shutdown_sandbox()
+
+
+# Workers fork from a forkserver that re-imports this script: guard the run
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "fixture.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)")
+        conn.executemany("INSERT INTO users (name) VALUES (?)", [(f"user_{i}",) for i in range(20)])
+        conn.commit()
+        conn.close()
+        try:
+            asyncio.run(main(f"sqlite:///{db_path}"))
+        finally:
+            config_dir = db_manager._get_db_session_dir(SESSION_ID)
+            for file in config_dir.glob("*"):
+                file.unlink()
+            if config_dir.exists():
+                config_dir.rmdir()
+
+    print(f"\n📈 Stats: {sandbox_stats()}")
+    print("\n✅ SQL sandbox test completed")
@@ -0,0 +1,143 @@
+# test/test_statement_timeout_manual.py
+
+"""
+Execution deadline + cancellation on a SQLite fixture (progress handler /
+interrupt), on both the thread-pool path and the aiosqlite path.
+Postgres / MySQL use the same flow with statement_timeout / MAX_EXECUTION_TIME
+and pg_cancel_backend / KILL QUERY (see db_types).
+"""
+
+import asyncio
+import shutil
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+from sqlalchemy.exc import DBAPIError
+
+from backend.core.db import db_executor, db_manager
+from backend.core.db.db_manager import aclear_all_db_connections, connect_db, disconnect_db, get_db_engine
+from backend.core.db.db_executor import (
+    QueryTimeoutError,
+    _QueryHandle,
+    _begin_statement,
+    _cancel_query,
+    _execute_sql,
+    _run_with_deadline,
+    execute_sql_nonblocking,
+)
+
+SESSION_ID = "statement_timeout_test_session"
+
+SLOW_SQL = """
+WITH RECURSIVE n(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM n WHERE x < 50000000)
+SELECT COUNT(*) AS c FROM n
+"""
+
+
+async def run_checks(label: str):
+    engine = get_db_engine(SESSION_ID)
+
+    # 1️⃣ Deadline → QueryTimeoutError
+    started = time.perf_counter()
+    try:
+        if label == "sync":
+            _execute_sql(engine, SLOW_SQL, "sqlite", timeout_seconds=0.3)
+        else:
+            async_engine = db_manager.get_async_db_engine(SESSION_ID)
+            await db_executor._aexecute_sql(async_engine, SLOW_SQL, "sqlite", timeout_seconds=0.3)
+        raise AssertionError("deadline not enforced")
+    except QueryTimeoutError as e:
+        print(f"[{label}] ⏱️ {e} | stopped after {(time.perf_counter() - started) * 1000:.0f} ms")
+
+    # 2️⃣ Connection is clean afterwards (handler removed)
+    result = _execute_sql(engine, "SELECT 1 AS ok", "sqlite", timeout_seconds=0.3)
+    assert result["rows"] == [{"ok": 1}]
+
+    # 3️⃣ Cancellation (client disconnect) interrupts the running query
+    task = asyncio.create_task(execute_sql_nonblocking(SESSION_ID, engine, SLOW_SQL, "sqlite"))
+    await asyncio.sleep(0.3)
+    started = time.perf_counter()
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+    # The query really stopped: its concurrency slot is released quickly
+    semaphore = db_executor._TARGET_SEMAPHORES[db_manager.url_fingerprint(engine.url)]
+    while semaphore._value < db_executor.DB_MAX_CONCURRENT_QUERIES_PER_TARGET:
+        assert time.perf_counter() - started < 2, "cancelled query is still running"
+        await asyncio.sleep(0.01)
+    print(f"[{label}] 🛑 cancelled query stopped within {(time.perf_counter() - started) * 1000:.0f} ms")
+
+    # 4️⃣ A cancel is not reported as a deadline (SQLite says "interrupted" for both)
+    if label == "sync":
+        handle = _QueryHandle()
+        with engine.connect() as conn:
+            running = asyncio.create_task(asyncio.to_thread(
+                _run_with_deadline, conn, SLOW_SQL, "sqlite", 30, handle,
+            ))
+            await asyncio.sleep(0.3)
+            await asyncio.to_thread(_cancel_query, engine, "sqlite", handle)
+            try:
+                await running
+                raise AssertionError("cancelled query completed")
+            except QueryTimeoutError:
+                raise AssertionError("cancel misreported as a deadline")
+            except DBAPIError as e:
+                print(f"[{label}] 🛑 cancel surfaces as {type(e).__name__}, not QueryTimeoutError")
+
+
+class _RecordingConnection:
+    """Stands in for a pooled MySQL connection: records what runs on it."""
+
+    def __init__(self):
+        self.statements = []
+
+    def execute(self, statement):
+        self.statements.append(str(statement))
+        return SimpleNamespace(returns_rows="CONNECTION_ID" in str(statement), fetchone=lambda: (42,))
+
+
+def check_mysql_reset():
+    # 5️⃣ Session-scoped MAX_EXECUTION_TIME is reset before the connection is pooled
+    conn = _RecordingConnection()
+    handle = _QueryHandle()
+    cleanup = _begin_statement(conn, "mysql", 1.5, handle)
+    assert handle.backend_id == 42 and conn.statements[0] == "SET SESSION MAX_EXECUTION_TIME = 1500"
+    cleanup()
+    print(f"[mysql] 🔁 {conn.statements}")
+    assert conn.statements[-1] == "SET SESSION MAX_EXECUTION_TIME = DEFAULT"
+
+
+async def main(url: str):
+    db_manager.DB_ASYNC_EXECUTION = False
+    connect_db(SESSION_ID, url)
+    await run_checks("sync")
+    disconnect_db(SESSION_ID)
+
+    db_manager.DB_ASYNC_EXECUTION = True
+    connect_db(SESSION_ID, url)
+    get_db_engine(SESSION_ID)
+    if db_manager.get_async_db_engine(SESSION_ID) is not None:
+        await run_checks("async")
+    else:
+        print("[async] skipped (aiosqlite / greenlet not installed)")
+    disconnect_db(SESSION_ID)
+    await aclear_all_db_connections()
+
+
+check_mysql_reset()
+
+with tempfile.TemporaryDirectory() as tmp:
+    db_path = Path(tmp) / "fixture.db"
+    sqlite3.connect(db_path).close()
+    try:
+        asyncio.run(main(f"sqlite:///{db_path}"))
+    finally:
+        shutil.rmtree(db_manager._get_db_session_dir(SESSION_ID), ignore_errors=True)
+
+print("\n✅ Statement timeout test completed")